@@ -0,0 +1,253 @@
+import asyncio
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+import requests
+
+from client import SleeperAPI
+from exceptions import SleeperAPIException
+from league_directory import LeagueDirectory
+from model_views import TransactionView
+from models import League, Matchup, PlayerProjection, PlayerStats, Roster, SleeperProjections, Team
+
+
+class AsyncSleeperAPI:
+    """
+    asyncio twin of SleeperAPI.
+
+    Wraps a SleeperAPI instance and shares its caches, cache files and model parsing; only
+    the network calls differ. Requests run on worker threads through the client's pooled
+    transport, at most max_concurrency at a time, so range helpers such as
+    get_matchups_range take about as long as the slowest single request.
+
+    Usage:
+        async def main():
+            async with AsyncSleeperAPI() as api:
+                return await api.get_matchups_range(league_id, range(1, 19))
+
+        season = asyncio.run(main())
+    """
+
+    def __init__(self, client: Optional[SleeperAPI] = None, max_concurrency: Optional[int] = None):
+        """
+        Args:
+            client (SleeperAPI): Client whose caches and transport are shared; a new one is created if omitted
+            max_concurrency (int): Maximum number of requests in flight. Defaults to the
+                transport's pool size so that every concurrent request gets a kept-alive connection
+        """
+        self._owns_client = client is None
+        self.client = client or SleeperAPI()
+        self.max_concurrency = max_concurrency or getattr(self.client.transport, 'pool_maxsize', 8)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    @property
+    def BASE_URL(self) -> str:
+        return self.client.BASE_URL
+
+    def _limit(self) -> asyncio.Semaphore:
+        # A semaphore belongs to one event loop; make a fresh one for each asyncio.run()
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _get(self, url: str):
+        async with self._limit():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self.client.transport.get, url)
+
+    def close(self):
+        """Stop the worker threads, and close the client too if this instance created it."""
+        self._executor.shutdown(wait=False)
+        if self._owns_client:
+            self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def _get_json(self, url: str) -> Any:
+        response = await self._get(url)
+        response.raise_for_status()
+        return response.json()
+
+    async def _make_request(self, endpoint: str, family: str = 'api') -> Any:
+        cached_response = self.client._get_cached_response(endpoint, family)
+        if cached_response is not None:
+            return cached_response
+        cache_key = endpoint
+
+        response = await self._get(endpoint)
+        if response.status_code == 200:
+            data = response.json()
+            self.client.cache[cache_key] = data
+            return data
+        else:
+            raise SleeperAPIException(f"API request failed: {response.status_code} - {response.text}")
+
+    async def get_league(self, league_id: str, fetch_all: bool = False) -> League:
+        cache_key = f"league_{league_id}"
+        league_data = self.client._get_cached_league_data(league_id)
+        if league_data is None:
+            league_data = await self._get_json(f"{self.BASE_URL}/league/{league_id}")
+            self.client.cache[cache_key] = league_data
+
+        league = self.client._build_league(league_id, league_data)
+
+        if fetch_all:
+            # Shallow copies, as in SleeperAPI.get_league
+            league.teams = [copy.copy(team) for team in (await self.get_league_directory(league_id)).teams]
+
+        return league
+
+    async def get_league_users(self, league_id: str) -> List[Team]:
+        response = await self._make_request(f"{self.BASE_URL}/league/{league_id}/users", 'users')
+        return self.client._teams_from_response(response)
+
+    async def get_league_rosters(self, league_id: str) -> List[Roster]:
+        response = await self._make_request(f"{self.BASE_URL}/league/{league_id}/rosters", 'rosters')
+        return self.client._rosters_from_response(response)
+
+    async def get_league_directory(self, league_id: str) -> LeagueDirectory:
+        users, rosters = await asyncio.gather(
+            self._make_request(f"{self.BASE_URL}/league/{league_id}/users", 'users'),
+            self._make_request(f"{self.BASE_URL}/league/{league_id}/rosters", 'rosters')
+        )
+        return self.client._league_directory(league_id, users, rosters)
+
+    async def get_matchups(self, league_id: str, week: int, current_week: Optional[int] = None) -> List[Matchup]:
+        cached_matchups = self.client._get_cached_matchups(league_id, week, current_week)
+        if cached_matchups is not None:
+            return cached_matchups
+
+        data = await self._get_json(f"{self.BASE_URL}/league/{league_id}/matchups/{week}")
+        matchups = self.client._matchups_from_response(data)
+        self.client.matchups_cache[f"{league_id}_{week}"] = matchups
+        return matchups
+
+    async def get_matchups_range(self, league_id: str, weeks: Iterable[int],
+                                 current_week: Optional[int] = None) -> Dict[int, List[Matchup]]:
+        """
+        Fetch the matchups for several weeks concurrently.
+
+        Args:
+            league_id (str): The league ID
+            weeks (Iterable[int]): Week numbers to fetch
+            current_week (int): Current week, used to decide whether cached past weeks are stale
+
+        Returns:
+            Dict[int, List[Matchup]]: Matchups keyed by week, in the order the weeks were given
+        """
+        weeks = list(weeks)
+        with self.client.cache_store.batch():
+            results = await asyncio.gather(
+                *(self.get_matchups(league_id, week, current_week) for week in weeks)
+            )
+        return dict(zip(weeks, results))
+
+    async def get_all_matchups(self, league_id: str, current_week: int) -> Dict[int, List[Matchup]]:
+        return await self.get_matchups_range(league_id, range(1, current_week + 1), current_week)
+
+    async def get_league_transactions(self, league_id: str, week: int) -> List[Dict[str, Any]]:
+        try:
+            data = await self._get_json(f"{self.BASE_URL}/league/{league_id}/transactions/{week}")
+        except requests.RequestException as e:
+            raise SleeperAPIException(f"Error fetching league transactions: {str(e)}")
+        if self.client.views:
+            return [TransactionView(transaction) for transaction in data]
+        return data
+
+    async def get_league_transactions_range(self, league_id: str, weeks: Iterable[int]) -> Dict[int, List[Dict[str, Any]]]:
+        weeks = list(weeks)
+        results = await asyncio.gather(*(self.get_league_transactions(league_id, week) for week in weeks))
+        return dict(zip(weeks, results))
+
+    async def get_traded_picks(self, league_id: str, league_status: Optional[str] = None) -> List[Dict[str, Any]]:
+        cache_key = f"traded_picks_{league_id}"
+        if cache_key in self.client.cache and self.client._is_fresh('traded_picks', self.client.cache, cache_key,
+                                                                      league_status=league_status):
+            return self.client.cache[cache_key]
+        try:
+            traded_picks = await self._get_json(f"{self.BASE_URL}/league/{league_id}/traded_picks")
+        except requests.RequestException as e:
+            raise SleeperAPIException(f"Error fetching traded picks: {str(e)}")
+        self.client.cache[cache_key] = traded_picks
+        return traded_picks
+
+    async def get_all_traded_picks(self, league_id: str) -> List[Dict[str, Any]]:
+        # Each hop needs the previous season's league to find the next one, so the chain itself
+        # is walked in order (finished seasons come from the cache); the picks are then fetched together.
+        chain = []
+        current_league_id = league_id
+        while current_league_id:
+            league = await self.get_league(current_league_id)
+            chain.append(league)
+            current_league_id = league.previous_league_id
+
+        with self.client.cache_store.batch():
+            seasons = await asyncio.gather(*(self.get_traded_picks(league.league_id, league.status) for league in chain))
+        return [pick for traded_picks in seasons for pick in traded_picks]
+
+    async def get_stats(self, year: int, week: int, position: str, league_id: str) -> Dict[str, PlayerStats]:
+        raw_stats = await self.get_raw_stats(year, week, position)
+        return self.client._score_cached(f"{year}_{week}_{position}", raw_stats,
+                                         self.client.scoring_settings.get(league_id, {}))
+
+    async def get_raw_stats(self, year: int, week: int, position: str) -> Dict[str, Dict[str, float]]:
+        cached_stats = self.client._get_cached_raw_stats(year, week, position)
+        if cached_stats is not None:
+            return cached_stats
+
+        data = await self._get_json(self.client._stats_url(year, week, position))
+        raw_stats = self.client._parse_raw_stats(data)
+        self.client.raw_stats_cache[f"{year}_{week}_{position}"] = raw_stats
+        return raw_stats
+
+    async def get_stats_range(self, year: int, weeks: Iterable[int], positions: Iterable[str],
+                              league_id: str) -> Dict[int, Dict[str, Dict[str, PlayerStats]]]:
+        """
+        Fetch stats for every (week, position) pair concurrently.
+
+        Returns:
+            Dict[int, Dict[str, Dict[str, PlayerStats]]]: Stats keyed by week, then position, then player ID
+        """
+        pairs = [(week, position) for week in weeks for position in positions]
+        with self.client.cache_store.batch():
+            results = await asyncio.gather(
+                *(self.get_stats(year, week, position, league_id) for week, position in pairs)
+            )
+
+        stats_by_week = {}
+        for (week, position), stats in zip(pairs, results):
+            stats_by_week.setdefault(week, {})[position] = stats
+        return stats_by_week
+
+    async def get_projections(self, year: int, week: int, position: str) -> List[PlayerProjection]:
+        cache_key = f"{year}_{week}_{position}"
+        cached_projections = self.client._get_cached_projections(year, week, position)
+        if cached_projections is not None:
+            return cached_projections
+
+        data = await self._get_json(SleeperProjections.projections_url(year, week, position))
+        projections = SleeperProjections.parse_projections(data)
+        self.client.projections_cache[cache_key] = projections
+        return projections
+
+    async def get_projections_range(self, year: int, weeks: Iterable[int],
+                                    positions: Iterable[str]) -> Dict[int, Dict[str, List[PlayerProjection]]]:
+        pairs = [(week, position) for week in weeks for position in positions]
+        with self.client.cache_store.batch():
+            results = await asyncio.gather(
+                *(self.get_projections(year, week, position) for week, position in pairs)
+            )
+
+        projections_by_week = {}
+        for (week, position), projections in zip(pairs, results):
+            projections_by_week.setdefault(week, {})[position] = projections
+        return projections_by_week
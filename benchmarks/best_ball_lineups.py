@@ -0,0 +1,98 @@
+"""
+Best-ball lineup throughput: the previous greedy fill (slots, then FLEX, SUPER_FLEX and
+IDP_FLEX, with its debug output removed) against LineupOptimizer, over every roster and
+week of the cached matchups. Also counts the lineups where the exact optimizer beats
+the greedy fill.
+
+Positions are looked up through SleeperAPI.get_player_position, as the analytics do.
+Run from the repository root, or pass the directory holding players.json and the
+caches:
+
+    python -m benchmarks.best_ball_lineups [data directory]
+"""
+import os
+import sys
+import time
+
+from best_ball import LineupOptimizer, optimize_season
+from benchmarks.cache_files import load_cache_file
+from client import SleeperAPI
+from model_views import MatchupView
+
+VALID_POSITIONS = ["QB", "RB", "WR", "TE", "K", "DB", "LB", "DE", "DL", "DT", "CB", "S"]
+DEFENSIVE_POSITIONS = ["DB", "LB", "DE", "DL", "DT", "CB", "S"]
+LEAGUE_ID = "1048308938824937472"
+REPEAT = 20
+
+
+def greedy_best_ball(players_points, roster_positions, position_of):
+    position_players = {pos: [] for pos in VALID_POSITIONS + ["FLEX", "SUPER_FLEX", "IDP_FLEX"]}
+    for player_id, points in players_points.items():
+        position = position_of(player_id)
+        if position in VALID_POSITIONS:
+            position_players[position].append({"id": player_id, "points": points, "position": position})
+    for pos in position_players:
+        position_players[pos].sort(key=lambda x: x["points"], reverse=True)
+
+    best_lineup = []
+    total_points = 0
+    for pos in roster_positions:
+        if pos in VALID_POSITIONS and position_players[pos]:
+            player = position_players[pos].pop(0)
+            best_lineup.append({"position": pos, "player": player})
+            total_points += player["points"]
+    for slot, eligible in [("FLEX", ["RB", "WR", "TE"]), ("SUPER_FLEX", ["QB", "RB", "WR", "TE"]),
+                           ("IDP_FLEX", DEFENSIVE_POSITIONS)]:
+        for pos in roster_positions:
+            if pos == slot:
+                options = [player for p in eligible for player in position_players[p]]
+                if options:
+                    best = max(options, key=lambda x: x["points"])
+                    best_lineup.append({"position": slot, "player": best})
+                    total_points += best["points"]
+                    position_players[best["position"]].remove(best)
+    return total_points, best_lineup
+
+
+def main():
+    if len(sys.argv) > 1:
+        os.chdir(sys.argv[1])
+    raw_matchups = load_cache_file(".", "matchups_cache.json")
+    roster_positions = load_cache_file(".", "api_cache.json")[f"league_{LEAGUE_ID}"]["roster_positions"]
+
+    client = SleeperAPI()
+    position_of = client.get_player_position
+    client.players  # load the table up front so it is not timed
+    lineups = [m["players_points"] for key, week in raw_matchups.items() if key.startswith(LEAGUE_ID) for m in week]
+    print(f"{len(lineups)} lineups, roster_positions {roster_positions}")
+
+    optimizer = LineupOptimizer(roster_positions, VALID_POSITIONS)
+    improved = 0
+    for players_points in lineups:
+        greedy_points, _ = greedy_best_ball(players_points, roster_positions, position_of)
+        exact_points, _ = optimizer.optimize(players_points, position_of)
+        assert exact_points >= greedy_points - 1e-9
+        improved += exact_points > greedy_points + 1e-9
+    print(f"Optimizer beat the greedy fill in {improved} of {len(lineups)} lineups")
+
+    print("Path|Lineups per second")
+    for label, score in [
+        ("greedy fill", lambda pp: greedy_best_ball(pp, roster_positions, position_of)),
+        ("LineupOptimizer.optimize", lambda pp: optimizer.optimize(pp, position_of)),
+    ]:
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            for players_points in lineups:
+                score(players_points)
+        print(f"{label}|{REPEAT * len(lineups) / (time.perf_counter() - started):,.0f}")
+
+    season = {int(key.rsplit('_', 1)[1]): [MatchupView(m) for m in week]
+              for key, week in raw_matchups.items() if key.startswith(LEAGUE_ID)}
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        optimize_season(season, optimizer, position_of)
+    print(f"optimize_season (whole season per call)|{REPEAT * len(lineups) / (time.perf_counter() - started):,.0f}")
+
+
+if __name__ == "__main__":
+    main()
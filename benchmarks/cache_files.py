@@ -0,0 +1,25 @@
+"""Loading the cache files the benchmarks read, with a readable error for broken ones."""
+import json
+import os
+import sys
+from typing import Any
+
+
+def load_cache_file(directory: str, filename: str) -> Any:
+    """
+    Parse one JSON cache file, exiting with a message instead of a traceback when it is
+    missing or is not valid JSON (for example a copy with unresolved merge-conflict
+    markers), since no benchmark figure can come from such a file.
+    """
+    path = os.path.join(directory, filename)
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        sys.exit(f"{path} not found; pass the directory holding the cache files")
+    except json.JSONDecodeError as e:
+        with open(path, 'r') as f:
+            conflicted = f.readline().startswith("<<<<<<<")
+        reason = "it contains unresolved merge-conflict markers" if conflicted else f"it is not valid JSON ({e})"
+        sys.exit(f"Cannot read {path}: {reason}. Pass a directory with a clean copy, such as one "
+                 f"written by SleeperAPI.")
@@ -0,0 +1,108 @@
+"""
+Decoding the transactions file and the cached league payload into models: dataclass
+constructors with the per-instance __post_init__ field scan against the generated from_dict
+decoders.
+
+Run from the repository root (the data files are read from the working directory):
+
+    python -m benchmarks.model_decoding
+"""
+import json
+import time
+from dataclasses import dataclass
+
+from models import DraftPick, League, LeagueMetadata, LeagueSettings, Transaction
+
+LEAGUE_ID = "1048308938824937472"
+REPEAT = 50
+
+
+def _legacy_post_init(base):
+    def __post_init__(self):
+        # Capture any unexpected fields
+        known_fields = set(base.__annotations__.keys()) - {'extra_fields'}
+        self.extra_fields = {k: v for k, v in self.__dict__.items() if k not in known_fields}
+        for k in self.extra_fields:
+            delattr(self, k)
+    return __post_init__
+
+
+@dataclass
+class LegacyLeagueMetadata(LeagueMetadata):
+    __post_init__ = _legacy_post_init(LeagueMetadata)
+
+
+@dataclass
+class LegacyLeagueSettings(LeagueSettings):
+    __post_init__ = _legacy_post_init(LeagueSettings)
+
+
+@dataclass
+class LegacyDraftPick(DraftPick):
+    __post_init__ = _legacy_post_init(DraftPick)
+
+
+@dataclass
+class LegacyLeague(League):
+    def __post_init__(self):
+        if isinstance(self.metadata, dict):
+            self.metadata = LegacyLeagueMetadata(**self.metadata)
+        if isinstance(self.settings, dict):
+            self.settings = LegacyLeagueSettings(**self.settings)
+        _legacy_post_init(League)(self)
+
+
+def legacy_transaction(data):
+    draft_picks = [LegacyDraftPick(**pick) for pick in data.get('draft_picks', [])]
+    return Transaction(
+        status=data['status'],
+        type=data['type'],
+        transaction_id=data['transaction_id'],
+        status_updated=data['status_updated'],
+        roster_ids=data['roster_ids'],
+        adds=data.get('adds'),
+        drops=data.get('drops'),
+        draft_picks=draft_picks,
+        waiver_budget=data.get('waiver_budget', []),
+        creator=data.get('creator'),
+        created=data.get('created'),
+        consenter_ids=data.get('consenter_ids', []),
+        metadata=data.get('metadata'),
+        settings=data.get('settings'),
+        leg=data.get('leg')
+    )
+
+
+def best_of(fn, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    started = time.perf_counter()
+    with open(f"league_{LEAGUE_ID}_transactions.json", 'r') as f:
+        transactions = json.load(f)
+    parse_seconds = time.perf_counter() - started
+    with open("api_cache.json", 'r') as f:
+        league_data = json.load(f)[f"league_{LEAGUE_ID}"]
+
+    print(f"json.load of {len(transactions)} transactions: {parse_seconds * 1000:.2f} ms")
+    print("Payload|Path|Milliseconds per decode")
+    for label, payload, legacy, generated in [
+        (f"{len(transactions)} transactions", transactions,
+         lambda: [legacy_transaction(t) for t in transactions],
+         lambda: [Transaction.from_dict(t) for t in transactions]),
+        (f"league x{REPEAT}", league_data,
+         lambda: [LegacyLeague(**league_data) for _ in range(REPEAT)],
+         lambda: [League.from_dict(league_data) for _ in range(REPEAT)]),
+    ]:
+        for path, fn in [("__init__ + __post_init__", legacy), ("generated from_dict", generated)]:
+            print(f"{label}|{path}|{best_of(fn) * 1000:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Resident memory of a season of cached projections and matchups, decoded into the models
+with per-instance __dict__ against the slotted models.
+
+The bundled projections cache holds one week, so it is decoded once per week of an
+18-week season. Run from the repository root, or pass the directory holding the cache
+files:
+
+    python -m benchmarks.model_memory [cache directory]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import MISSING, field, fields, make_dataclass
+
+from benchmarks.cache_files import load_cache_file
+from models import Matchup, PlayerInfo, PlayerProjection, ProjectedStats
+
+SEASON_WEEKS = 18
+
+
+def unslotted(cls):
+    """The same dataclass without slots=True, as the models were before."""
+    spec = []
+    for f in fields(cls):
+        if f.default is not MISSING:
+            spec.append((f.name, f.type, field(default=f.default)))
+        elif f.default_factory is not MISSING:
+            spec.append((f.name, f.type, field(default_factory=f.default_factory)))
+        else:
+            spec.append((f.name, f.type))
+    namespace = {'__post_init__': cls.__post_init__} if hasattr(cls, '__post_init__') else {}
+    return make_dataclass(f"Legacy{cls.__name__}", spec, namespace=namespace)
+
+
+SLOTTED = (Matchup, PlayerInfo, ProjectedStats, PlayerProjection)
+LEGACY = tuple(unslotted(cls) for cls in SLOTTED)
+
+
+def decode(raw_projections, raw_matchups, models):
+    # Mirrors SleeperAPI._decode_projections and _decode_matchups
+    matchup_cls, info_cls, stats_cls, projection_cls = models
+    projections = {}
+    for week in range(1, SEASON_WEEKS + 1):
+        for key, items in raw_projections.items():
+            projections[f"{key}_{week}"] = [
+                projection_cls(player=info_cls(**p['player']), stats=stats_cls(**p['stats']),
+                               week=p['week'], year=p['year'], opponent=p['opponent'])
+                for p in items
+            ]
+    matchups = {key: [matchup_cls(**m) for m in items] for key, items in raw_matchups.items()}
+    return projections, matchups
+
+
+def measure(raw_projections, raw_matchups, models):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    decoded = decode(raw_projections, raw_matchups, models)
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    projection_count = sum(len(items) for items in decoded[0].values())
+    matchup_count = sum(len(items) for items in decoded[1].values())
+    return projection_count, matchup_count, current, elapsed
+
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else "."
+    raw_projections = load_cache_file(directory, "projections_cache.json")
+    raw_matchups = load_cache_file(directory, "matchups_cache.json")
+
+    print("Models|Projections|Matchups|Resident MB|Decode seconds")
+    for label, models in [("dataclass with __dict__", LEGACY), ("dataclass(slots=True)", SLOTTED)]:
+        projection_count, matchup_count, resident, elapsed = measure(raw_projections, raw_matchups, models)
+        print(f"{label}|{projection_count}|{matchup_count}|{resident / 1024 / 1024:.2f}|{elapsed:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Resident memory of the players table: the original dict of plain Player objects against
+the slotted, interned Player.
+
+The shared name memo (name_normalizer.PLAYER_NAMES) is emptied before each run, and the
+legacy layout formats names without it, so no run reuses strings another one built.
+
+Run from the repository root (players.json is read from the working directory):
+
+    python -m benchmarks.player_memory
+"""
+import gc
+import json
+import time
+import tracemalloc
+
+from models import Player
+from name_normalizer import PLAYER_NAMES
+
+
+class LegacyPlayer:
+    """The Player layout before __slots__: a per-instance __dict__ and an eagerly formatted name."""
+
+    def __init__(self, **kwargs):
+        for field in Player.FIELDS:
+            setattr(self, field, kwargs.get(field))
+        self.name = PLAYER_NAMES.normalize_uncached(f"{self.first_name} {self.last_name}")
+
+
+def measure(player_class, filename="players.json", touch_names=False):
+    PLAYER_NAMES.clear_memo()
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    with open(filename, 'r') as f:
+        data = json.load(f)
+    players = {pid: player_class(**player_data) for pid, player_data in data.items()}
+    del data
+    if touch_names:
+        for player in players.values():
+            player.name
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(players), current, elapsed
+
+
+def main():
+    print("Layout|Players|Resident MB|Load seconds")
+    for label, player_class, touch_names in [
+        ("dict of plain Player", LegacyPlayer, False),
+        ("dict of slotted Player", Player, False),
+        ("dict of slotted Player, all names formatted", Player, True),
+    ]:
+        count, resident, elapsed = measure(player_class, touch_names=touch_names)
+        print(f"{label}|{count}|{resident / 1024 / 1024:.2f}|{elapsed:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Fantasy scoring throughput: the per-stat Python loop get_stats used (one stat line and
+one scoring_settings dict at a time) against scoring_engine, for one week and position
+and for a season scored under several profiles at once. The StatMatrix line shows what
+rescoring costs once the matrix exists, as when SleeperAPI scores a cached week for
+another league.
+
+The bundled projections cache stands in for raw stat lines. Its single week is reused
+for each week of an 18-week season. Run from the repository root, or pass the directory
+holding the caches:
+
+    python -m benchmarks.scoring [cache directory]
+"""
+import json
+import os
+import sys
+import time
+
+from scoring_engine import ScoringProfile, StatMatrix, score_matrix, score_weeks
+
+LEAGUE_ID = "1048308938824937472"
+SEASON_WEEKS = 18
+REPEAT = 20
+
+
+def python_points(player_stats, scoring_settings):
+    fantasy_points = 0
+    for stat, value in player_stats.items():
+        if stat in scoring_settings:
+            fantasy_points += value * scoring_settings[stat]
+    return fantasy_points
+
+
+def timed(label, lines, function):
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        function()
+    elapsed = time.perf_counter() - started
+    print(f"{label}|{REPEAT * lines / elapsed:,.0f}")
+
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else "."
+    with open(os.path.join(directory, "projections_cache.json"), 'r') as f:
+        projections = json.load(f)
+    with open(os.path.join(directory, "api_cache.json"), 'r') as f:
+        scoring_settings = json.load(f)[f"league_{LEAGUE_ID}"]["scoring_settings"]
+
+    # The cached projections carry no player IDs, so each line gets a synthetic one
+    week, positions = {}, {}
+    for key, items in projections.items():
+        for index, item in enumerate(items):
+            week[f"{key}_{index}"] = item['stats']
+            positions[f"{key}_{index}"] = item['player']['position']
+    season = {number: week for number in range(1, SEASON_WEEKS + 1)}
+    profiles = {
+        "league": ScoringProfile(scoring_settings),
+        "half_ppr": ScoringProfile(dict(scoring_settings, rec=0.5)),
+        "standard": ScoringProfile(dict(scoring_settings, rec=0.0)),
+        "six_point_pass_td": ScoringProfile(dict(scoring_settings, pass_td=6.0)),
+        "te_premium": ScoringProfile(scoring_settings, position_overrides={"TE": {"rec": 0.5}}),
+    }
+
+    print(f"{len(week)} stat lines per week, {len(scoring_settings)} scoring settings")
+    print("Path|Stat lines scored per second")
+    profile = profiles["league"]
+    timed("one week, Python loop", len(week),
+          lambda: [python_points(line, scoring_settings) for line in week.values()])
+    timed("one week, scoring_engine", len(week),
+          lambda: score_matrix(StatMatrix.from_raw(week, profile.stat_keys), [profile]))
+
+    matrix = StatMatrix.from_weeks(season, position_of=positions.get)
+    timed(f"season x {len(profiles)} profiles, score_matrix on a built StatMatrix",
+          len(week) * SEASON_WEEKS * len(profiles), lambda: score_matrix(matrix, list(profiles.values())))
+
+    lines = len(week) * SEASON_WEEKS * len(profiles)
+    plain = {name: profile.scoring_settings for name, profile in profiles.items() if not profile.position_overrides}
+    timed(f"season x {len(plain)} linear profiles, Python loop", len(week) * SEASON_WEEKS * len(plain),
+          lambda: {name: {n: {pid: python_points(line, settings) for pid, line in lines_.items()}
+                          for n, lines_ in season.items()} for name, settings in plain.items()})
+    timed(f"season x {len(profiles)} profiles, score_weeks", lines,
+          lambda: score_weeks(season, profiles, positions.get))
+
+
+if __name__ == "__main__":
+    main()
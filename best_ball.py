@@ -0,0 +1,193 @@
+import hashlib
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# Flex slots and the player positions they accept; any other slot accepts its own position
+FLEX_SLOTS: Dict[str, Tuple[str, ...]] = {
+    "FLEX": ("RB", "WR", "TE"),
+    "SUPER_FLEX": ("QB", "RB", "WR", "TE"),
+    "REC_FLEX": ("WR", "TE"),
+    "WRRB_FLEX": ("WR", "RB"),
+    "IDP_FLEX": ("DB", "LB", "DE", "DL", "DT", "CB", "S"),
+}
+
+
+class LineupOptimizer:
+    """
+    Exact best-ball lineup for one roster_positions layout.
+
+    The layout is compiled once into slot types with capacities and a slot-eligibility
+    matrix, which is stored as the list of slot types each position may fill, most
+    specific first. A position can never place more players than the slots that accept
+    it, so only that many of its top scorers are considered.
+
+    The sets of players that fit into the slots form a transversal matroid. So taking
+    candidates from the highest score down, and keeping each one if the lineup can
+    still be rearranged to seat it, gives the highest possible total for any layout.
+    That holds with several flex types whose eligibility overlaps. The rearranging step
+    is an augmenting-path search over slot types, which only moves players between
+    slots that accept their position. Like the lineup Sleeper sets, every slot that has
+    an eligible player is filled, even if that player scored negative points.
+    """
+
+    def __init__(self, roster_positions: Sequence[str], positions: Iterable[str]):
+        """
+        Args:
+            roster_positions (Sequence[str]): The league's roster_positions; BN, IR and unknown slots are ignored
+            positions (Iterable[str]): Player positions that may be started
+        """
+        positions = set(positions)
+        self.roster_positions = list(roster_positions)
+        self.slot_types: List[str] = []
+        self.capacity: List[int] = []
+        eligible: List[frozenset] = []
+        for slot in self.roster_positions:
+            accepts = frozenset(FLEX_SLOTS.get(slot, (slot,))) & positions
+            if not accepts:
+                continue
+            if slot in self.slot_types:
+                self.capacity[self.slot_types.index(slot)] += 1
+            else:
+                self.slot_types.append(slot)
+                self.capacity.append(1)
+                eligible.append(accepts)
+        self.total_slots = sum(self.capacity)
+        # Slot type of each startable entry of roster_positions, in order
+        self._slot_order = [self.slot_types.index(slot) for slot in self.roster_positions if slot in self.slot_types]
+
+        # position -> slot type indices it may fill, fixed slots before wider flex slots
+        self.position_slots: Dict[str, List[int]] = {}
+        for t in sorted(range(len(self.slot_types)), key=lambda t: len(eligible[t])):
+            for position in eligible[t]:
+                self.position_slots.setdefault(position, []).append(t)
+        # Top-k per position: more than this many players of one position can never start
+        self.position_limit = {position: sum(self.capacity[t] for t in slots)
+                               for position, slots in self.position_slots.items()}
+
+    def _seat(self, position: str, used: List[int], seated: List[Dict[str, int]]) -> bool:
+        capacity = self.capacity
+        slots = self.position_slots[position]
+        for t in slots:
+            if used[t] < capacity[t]:
+                used[t] += 1
+                seated[t][position] = seated[t].get(position, 0) + 1
+                return True
+
+        # Every slot this position accepts is full: breadth-first search for a chain of
+        # moves that frees one
+        parent: Dict[int, Optional[Tuple[int, str]]] = dict.fromkeys(slots)
+        queue = list(slots)
+        for t in queue:
+            if used[t] < capacity[t]:
+                used[t] += 1
+                # Walk back: each moved position leaves the previous slot type for this one
+                while parent[t] is not None:
+                    previous, moved = parent[t]
+                    seated[t][moved] = seated[t].get(moved, 0) + 1
+                    seated[previous][moved] -= 1
+                    t = previous
+                seated[t][position] = seated[t].get(position, 0) + 1
+                return True
+            for moved, count in seated[t].items():
+                if count:
+                    for other in self.position_slots[moved]:
+                        if other not in parent:
+                            parent[other] = (t, moved)
+                            queue.append(other)
+        return False
+
+    def optimize(self, players_points: Mapping[str, float],
+                 position_of: Callable[[str], str]) -> Tuple[float, List[Dict[str, Any]]]:
+        """
+        Args:
+            players_points (Mapping[str, float]): Points per player ID, as in Matchup.players_points
+            position_of (Callable[[str], str]): Position lookup such as SleeperAPI.get_player_position
+
+        Returns:
+            Tuple[float, List[Dict[str, Any]]]: Total points and the lineup in roster_positions order, each entry
+            {"position": slot, "player": {"id", "points", "position"}}
+        """
+        limits = self.position_limit
+        candidates = sorted(((points, player_id, position_of(player_id)) for player_id, points in players_points.items()),
+                            reverse=True)
+
+        used = [0] * len(self.slot_types)
+        seated: List[Dict[str, int]] = [{} for _ in self.slot_types]
+        chosen: Dict[str, List[Tuple[float, str]]] = {}
+        # Positions that can take no more starters; once a player cannot be seated, no
+        # later (lower scoring) player of the same position can be either
+        closed = set()
+        filled = 0
+        for points, player_id, position in candidates:
+            if position in closed or position not in limits:
+                continue
+            if self._seat(position, used, seated):
+                players = chosen.setdefault(position, [])
+                players.append((points, player_id))
+                filled += 1
+                if filled == self.total_slots:
+                    break
+                if len(players) == limits[position]:
+                    closed.add(position)
+            else:
+                closed.add(position)
+
+        # Hand each position's starters, best first, to its most specific slots
+        by_slot: List[List[Dict[str, Any]]] = [[] for _ in self.slot_types]
+        for position, players in chosen.items():
+            players = iter(players)
+            for t in self.position_slots[position]:
+                for _ in range(seated[t].get(position, 0)):
+                    points, player_id = next(players)
+                    by_slot[t].append({"id": player_id, "points": points, "position": position})
+
+        lineup = []
+        total_points = 0
+        for t in self._slot_order:
+            if by_slot[t]:
+                player = by_slot[t].pop(0)
+                lineup.append({"position": self.slot_types[t], "player": player})
+                total_points += player["points"]
+        return total_points, lineup
+
+
+def optimize_season(matchups_by_week: Mapping[int, Sequence[Any]], optimizer: LineupOptimizer,
+                    position_of: Callable[[str], str]) -> Dict[int, Dict[int, Tuple[float, List[Dict[str, Any]]]]]:
+    """
+    Best-ball lineups for every roster in every week, looking up each player's position
+    once however many weeks they appear in.
+
+    Returns:
+        Dict[int, Dict[int, Tuple[float, List[Dict[str, Any]]]]]: (points, lineup) keyed by week, then roster_id
+    """
+    known_positions: Dict[str, str] = {}
+
+    def cached_position(player_id: str) -> str:
+        position = known_positions.get(player_id)
+        if position is None:
+            position = known_positions[player_id] = position_of(player_id)
+        return position
+
+    return {
+        week: {matchup.roster_id: optimizer.optimize(matchup.players_points, cached_position) for matchup in matchups}
+        for week, matchups in matchups_by_week.items()
+    }
+
+
+def matchups_digest(matchups: Iterable[Any]) -> str:
+    """Fingerprint of a week's scoring: each roster's matchup_id, points and players_points."""
+    digest = hashlib.blake2b(digest_size=16)
+    for row in sorted((m.roster_id, m.matchup_id, m.points, sorted(m.players_points.items())) for m in matchups):
+        digest.update(repr(row).encode())
+    return digest.hexdigest()
+
+
+def decode_week_results(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Restore a stored week of best-ball results: JSON turns the roster_id keys into strings
+    and the (points, lineup) tuples into lists.
+    """
+    return {
+        'roster_positions': data['roster_positions'],
+        'digest': data['digest'],
+        'lineups': {int(roster_id): tuple(result) for roster_id, result in data['lineups'].items()},
+    }
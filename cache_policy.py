@@ -0,0 +1,62 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+
+@dataclass(frozen=True)
+class FreshnessPolicy:
+    """
+    When a cached entry of one endpoint family may be served without a network call.
+
+    An entry is fresh if the final predicate says its data can no longer change, or if it
+    was fetched less than ttl seconds ago. A ttl of None means the entry never expires;
+    entries with an unknown fetch time are treated as expired.
+    """
+    ttl: Optional[float] = None
+    final: Optional[Callable[..., bool]] = None
+
+    def is_fresh(self, fetched_at: Optional[float], now: Optional[float] = None, **context: Any) -> bool:
+        if self.final is not None and self.final(**context):
+            return True
+        if self.ttl is None:
+            return True
+        if fetched_at is None:
+            return False
+        return (now if now is not None else time.time()) - fetched_at < self.ttl
+
+
+def league_is_complete(value: Dict[str, Any], **context) -> bool:
+    return value.get('status') == 'complete'
+
+
+def league_is_finished(league_status: str, **context) -> bool:
+    return league_status == 'complete'
+
+
+def week_is_scored(value, week: int, current_week: int, season: Optional[str] = None,
+                   current_year: Optional[int] = None, **context) -> bool:
+    # Every week of an earlier season is final, whatever the current week is
+    if season is not None and current_year is not None and int(season) < current_year:
+        return True
+    # A past week is final once every team has points; zeros mean scoring had not finished when it was cached
+    return week < current_week and not any(matchup.points == 0 for matchup in value)
+
+
+def week_is_past(year: int, week: int, current_year: int, current_week: int, **context) -> bool:
+    return (int(year), week) < (current_year, current_week)
+
+
+DEFAULT_CACHE_POLICIES: Dict[str, FreshnessPolicy] = {
+    'league': FreshnessPolicy(ttl=DAY, final=league_is_complete),
+    'users': FreshnessPolicy(ttl=DAY),
+    'rosters': FreshnessPolicy(ttl=15 * MINUTE),
+    'traded_picks': FreshnessPolicy(ttl=15 * MINUTE, final=league_is_finished),
+    'matchups': FreshnessPolicy(ttl=5 * MINUTE, final=week_is_scored),
+    'stats': FreshnessPolicy(ttl=10 * MINUTE, final=week_is_past),
+    'projections': FreshnessPolicy(ttl=6 * HOUR, final=week_is_past),
+    'players': FreshnessPolicy(ttl=DAY),
+}
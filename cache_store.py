@@ -0,0 +1,452 @@
+import atexit
+import glob
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from customer_json_encoder import CustomJSONEncoder
+
+_MISSING = object()
+
+
+def atomic_write_json(path: str, data: Any, **dump_kwargs):
+    """Write JSON to a temporary file next to path and rename it into place, so readers never see a partial file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class CacheStore:
+    """
+    Backend that persists the client caches.
+
+    Entries live in named tables ('api', 'raw_stats', 'projections', 'matchups') and are keyed
+    the same way the client keys them. Values are anything CustomJSONEncoder can serialize;
+    get() returns them as plain JSON data.
+    """
+
+    def get(self, table: str, key: str, default: Any = None) -> Any:
+        raise NotImplementedError
+
+    def set(self, table: str, key: str, value: Any):
+        raise NotImplementedError
+
+    def delete(self, table: str, key: str):
+        raise NotImplementedError
+
+    def keys(self, table: str) -> List[str]:
+        raise NotImplementedError
+
+    def clear(self, table: str):
+        raise NotImplementedError
+
+    def fetched_at(self, table: str, key: str) -> Optional[float]:
+        """Unix time the entry was last written, or None if unknown."""
+        return None
+
+    def flush(self, table: Optional[str] = None):
+        """Persist pending changes for one table, or for all tables when table is None."""
+        pass
+
+    @contextmanager
+    def batch(self):
+        """Group the writes made inside the block, for stores that persist them in the background."""
+        yield self
+
+    def close(self):
+        self.flush()
+
+
+class JsonFileCacheStore(CacheStore):
+    """
+    One JSON file per table, matching the original cache files.
+
+    A file is parsed the first time its table is used. Writes only mark the table dirty;
+    dirty files are rewritten in the background after flush_after_writes mutations or
+    flush_interval seconds, whichever comes first, and on flush(), close() or interpreter
+    exit. Inside batch() neither trigger fires, and the dirty files are written once when
+    the outermost batch ends. Files are replaced atomically. Write times are kept per table in a separate file.
+    """
+
+    FILENAMES = {
+        'api': 'api_cache.json',
+        'raw_stats': 'raw_stats_cache.json',
+        'projections': 'projections_cache.json',
+        'matchups': 'matchups_cache.json',
+        'best_ball': 'best_ball_cache.json',
+        'standings': 'standings_cache.json',
+    }
+    FETCHED_AT_FILENAME = 'cache_fetched_at.json'
+
+    def __init__(self, directory: str = ".", filenames: Optional[Dict[str, str]] = None,
+                 flush_after_writes: int = 50, flush_interval: float = 2.0):
+        self.directory = directory
+        self.filenames = dict(self.FILENAMES, **(filenames or {}))
+        self.flush_after_writes = flush_after_writes
+        self.flush_interval = flush_interval
+        self._tables: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at: Optional[Dict[str, Dict[str, float]]] = None
+        self._lock = threading.RLock()
+        # Serializes file writes so a background flush and an explicit one never interleave
+        self._flush_lock = threading.Lock()
+        self._dirty = set()
+        self._pending_writes = 0
+        self._timer: Optional[threading.Timer] = None
+        self._batch_depth = 0
+        # Seconds spent parsing each file, recorded when its table is first used
+        self.load_timings: Dict[str, float] = {}
+        # Flushed at interpreter exit unless closed first; the set does not keep the store alive
+        _open_json_stores.add(self)
+
+    def path(self, table: str) -> str:
+        return os.path.join(self.directory, self.filenames.get(table, f"{table}_cache.json"))
+
+    def tables(self) -> List[str]:
+        """Every table with a file in the directory: the named ones and any other '<table>_cache.json'."""
+        tables = [table for table in self.filenames if os.path.exists(self.path(table))]
+        named = {os.path.basename(self.path(table)) for table in tables}
+        for path in sorted(glob.glob(os.path.join(glob.escape(self.directory), "*_cache.json"))):
+            filename = os.path.basename(path)
+            table = filename[:-len("_cache.json")]
+            if filename not in named and table not in self.filenames:
+                tables.append(table)
+        return tables
+
+    def _table(self, table: str) -> Dict[str, Any]:
+        entries = self._tables.get(table)
+        if entries is None:
+            with self._lock:
+                entries = self._tables.get(table)
+                if entries is None:
+                    started = time.perf_counter()
+                    entries = {}
+                    path = self.path(table)
+                    if os.path.exists(path):
+                        with open(path, 'r') as f:
+                            entries = json.load(f)
+                    self._tables[table] = entries
+                    self.load_timings[table] = time.perf_counter() - started
+        return entries
+
+    def _fetched_at_table(self, table: str) -> Dict[str, float]:
+        with self._lock:
+            if self._fetched_at is None:
+                self._fetched_at = {}
+                path = os.path.join(self.directory, self.FETCHED_AT_FILENAME)
+                if os.path.exists(path):
+                    with open(path, 'r') as f:
+                        self._fetched_at = json.load(f)
+            return self._fetched_at.setdefault(table, {})
+
+    def get(self, table: str, key: str, default: Any = None) -> Any:
+        return self._table(table).get(key, default)
+
+    def set(self, table: str, key: str, value: Any):
+        # Keep the JSON form rather than the caller's objects, so get() returns plain data
+        # here as it does from SQLiteCacheStore, and later changes to value are not stored
+        value = json.loads(json.dumps(value, cls=CustomJSONEncoder))
+        with self._lock:
+            self._table(table)[key] = value
+            self._fetched_at_table(table)[key] = time.time()
+            self._mark_dirty(table)
+
+    def delete(self, table: str, key: str):
+        with self._lock:
+            self._table(table).pop(key, None)
+            self._fetched_at_table(table).pop(key, None)
+            self._mark_dirty(table)
+
+    def keys(self, table: str) -> List[str]:
+        return list(self._table(table))
+
+    def clear(self, table: str):
+        with self._lock:
+            self._tables[table] = {}
+            self._fetched_at_table(table).clear()
+            self._mark_dirty(table)
+
+    def fetched_at(self, table: str, key: str) -> Optional[float]:
+        return self._fetched_at_table(table).get(key)
+
+    def _mark_dirty(self, table: str):
+        # Called with self._lock held
+        self._dirty.add(table)
+        self._pending_writes += 1
+        if self._batch_depth:
+            return
+        if self._pending_writes >= self.flush_after_writes:
+            self._pending_writes = 0
+            self._cancel_timer()
+            threading.Thread(target=self.flush, daemon=True).start()
+        elif self._timer is None:
+            self._schedule_timer()
+
+    def _schedule_timer(self):
+        self._timer = threading.Timer(self.flush_interval, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def flush(self, table: Optional[str] = None):
+        with self._flush_lock:
+            # Snapshot the dirty tables under the lock, then serialize without blocking writers
+            with self._lock:
+                tables = [table] if table is not None else list(self._dirty)
+                snapshots = {name: dict(self._tables[name]) for name in tables
+                             if name in self._dirty and name in self._tables}
+                if not snapshots:
+                    return
+                fetched_at = {name: dict(entries) for name, entries in (self._fetched_at or {}).items()}
+                self._dirty.difference_update(snapshots)
+                self._cancel_timer()
+                if self._dirty and not self._batch_depth:
+                    self._schedule_timer()
+                else:
+                    self._pending_writes = 0
+
+            for name, entries in snapshots.items():
+                atomic_write_json(self.path(name), entries)
+            atomic_write_json(os.path.join(self.directory, self.FETCHED_AT_FILENAME), fetched_at)
+
+    @contextmanager
+    def batch(self):
+        """
+        Hold back background flushes until the block ends, then write the dirty files once.
+
+        Batches may be nested and entered from several threads; the write happens when the
+        last one exits.
+        """
+        with self._lock:
+            self._batch_depth += 1
+            self._cancel_timer()
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                outermost = not self._batch_depth
+            if outermost:
+                self.flush()
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._cancel_timer()
+        _open_json_stores.discard(self)
+
+
+_open_json_stores: "weakref.WeakSet[JsonFileCacheStore]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_json_stores():
+    for store in list(_open_json_stores):
+        store.flush()
+
+
+class SQLiteCacheStore(CacheStore):
+    """
+    All tables in one embedded SQLite database.
+
+    Writes are per-key upserts and reads are point lookups, so storing one week of
+    matchups no longer rewrites every other week.
+    """
+
+    def __init__(self, path: str = "sleeper_cache.db"):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key))"
+        )
+        self._conn.commit()
+
+    def get(self, table: str, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache_entries WHERE namespace = ? AND key = ?", (table, key)
+            ).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set(self, table: str, key: str, value: Any):
+        self.set_many(table, {key: value})
+
+    def set_many(self, table: str, entries: Dict[str, Any]):
+        now = time.time()
+        rows = [(table, key, json.dumps(value, cls=CustomJSONEncoder), now) for key, value in entries.items()]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO cache_entries (namespace, key, value, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(namespace, key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+                rows
+            )
+            self._conn.commit()
+
+    def delete(self, table: str, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (table, key))
+            self._conn.commit()
+
+    def keys(self, table: str) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT key FROM cache_entries WHERE namespace = ?", (table,)).fetchall()
+        return [row[0] for row in rows]
+
+    def clear(self, table: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (table,))
+            self._conn.commit()
+
+    def fetched_at(self, table: str, key: str) -> Optional[float]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT updated_at FROM cache_entries WHERE namespace = ? AND key = ?", (table, key)
+            ).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class BoundedMemo:
+    """
+    In-process memo that keeps the maxsize most recently used entries, for values derived
+    from cached data (such as scored stats) that would otherwise pile up for the life of a
+    long-running client.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def __setitem__(self, key: Any, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class CacheTable(MutableMapping):
+    """
+    Dict-like view of one table of a CacheStore.
+
+    Entries are decoded into model objects on first access and memoized, so a lookup only
+    pays for the entries it touches. Assignments are forwarded to the store immediately;
+    call save() to persist stores that buffer writes.
+    """
+
+    def __init__(self, store: CacheStore, table: str, decode: Optional[Callable[[Any], Any]] = None):
+        self.store = store
+        self.table = table
+        self.decode = decode
+        self._decoded: Dict[str, Any] = {}
+
+    def _lookup(self, key: str) -> Any:
+        value = self._decoded.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.store.get(self.table, key, _MISSING)
+            if value is not _MISSING:
+                if self.decode is not None:
+                    value = self.decode(value)
+                self._decoded[key] = value
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return self._lookup(key) is not _MISSING
+
+    def __setitem__(self, key: str, value: Any):
+        self._decoded[key] = value
+        self.store.set(self.table, key, value)
+
+    def __delitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+        self._decoded.pop(key, None)
+        self.store.delete(self.table, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.keys(self.table))
+
+    def __len__(self) -> int:
+        return len(self.store.keys(self.table))
+
+    def clear(self):
+        self._decoded = {}
+        self.store.clear(self.table)
+
+    def fetched_at(self, key: str) -> Optional[float]:
+        return self.store.fetched_at(self.table, key)
+
+    def save(self):
+        """Write this table to disk now instead of waiting for the store's next flush."""
+        self.store.flush(self.table)
+
+
+def migrate_json_to_sqlite(sqlite_store: SQLiteCacheStore,
+                           json_store: Optional[JsonFileCacheStore] = None) -> Dict[str, int]:
+    """
+    Copy every entry of the JSON cache files into a SQLite store: the standard tables and
+    any other '<table>_cache.json' in the JSON store's directory.
+
+    Args:
+        sqlite_store (SQLiteCacheStore): Destination store
+        json_store (JsonFileCacheStore): Source files; defaults to the standard files in the working directory
+
+    Returns:
+        Dict[str, int]: Number of entries copied per table
+    """
+    json_store = json_store or JsonFileCacheStore()
+    copied = {}
+    for table in json_store.tables():
+        entries = {key: json_store.get(table, key) for key in json_store.keys(table)}
+        sqlite_store.set_many(table, entries)
+        copied[table] = len(entries)
+        print(f"Migrated {len(entries)} {table} cache entries to {sqlite_store.path}")
+    return copied
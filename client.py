@@ -1,32 +1,162 @@
+import copy
 import json
 import os
-import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Any, Dict, List, Optional
 import requests
-from customer_json_encoder import CustomJSONEncoder
+from cache_policy import DEFAULT_CACHE_POLICIES, FreshnessPolicy
+from cache_store import BoundedMemo, CacheStore, CacheTable, JsonFileCacheStore, atomic_write_json
 from exceptions import SleeperAPIException
-from models import League, PlayerInfo, ProjectedStats, SleeperProjections, Team, Matchup, Player, Roster, PlayerProjection, PlayerStats, Transaction
-import csv
-from datetime import datetime, timedelta
+from http_transport import HttpTransport, OfflineTransport, get_default_transport
+from league_directory import LeagueDirectory
+from player_db import PlayerDB, build_player_db
+from schedule_calendar import ScheduleCalendar
+from tracing import DEBUG, Tracer, get_default_tracer
+from model_views import MatchupView, RosterView, TeamView, TransactionView
+from name_normalizer import PLAYER_NAMES, SHORT_NAMES
+from models import League, PlayerInfo, ProjectedStats, SleeperProjections, Team, Matchup, Player, Roster, PlayerProjection, PlayerStats, Transaction, PLAYER_STAT_FIELDS
+from datetime import datetime
 
 class SleeperAPI:
     BASE_URL = "https://api.sleeper.app/v1"
-
-    def __init__(self):
-        self.players = self.load_players_from_file()
-        self.cache = {}
-        self.load_cache()
+    # A season of weeks x positions for a handful of scoring profiles
+    SCORED_STATS_MEMO_SIZE = 512
+    STAT_MATRIX_MEMO_SIZE = 256
+
+    def __init__(self, transport: Optional[HttpTransport] = None, cache_store: Optional[CacheStore] = None,
+                 cache_policies: Optional[Dict[str, FreshnessPolicy]] = None, views: bool = False,
+                 tracer: Optional[Tracer] = None):
+        started = time.perf_counter()
+        # Return lazy views over the response dicts (model_views) instead of building models up front
+        self.views = views
+        # Debug events and phase timings; the process default is disabled, see tracing.py
+        self.tracer = tracer or get_default_tracer()
+        self.transport = transport or get_default_transport()
+        # Per endpoint family; see cache_policy.DEFAULT_CACHE_POLICIES
+        self.cache_policies = dict(DEFAULT_CACHE_POLICIES, **(cache_policies or {}))
+        # Makes check-then-delete on the caches atomic when weeks are fetched on a thread pool
+        self._cache_lock = threading.RLock()
+        # Seconds spent in __init__ and in each deferred load, see print_load_timings()
+        self.load_timings: Dict[str, float] = {}
+        # players.json is parsed on first access of self.players
+        self._players: Optional[Dict[str, Player]] = None
+        self._players_lock = threading.Lock()
+        # players.bin answers name and position lookups until something needs the full table
+        self._player_db: Optional[PlayerDB] = None
+        self._player_db_checked = False
+        # Normalized name -> player IDs, built from self.players on first name lookup
+        self._player_name_index: Optional[Dict[str, List[str]]] = None
+        self.cache_store = cache_store or JsonFileCacheStore()
+        self.cache = CacheTable(self.cache_store, 'api')
+        # league_id -> (raw payload, League decoded from it), see _build_league
+        self._decoded_leagues: Dict[str, Any] = {}
+        # league_id -> (raw users, raw rosters, LeagueDirectory built from them), see get_league_directory
+        self._league_directories: Dict[str, Any] = {}
+        # Loaded on first week lookup, see the schedule property
+        self._schedule: Optional[ScheduleCalendar] = None
         self.scoring_settings = {}
-        self.stats_cache = self.load_stats_cache()
-        self.projections_cache = self.load_projections_cache()
-        self.matchups_cache = self.load_matchups_cache()
+        # Unscored stat lines per (year, week, position), shared by every league; see get_stats
+        self.raw_stats_cache = CacheTable(self.cache_store, 'raw_stats')
+        # ((year, week, position) key, scoring profile) -> (raw stats, PlayerStats scored from them),
+        # for the most recently used SCORED_STATS_MEMO_SIZE combinations
+        self._scored_stats = BoundedMemo(self.SCORED_STATS_MEMO_SIZE)
+        # (year, week, position) key -> (raw stats, scoring_engine.StatMatrix of them), see score_stats;
+        # the most recently used STAT_MATRIX_MEMO_SIZE weeks and positions
+        self._stat_matrices = BoundedMemo(self.STAT_MATRIX_MEMO_SIZE)
+        self.projections_cache = CacheTable(self.cache_store, 'projections', decode=self._decode_projections)
+        self.matchups_cache = CacheTable(self.cache_store, 'matchups', decode=self._decode_matchups)
+        self.load_timings['init'] = time.perf_counter() - started
+
+    @property
+    def players(self) -> Dict[str, Player]:
+        if self._players is None:
+            with self._players_lock:
+                if self._players is None:
+                    started = time.perf_counter()
+                    self._players = self.load_players_from_file()
+                    self._refresh_players_if_stale()
+                    if not PlayerDB.is_current(self._player_db_path(), "players.json"):
+                        build_player_db(self._players, self._player_db_path())
+                    self.load_timings['players'] = time.perf_counter() - started
+        return self._players
+
+    @players.setter
+    def players(self, players: Dict[str, Player]):
+        self._players = players
+        self._player_name_index = None
+
+    @property
+    def player_name_index(self) -> Dict[str, List[str]]:
+        """Player IDs keyed by normalized name (Player.name); most names map to a single ID."""
+        if self._player_name_index is None:
+            index: Dict[str, List[str]] = {}
+            for player_id, player in self.players.items():
+                index.setdefault(player.name, []).append(player_id)
+            self._player_name_index = index
+        return self._player_name_index
+
+    def find_player_id(self, name: str, position: Optional[str] = None) -> Optional[str]:
+        """
+        Resolve a name from another source (a CSV export, a DraftKings prop, a projection) to a Sleeper player ID.
+
+        Args:
+            name (str): Player name in any common spelling, e.g. "Kenneth Walker III"
+            position (str): Only consider players at this position
+
+        Returns:
+            Optional[str]: The player ID, preferring a player currently on a team when the
+            name is shared, or None if no player matches
+        """
+        candidates = self.player_name_index.get(PLAYER_NAMES.normalize(name), [])
+        if position is not None:
+            candidates = [player_id for player_id in candidates if self.players[player_id].position == position]
+        for player_id in candidates:
+            if self.players[player_id].team:
+                return player_id
+        return candidates[0] if candidates else None
+
+    @property
+    def player_db(self) -> Optional[PlayerDB]:
+        """
+        Memory-mapped players.bin, or None when it is missing, older than players.json, or
+        the players are due a refresh (no refresh succeeded or failed within the players
+        TTL). In those cases lookups fall back to self.players, which rebuilds the file.
+        """
+        if not self._player_db_checked:
+            with self._players_lock:
+                if not self._player_db_checked:
+                    started = time.perf_counter()
+                    path = self._player_db_path()
+                    if PlayerDB.is_current(path, "players.json") and self.cache_policies['players'].is_fresh(self._players_checked_at()):
+                        self._player_db = PlayerDB(path)
+                        self.load_timings['player_db'] = time.perf_counter() - started
+                    self._player_db_checked = True
+        return self._player_db
+
+    @staticmethod
+    def _player_db_path(filename="players.json") -> str:
+        return os.path.splitext(filename)[0] + ".bin"
+
+    def _lookup_player(self, player_id: str):
+        # The loaded table if there is one, else players.bin, else load the table.
+        # Both Player and PlayerRecord have name, position and team.
+        if self._players is None and self.player_db is not None:
+            return self.player_db.get(player_id)
+        return self.players.get(player_id)
+
+    def print_load_timings(self):
+        """Print how long construction and each lazily loaded cache took so far."""
+        timings = dict(self.load_timings, **{f"{table}_cache": seconds
+                                             for table, seconds in getattr(self.cache_store, 'load_timings', {}).items()})
+        print("Component|Milliseconds")
+        for name, seconds in timings.items():
+            print(f"{name}|{seconds * 1000:.1f}")
 
     def get_team_name(self, league_id: str, roster_id: int) -> str:
-        league = self.get_league(league_id, fetch_all=True)
-        for team in league.teams:
-            if team.roster and team.roster.roster_id == roster_id:
-                return team.display_name
-        return f"Unknown Team (Roster ID: {roster_id})"
+        return self.get_league_directory(league_id).display_name(roster_id, f"Unknown Team (Roster ID: {roster_id})")
 
     def get_player_name(self, player_id: str) -> str:
         player = self.players.get(player_id)
@@ -40,7 +170,7 @@ class SleeperAPI:
         url = f"{self.BASE_URL}/league/{league_id}/transactions/{week}"
         
         try:
-            response = requests.get(url)
+            response = self.transport.get(url)
             response.raise_for_status()
             data = response.json()
             
@@ -60,16 +190,117 @@ class SleeperAPI:
     def fetch_players_from_api(self) -> Dict[str, Player]:
         url = f"{self.BASE_URL}/players/nfl"
         print('getting players from api...')
-        response = requests.get(url)
+        response = self.transport.get(url)
         response.raise_for_status()
         data = response.json()
         players = {player_id: Player(**player_data) for player_id, player_data in data.items()}
         self.save_players_to_file(players)  # Save the fetched players to file
+        self._save_players_validators(response)
         return players
 
+    def refresh_players(self, force: bool = False, filename="players.json") -> Dict[str, int]:
+        """
+        Refresh the players table from /players/nfl without a full rebuild.
+
+        Sends the ETag/Last-Modified validators from the previous download so an unchanged
+        payload costs a 304. Otherwise the new payload is diffed against the loaded players and
+        only added or changed players are rebuilt; the file is rewritten only if something changed.
+
+        Args:
+            force (bool): Skip the conditional headers and always download the payload
+            filename (str): Players file to update
+
+        Returns:
+            Dict[str, int]: Counts of 'added', 'changed' and 'removed' players, and 'not_modified'
+            set to 1 when the server answered 304
+        """
+        url = f"{self.BASE_URL}/players/nfl"
+        headers = {}
+        validators = {} if force else self._load_players_validators()
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+        response = self.transport.get(url, headers=headers)
+        if response.status_code == 304:
+            self._save_players_validators(response, validators)
+            print('players not modified since last refresh')
+            return {'added': 0, 'changed': 0, 'removed': 0, 'not_modified': 1}
+        response.raise_for_status()
+        data = response.json()
+
+        added = changed = 0
+        for player_id, player_data in data.items():
+            player = self.players.get(player_id)
+            if player is None:
+                added += 1
+            elif self._player_unchanged(player, player_data):
+                continue
+            else:
+                changed += 1
+            self.players[player_id] = Player(**player_data)
+
+        removed_ids = [player_id for player_id in self.players if player_id not in data]
+        for player_id in removed_ids:
+            del self.players[player_id]
+
+        if added or changed or removed_ids:
+            self._player_name_index = None
+            self.save_players_to_file(self.players, filename)
+        self._save_players_validators(response)
+
+        print(f"players refreshed: {added} added, {changed} changed, {len(removed_ids)} removed")
+        return {'added': added, 'changed': changed, 'removed': len(removed_ids), 'not_modified': 0}
+
+    @staticmethod
+    def _player_unchanged(player: Player, player_data: Dict[str, Any]) -> bool:
+        for f in Player.FIELDS:
+            value = getattr(player, f)
+            if isinstance(value, tuple):
+                value = list(value)
+            if value != player_data.get(f):
+                return False
+        return True
+
+    def _load_players_validators(self, filename="players_meta.json") -> Dict[str, str]:
+        if os.path.exists(filename):
+            with open(filename, 'r') as f:
+                return json.load(f)
+        return {}
+
+    def _save_players_validators(self, response, previous: Optional[Dict[str, str]] = None, filename="players_meta.json"):
+        previous = previous or {}
+        validators = {
+            'etag': response.headers.get('ETag') or previous.get('etag'),
+            'last_modified': response.headers.get('Last-Modified') or previous.get('last_modified'),
+            'fetched_at': time.time(),
+        }
+        atomic_write_json(filename, validators)
+
+    def _players_checked_at(self, filename="players_meta.json") -> Optional[float]:
+        # A failed refresh counts as a check too, so an offline run does not retry it (and skip
+        # players.bin) on every start until the players TTL runs out
+        validators = self._load_players_validators(filename)
+        return max((validators[key] for key in ('fetched_at', 'attempted_at') if validators.get(key) is not None), default=None)
+
+    def _record_players_attempt(self, filename="players_meta.json"):
+        validators = self._load_players_validators(filename)
+        validators['attempted_at'] = time.time()
+        atomic_write_json(filename, validators)
+
+    def _refresh_players_if_stale(self):
+        if self.cache_policies['players'].is_fresh(self._players_checked_at()):
+            return
+        try:
+            self.refresh_players()
+        except requests.RequestException as e:
+            print(f"Could not refresh players, using the stored copy: {str(e)}")
+            self._record_players_attempt()
+
     def save_players_to_file(self, players: Dict[str, Player], filename="players.json"):
-        with open(filename, 'w') as f:
-            json.dump({pid: {k: v for k, v in vars(p).items() if not k.startswith('_')} for pid, p in players.items()}, f)
+        atomic_write_json(filename, {pid: p.to_dict() for pid, p in players.items()})
+        build_player_db(players, self._player_db_path(filename))
         print(f"Players data saved to {filename}")
 
     def load_players_from_file(self, filename="players.json") -> Dict[str, Player]:
@@ -83,14 +314,14 @@ class SleeperAPI:
             return self.fetch_players_from_api()
 
     def get_player_position(self, player_id: str) -> str:
-        player = self.players.get(player_id)
+        player = self._lookup_player(player_id)
         if player:
             return player.position
         else:
             return "UNKNOWN"
 
     def get_player_name(self, player_id: str) -> str:
-        player = self.players.get(player_id)
+        player = self._lookup_player(player_id)
         if player:
             return player.name
         else:
@@ -98,45 +329,124 @@ class SleeperAPI:
 
     def get_league(self, league_id: str, fetch_all: bool = False) -> League:
         cache_key = f"league_{league_id}"
-        if cache_key in self.cache:
-            league_data = self.cache[cache_key]
-        else:
+        league_data = self._get_cached_league_data(league_id)
+        if league_data is None:
             url = f"{self.BASE_URL}/league/{league_id}"
-            response = requests.get(url)
+            response = self.transport.get(url)
             response.raise_for_status()
             league_data = response.json()
             self.cache[cache_key] = league_data
-            self.save_cache()
         
-        league = League(**league_data)
-        self.scoring_settings[league_id] = league.scoring_settings
+        league = self._build_league(league_id, league_data)
         
         if fetch_all:
-            league.teams = self.get_league_users(league_id)
-            league_rosters = self.get_league_rosters(league_id)
-            self._associate_rosters_with_teams(league.teams, league_rosters)
+            # Shallow copies, so a caller that reassigns a team's fields (such as roster) does not
+            # change the directory every later call reads; the rosters themselves are shared
+            league.teams = [copy.copy(team) for team in self.get_league_directory(league_id).teams]
         
         return league
 
+    def _is_fresh(self, family: str, table: CacheTable, key: str, **context) -> bool:
+        return self.cache_policies[family].is_fresh(table.fetched_at(key), **context)
+
+    def _get_cached_league_data(self, league_id: str) -> Optional[Dict[str, Any]]:
+        cache_key = f"league_{league_id}"
+        if cache_key in self.cache:
+            league_data = self.cache[cache_key]
+            if self._is_fresh('league', self.cache, cache_key, value=league_data):
+                return league_data
+        return None
+
+    def _league_season(self, league_id: str) -> Optional[str]:
+        """The league's season from the cache, however old the entry is; None if it was never fetched."""
+        league_data = self.cache.get(f"league_{league_id}")
+        return league_data.get('season') if league_data else None
+
+    def _build_league(self, league_id: str, league_data: Dict[str, Any]) -> League:
+        # The cache hands back the same dict until the league is refetched, so its metadata and
+        # settings are decoded once; each call gets its own shallow copy to attach teams to
+        decoded = self._decoded_leagues.get(league_id)
+        if decoded is None or decoded[0] is not league_data:
+            decoded = self._decoded_leagues[league_id] = (league_data, League.from_dict(league_data))
+        league = copy.copy(decoded[1])
+        league.teams = []
+        self.scoring_settings[league_id] = league.scoring_settings
+        return league
+
     def get_projections(self, year: int, week: int, position: str) -> List[PlayerProjection]:
         cache_key = f"{year}_{week}_{position}"
-        if cache_key in self.projections_cache:
-            return self.projections_cache[cache_key]
+        cached_projections = self._get_cached_projections(year, week, position)
+        if cached_projections is not None:
+            return cached_projections
 
-        projections = SleeperProjections.get_projections(year, week, position)
+        projections = SleeperProjections.get_projections(year, week, position, transport=self.transport)
         self.projections_cache[cache_key] = projections
-        self.save_projections_cache()
         return projections
     
+    def _get_cached_projections(self, year: int, week: int, position: str) -> Optional[List[PlayerProjection]]:
+        cache_key = f"{year}_{week}_{position}"
+        if cache_key in self.projections_cache and self._is_fresh(
+                'projections', self.projections_cache, cache_key, year=year, week=week,
+                current_year=self.get_current_season_year(), current_week=self.get_current_week()):
+            return self.projections_cache[cache_key]
+        return None
+
     def get_league_users(self, league_id: str) -> List[Team]:
         endpoint = f"{self.BASE_URL}/league/{league_id}/users"
-        response = self._make_request(endpoint)
-        return [Team(**user) for user in response]
+        return self._teams_from_response(self._make_request(endpoint, 'users'))
 
     def get_league_rosters(self, league_id: str) -> List[Roster]:
         endpoint = f"{self.BASE_URL}/league/{league_id}/rosters"
-        response = self._make_request(endpoint)
-        return [Roster(**roster) for roster in response]
+        return self._rosters_from_response(self._make_request(endpoint, 'rosters'))
+
+    def _teams_from_response(self, data: List[Dict[str, Any]]) -> List[Team]:
+        if self.views:
+            return [TeamView(user) for user in data]
+        return [Team(**user) for user in data]
+
+    def _rosters_from_response(self, data: List[Dict[str, Any]]) -> List[Roster]:
+        if self.views:
+            return [RosterView(roster) for roster in data]
+        return [Roster(**roster) for roster in data]
+
+    def get_league_directory(self, league_id: str) -> LeagueDirectory:
+        """
+        Roster, user and display name lookups for a league. Rebuilt only when the cached
+        users or rosters have been refetched.
+        """
+        users = self._make_request(f"{self.BASE_URL}/league/{league_id}/users", 'users')
+        rosters = self._make_request(f"{self.BASE_URL}/league/{league_id}/rosters", 'rosters')
+        return self._league_directory(league_id, users, rosters)
+
+    def _league_directory(self, league_id: str, users: List[Dict[str, Any]],
+                          rosters: List[Dict[str, Any]]) -> LeagueDirectory:
+        # The cache hands back the same lists until a response is refetched
+        cached = self._league_directories.get(league_id)
+        if cached is not None and cached[0] is users and cached[1] is rosters:
+            return cached[2]
+        teams = self._teams_from_response(users)
+        league_rosters = self._rosters_from_response(rosters)
+        self._associate_rosters_with_teams(teams, league_rosters)
+        directory = LeagueDirectory(teams, league_rosters)
+        self._league_directories[league_id] = (users, rosters, directory)
+        return directory
+
+    def invalidate_rosters(self, league_id: str):
+        """Drop the cached rosters of a league so the next lookup refetches them."""
+        self._invalidate(f"{self.BASE_URL}/league/{league_id}/rosters")
+        self._league_directories.pop(league_id, None)
+
+    def invalidate_league(self, league_id: str):
+        """Drop the cached settings, users and rosters of a league."""
+        self._invalidate(f"league_{league_id}")
+        self._invalidate(f"{self.BASE_URL}/league/{league_id}/users")
+        self._invalidate(f"{self.BASE_URL}/league/{league_id}/rosters")
+        self._league_directories.pop(league_id, None)
+
+    def _invalidate(self, cache_key: str):
+        with self._cache_lock:
+            if cache_key in self.cache:
+                del self.cache[cache_key]
 
     def _associate_rosters_with_teams(self, teams: List[Team], rosters: List[Roster]):
         roster_dict = {roster.owner_id: roster for roster in rosters}
@@ -145,25 +455,39 @@ class SleeperAPI:
 
     def get_matchups(self, league_id: str, week: int, current_week: Optional[int] = None) -> List[Matchup]:
         cache_key = f"{league_id}_{week}"
-    
-        # If current_week is not provided, use the week parameter
-        current_week = current_week or week
+        cached_matchups = self._get_cached_matchups(league_id, week, current_week)
+        if cached_matchups is not None:
+            return cached_matchups
+
+        url = f"{self.BASE_URL}/league/{league_id}/matchups/{week}"
+        response = self.transport.get(url)
+        response.raise_for_status()
+        data = response.json()
+
+        matchups = self._matchups_from_response(data)
+        self.matchups_cache[cache_key] = matchups
+        return matchups
+
+    def _get_cached_matchups(self, league_id: str, week: int, current_week: Optional[int] = None) -> Optional[List[Matchup]]:
+        cache_key = f"{league_id}_{week}"
 
-        # Check if the matchup is in the cache
         if cache_key in self.matchups_cache:
             cached_matchups = self.matchups_cache[cache_key]
-            
-            # If it's a past week (relative to current_week) and any matchup has zero points, fetch new data
-            if week < current_week and any(matchup.points == 0 for matchup in cached_matchups):
-                print(f"Cached matchups for week {week} have zero points. Fetching new data.")
-            else:
+            # If current_week is not provided, use the NFL calendar
+            current_week = current_week or self.get_current_week()
+            if self._is_fresh('matchups', self.matchups_cache, cache_key,
+                              value=cached_matchups, week=week, current_week=current_week,
+                              season=self._league_season(league_id), current_year=self.get_current_season_year()):
                 return cached_matchups
+        return None
 
-        url = f"{self.BASE_URL}/league/{league_id}/matchups/{week}"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
+    def _matchups_from_response(self, data: List[Dict[str, Any]]) -> List[Matchup]:
+        if self.views:
+            return [MatchupView(matchup_data) for matchup_data in data]
+        return self._parse_matchups(data)
 
+    @staticmethod
+    def _parse_matchups(data: List[Dict[str, Any]]) -> List[Matchup]:
         matchups = []
         for matchup_data in data:
             players_points = {}
@@ -183,42 +507,62 @@ class SleeperAPI:
                 starters_points=starters_points
             )
             matchups.append(matchup)
-
-        self.matchups_cache[cache_key] = matchups
-        self.save_matchups_cache()
         return matchups
 
-    def get_all_matchups(self, league_id: str, current_week: int) -> Dict[int, List[Matchup]]:
-        all_matchups = {}
-        for week in range(1, current_week + 1):
-            all_matchups[week] = self.get_matchups(league_id, week, current_week)
-        return all_matchups
+    def get_all_matchups(self, league_id: str, current_week: int, max_workers: Optional[int] = None) -> Dict[int, List[Matchup]]:
+        weeks = range(1, current_week + 1)
+        # The whole season is written to the matchups cache once, after the last week
+        with self.cache_store.batch():
+            if max_workers and max_workers > 1:
+                # Fetch weeks in parallel; map() yields results in week order regardless of completion order
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    results = executor.map(lambda week: self.get_matchups(league_id, week, current_week), weeks)
+                    return dict(zip(weeks, results))
+
+            all_matchups = {}
+            for week in weeks:
+                all_matchups[week] = self.get_matchups(league_id, week, current_week)
+            return all_matchups
     
-    def get_traded_picks(self, league_id: str) -> List[Dict[str, Any]]:
+    def get_traded_picks(self, league_id: str, league_status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Args:
+            league_id (str): The league ID
+            league_status (str): The league's status, if known; picks of a complete league are cached for good
+        """
+        cache_key = f"traded_picks_{league_id}"
+        if cache_key in self.cache and self._is_fresh('traded_picks', self.cache, cache_key, league_status=league_status):
+            return self.cache[cache_key]
         url = f"{self.BASE_URL}/league/{league_id}/traded_picks"
         try:
-            response = requests.get(url)
+            response = self.transport.get(url)
             response.raise_for_status()
-            return response.json()
+            traded_picks = response.json()
         except requests.RequestException as e:
             raise SleeperAPIException(f"Error fetching traded picks: {str(e)}")
+        self.cache[cache_key] = traded_picks
+        return traded_picks
 
-    def get_all_traded_picks(self, league_id: str) -> List[Dict[str, Any]]:
-        all_traded_picks = []
+    def get_league_chain(self, league_id: str) -> List[League]:
+        """The league followed by each earlier season, following previous_league_id."""
+        chain = []
         current_league_id = league_id
-
         while current_league_id:
-            traded_picks = self.get_traded_picks(current_league_id)
-            all_traded_picks.extend(traded_picks)
-
             league = self.get_league(current_league_id)
+            chain.append(league)
             current_league_id = league.previous_league_id
+        return chain
 
-        return all_traded_picks
+    def get_all_traded_picks(self, league_id: str) -> List[Dict[str, Any]]:
+        """Traded picks of every season in the league's chain, newest season first."""
+        chain = self.get_league_chain(league_id)
+        with self.cache_store.batch(), ThreadPoolExecutor(max_workers=min(len(chain), 8)) as executor:
+            seasons = executor.map(lambda league: self.get_traded_picks(league.league_id, league.status), chain)
+            return [pick for traded_picks in seasons for pick in traded_picks]
 
     def get_player_fields(self):
         url = f"{self.BASE_URL}/players/nfl"
-        response = requests.get(url)
+        response = self.transport.get(url)
         response.raise_for_status()
         data = response.json()
         
@@ -237,20 +581,26 @@ class SleeperAPI:
             print("No users found in the league or empty response.")
     
     
-    def _make_request(self, endpoint: str) -> Dict[str, Any]:
+    def _make_request(self, endpoint: str, family: str = 'api') -> Dict[str, Any]:
+        cached_response = self._get_cached_response(endpoint, family)
+        if cached_response is not None:
+            return cached_response
         cache_key = endpoint
-        if cache_key in self.cache:
-            return self.cache[cache_key]
 
-        response = requests.get(endpoint)
+        response = self.transport.get(endpoint)
         if response.status_code == 200:
             data = response.json()
             self.cache[cache_key] = data
-            self.save_cache()
             return data
         else:
             raise SleeperAPIException(f"API request failed: {response.status_code} - {response.text}")
 
+    def _get_cached_response(self, endpoint: str, family: str = 'api') -> Optional[Any]:
+        cache_key = endpoint
+        if cache_key in self.cache and (family not in self.cache_policies or self._is_fresh(family, self.cache, cache_key)):
+            return self.cache[cache_key]
+        return None
+
     def print_league_rosters(self, league_id: str):
         league = self.get_league(league_id, fetch_all=True)
         players = self.get_players()
@@ -297,130 +647,180 @@ class SleeperAPI:
 
     @staticmethod
     def format_player_name(name: str) -> str:
-        name = name.split('(')[0]  # Remove anything in parentheses
-        name = name.strip().upper()
-        name = re.sub(r'[,+.*]', '', name)
-        name = re.sub(r'\s+(JR|SR|III|II|IV|V)$', '', name)
-        name = name.replace("'", "").replace("-", " ")
-
-        # Additional specific replacements
-        replacements = {
-            "MITCHELL": "MITCH",
-            "WILLIAM": "WILL",
-            "BENJAMIN": "BEN",
-            "MICHAEL": "MIKE",
-            "JOSHUA": "JOSH",
-            "ROBERT": "ROB",
-            "CHRISTOPHER": "CHRIS",
-            "KENNETH": "KEN",
-            "JEFFREY": "JEFF",
-            "GABRIEL": "GABE",
-            "NATHANIEL": "NATE",
-        }
+        return SHORT_NAMES.normalize(name)
 
-        for old, new in replacements.items():
-            name = name.replace(f"{old} ", f"{new} ")
-
-        return name
+    @property
+    def schedule(self) -> ScheduleCalendar:
+        """NFL week calendar, loaded from the schedule CSVs (or their precomputed copy) on first use."""
+        if self._schedule is None:
+            self._schedule = ScheduleCalendar.load()
+        return self._schedule
 
     def get_current_week(self) -> int:
-        current_date = datetime.now().date()
-        week_ranges = self._get_week_ranges()
-
-        for week, (start_date, end_date) in sorted(week_ranges.items()):
-            if current_date <= end_date:
-                return week
+        # Past the last game this is the last week
+        return self.schedule.today().week
 
-        # If we're past the last week, return the last week number
-        return max(week_ranges.keys())
-    
     def get_current_season_year(self) -> int:
-        week_ranges = self._get_week_ranges()
-        current_date = datetime.now().date()
-        
-        for week, (start_date, end_date) in week_ranges.items():
-            if current_date <= end_date:
-                return start_date.year
-        
-        # If we're past the last game, return the year of the last game
-        return max(end_date.year for _, end_date in week_ranges.values())
+        today = datetime.now().date()
+        if self.schedule.is_past_end(today):
+            # If we're past the last game, return the year of the last game
+            return self.schedule.weeks[-1].end.year
+        return self.schedule.lookup(today).season
 
     def _get_week_ranges(self):
-        week_ranges = {}
-        with open('2024 Game Dates.csv', 'r') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                week = int(row['WeekNum'])
-                date = datetime.strptime(row['ScheduleDate'], '%Y-%m-%d %H:%M:%S').date()
-                
-                if week not in week_ranges:
-                    week_ranges[week] = [date, date]  # [start_date, end_date]
-                else:
-                    week_ranges[week][0] = min(week_ranges[week][0], date)
-                    week_ranges[week][1] = max(week_ranges[week][1], date)
-
-        # Adjust the start and end dates for each week
-        sorted_weeks = sorted(week_ranges.keys())
-        for i in range(len(sorted_weeks)):
-            current_week = sorted_weeks[i]
-            
-            # Set end date (no change needed, it's already the last game day of the week)
-            
-            # Set start date (except for week 1)
-            if i > 0:
-                previous_week = sorted_weeks[i-1]
-                week_ranges[current_week][0] = week_ranges[previous_week][1] + timedelta(days=1)
+        return self.schedule.week_ranges(self.schedule.today().season)
 
-        return week_ranges
+    def flush(self):
+        """Write every pending cache change to disk now."""
+        self.cache_store.flush()
 
-    def load_cache(self, filename="api_cache.json"):
-        if os.path.exists(filename):
-            with open(filename, 'r') as f:
-                self.cache = json.load(f)
+    def close(self):
+        self.cache_store.close()
+        self._scored_stats.clear()
+        self._stat_matrices.clear()
+        if self._player_db is not None:
+            self._player_db.close()
+            self._player_db = None
 
-    def save_cache(self, filename="api_cache.json"):
-        with open(filename, 'w') as f:
-            json.dump(self.cache, f, default=lambda o: vars(o) if hasattr(o, '__dict__') else str(o))
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @contextmanager
+    def offline(self):
+        """
+        Serve every call from the caches, however old the entries are. Anything that is not
+        cached raises SleeperAPIException instead of going to the network.
+
+            with client.offline():
+                matchups = client.get_matchups(league_id, week)
+        """
+        transport, cache_policies = self.transport, self.cache_policies
+        self.transport = OfflineTransport()
+        self.cache_policies = {family: FreshnessPolicy() for family in cache_policies}
+        try:
+            yield self
+        finally:
+            self.transport, self.cache_policies = transport, cache_policies
+
+    def save_cache(self):
+        self.cache.save()
 
     def clear_cache(self):
-        self.cache = {}
-        self.stats_cache = {}
-        self.projections_cache = {}
-        self.matchups_cache = {}
-        self.save_cache()
-        self.save_stats_cache()
-        self.save_projections_cache()
-        self.save_matchups_cache()
+        for table in (self.cache, self.raw_stats_cache, self.projections_cache, self.matchups_cache):
+            table.clear()
+        self._scored_stats.clear()
+        self._stat_matrices.clear()
+        self.flush()
 
     def get_stats(self, year: int, week: int, position: str, league_id: str) -> Dict[str, PlayerStats]:
-        cache_key = f"{year}_{week}_{position}_{league_id}"
-        if cache_key in self.stats_cache:
-            print(f"Debug: Using cached stats for {cache_key}")
-            return self.stats_cache[cache_key]
-
-        print(f"Debug: Fetching stats for {cache_key}")
-        url = f"{self.BASE_URL}/stats/nfl/{year}/{week}?season_type=regular&position[]={position}"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
+        """
+        One week of stats for a position, scored with the league's scoring_settings.
+
+        The raw stat lines are fetched and cached once per (year, week, position) and shared
+        by every league. Scoring happens on demand and is memoized per scoring profile, so
+        leagues with the same settings share the result and changed settings need no refetch.
+        """
+        raw_stats = self.get_raw_stats(year, week, position)
+        return self._score_cached(f"{year}_{week}_{position}", raw_stats, self.scoring_settings.get(league_id, {}))
+
+    def get_raw_stats(self, year: int, week: int, position: str) -> Dict[str, Dict[str, float]]:
+        """Unscored stat lines of one week and position, keyed by player ID."""
+        cache_key = f"{year}_{week}_{position}"
+        cached_stats = self._get_cached_raw_stats(year, week, position)
+        if cached_stats is not None:
+            self.tracer.debug("stats_cache_hit", key=cache_key)
+            return cached_stats
+
+        self.tracer.debug("stats_fetch", key=cache_key)
+        with self.tracer.span("fetch", call="get_raw_stats", key=cache_key):
+            url = self._stats_url(year, week, position)
+            response = self.transport.get(url)
+            response.raise_for_status()
+            data = response.json()
+
+        with self.tracer.span("parse", call="get_raw_stats", key=cache_key):
+            raw_stats = self._parse_raw_stats(data)
+        self.raw_stats_cache[cache_key] = raw_stats
+        return raw_stats
+
+    def _get_cached_raw_stats(self, year: int, week: int, position: str) -> Optional[Dict[str, Dict[str, float]]]:
+        cache_key = f"{year}_{week}_{position}"
+        if cache_key in self.raw_stats_cache and self._is_fresh(
+                'stats', self.raw_stats_cache, cache_key, year=year, week=week,
+                current_year=self.get_current_season_year(), current_week=self.get_current_week()):
+            return self.raw_stats_cache[cache_key]
+        return None
+
+    def _stats_url(self, year: int, week: int, position: str) -> str:
+        return f"{self.BASE_URL}/stats/nfl/{year}/{week}?season_type=regular&position[]={position}"
+
+    @staticmethod
+    def _parse_raw_stats(data: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+        return {player_id: item.get('stats', {}) for player_id, item in data.items()}
+
+    def _score_cached(self, cache_key: str, raw_stats: Dict[str, Dict[str, float]],
+                      scoring_settings: Dict[str, float]) -> Dict[str, PlayerStats]:
+        memo_key = (cache_key, tuple(sorted(scoring_settings.items())))
+        memo = self._scored_stats.get(memo_key)
+        # A refetch replaces the raw dict, which makes the memoized scores stale
+        if memo is not None and memo[0] is raw_stats:
+            return memo[1]
+        with self.tracer.span("score", call="get_stats", key=cache_key):
+            stats = self.score_stats(raw_stats, scoring_settings, cache_key)
+        self._scored_stats[memo_key] = (raw_stats, stats)
+        return stats
+
+    def score_stats(self, raw_stats: Dict[str, Dict[str, float]], scoring_settings: Dict[str, float],
+                    cache_key: Optional[str] = None) -> Dict[str, PlayerStats]:
+        """
+        Score raw stat lines (as returned by get_raw_stats) with a scoring_settings dict.
+
+        With numpy installed the lines are scored as one matrix-vector product (see
+        scoring_engine). For a week from raw_stats_cache, pass its cache_key: the stat matrix
+        is then built once and reused by every other scoring profile.
+
+        Args:
+            raw_stats (Dict[str, Dict[str, float]]): Stat lines keyed by player ID
+            scoring_settings (Dict[str, float]): Points per unit of each stat, as in League.scoring_settings
+            cache_key (str): The "{year}_{week}_{position}" key of raw_stats, if it came from the cache
 
+        Returns:
+            Dict[str, PlayerStats]: Scored stats keyed by player ID
+        """
         stats = {}
-        scoring_settings = self.scoring_settings.get(league_id, {})
+        trace_players = self.tracer.enabled(DEBUG)
 
-        for player_id, item in data.items():
-            player_stats = item.get('stats', {})
-            fantasy_points = self._calculate_fantasy_points(player_stats, scoring_settings)
+        for (player_id, player_stats), fantasy_points in zip(raw_stats.items(), self._fantasy_points(raw_stats, scoring_settings, cache_key)):
             stats[player_id] = PlayerStats(
                 player_id=player_id,
                 fantasy_points=fantasy_points,
-                **player_stats
+                **{stat: value for stat, value in player_stats.items() if stat in PLAYER_STAT_FIELDS}
             )
-            print(f"Debug: Player {player_id} - Fantasy Points: {fantasy_points}")
+            if trace_players:
+                self.tracer.debug("player_fantasy_points", player_id=player_id, fantasy_points=fantasy_points)
 
-        self.stats_cache[cache_key] = stats
-        self.save_stats_cache()
         return stats
 
+    def _fantasy_points(self, raw_stats: Dict[str, Dict[str, float]], scoring_settings: Dict[str, float],
+                        cache_key: Optional[str] = None) -> List[float]:
+        try:
+            # numpy is optional; without it each stat line is scored in Python
+            from scoring_engine import ScoringProfile, StatMatrix, score_matrix
+        except ImportError:
+            return [self._calculate_fantasy_points(player_stats, scoring_settings) for player_stats in raw_stats.values()]
+        profile = ScoringProfile(scoring_settings)
+        if cache_key is None:
+            matrix = StatMatrix.from_raw(raw_stats, profile.stat_keys)
+        else:
+            memo = self._stat_matrices.get(cache_key)
+            if memo is None or memo[0] is not raw_stats:
+                memo = self._stat_matrices[cache_key] = (raw_stats, StatMatrix.from_raw(raw_stats))
+            matrix = memo[1]
+        return score_matrix(matrix, [profile])[:, 0].tolist()
+
     def _calculate_fantasy_points(self, player_stats: Dict[str, float], scoring_settings: Dict[str, float]) -> float:
         fantasy_points = 0
         for stat, value in player_stats.items():
@@ -428,43 +828,22 @@ class SleeperAPI:
                 fantasy_points += value * scoring_settings[stat]
         return fantasy_points
 
-    def load_stats_cache(self, filename="stats_cache.json"):
-        if os.path.exists(filename):
-            with open(filename, 'r') as f:
-                data = json.load(f)
-                return {k: {player_id: PlayerStats(**stats) for player_id, stats in v.items()} for k, v in data.items()}
-        return {}
+    def save_stats_cache(self):
+        self.raw_stats_cache.save()
 
-    def save_stats_cache(self, filename="stats_cache.json"):
-        with open(filename, 'w') as f:
-            json.dump(self.stats_cache, f, cls=CustomJSONEncoder)
+    def save_projections_cache(self):
+        self.projections_cache.save()
 
-    def load_projections_cache(self, filename="projections_cache.json"):
-        if os.path.exists(filename):
-            with open(filename, 'r') as f:
-                data = json.load(f)
-                return {k: [self._reconstruct_player_projection(p) for p in v] for k, v in data.items()}
-        return {}
+    def save_matchups_cache(self):
+        self.matchups_cache.save()
 
-    def save_projections_cache(self, filename="projections_cache.json"):
-        with open(filename, 'w') as f:
-            json.dump(self.projections_cache, f, cls=CustomJSONEncoder)
+    def _decode_projections(self, data: List[Dict[str, Any]]) -> List[PlayerProjection]:
+        return [self._reconstruct_player_projection(p) for p in data]
 
-    def load_matchups_cache(self, filename="matchups_cache.json"):
-        if os.path.exists(filename):
-            with open(filename, 'r') as f:
-                serialized_cache = json.load(f)
-                return {key: [Matchup(**matchup_data) for matchup_data in matchups]
-                        for key, matchups in serialized_cache.items()}
-        return {}
-
-    def save_matchups_cache(self, filename="matchups_cache.json"):
-        serializable_cache = {}
-        for key, matchups in self.matchups_cache.items():
-            serializable_cache[key] = [matchup.__dict__ for matchup in matchups]
-        
-        with open(filename, 'w') as f:
-            json.dump(serializable_cache, f)
+    def _decode_matchups(self, data: List[Dict[str, Any]]) -> List[Matchup]:
+        if self.views:
+            return [MatchupView(matchup_data) for matchup_data in data]
+        return [Matchup(**matchup_data) for matchup_data in data]
 
     def _reconstruct_player_projection(self, data):
         return PlayerProjection(
@@ -489,8 +868,11 @@ class SleeperAPI:
         url = f"{self.BASE_URL}/league/{league_id}/transactions/{week}"
         
         try:
-            response = requests.get(url)
+            response = self.transport.get(url)
             response.raise_for_status()
-            return response.json()
+            data = response.json()
         except requests.RequestException as e:
             raise SleeperAPIException(f"Error fetching league transactions: {str(e)}")
+        if self.views:
+            return [TransactionView(transaction) for transaction in data]
+        return data
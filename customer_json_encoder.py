@@ -1,7 +1,13 @@
 import json
+from dataclasses import fields
 from json import JSONEncoder
 
-from models import PlayerInfo, PlayerProjection, PlayerStats, ProjectedStats
+from model_views import ModelView
+from models import Matchup, PlayerInfo, PlayerProjection, PlayerStats, ProjectedStats
+
+def _field_values(obj):
+    # The slotted models have no __dict__
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
 
 class CustomJSONEncoder(JSONEncoder):
     def default(self, obj):
@@ -23,7 +29,11 @@ class CustomJSONEncoder(JSONEncoder):
                 'injury_status': obj.injury_status
             }
         elif isinstance(obj, ProjectedStats):
-            return obj.__dict__
+            return _field_values(obj)
         elif isinstance(obj, PlayerStats):
-            return obj.__dict__
+            return _field_values(obj)
+        elif isinstance(obj, Matchup):
+            return _field_values(obj)
+        elif isinstance(obj, ModelView):
+            return obj.to_dict()
         return super().default(obj)
\ No newline at end of file
@@ -1,6 +1,7 @@
 import requests
 
 from exceptions import SleeperAPIException
+from http_transport import get_default_transport
 from models import PlayerProp, Transaction
 
 
@@ -8,6 +9,11 @@ class DraftKingsAPI:
     BASE_URL = "https://sportsbook-nash.draftkings.com/api/sportscontent/dkusnj/v1"
     _subcategories = None  # Class variable to store subcategories
     PLAYER_STATS_CATEGORY_ID = 782  # Fixed category ID for player stats
+    transport = None  # HttpTransport to use instead of the shared default
+
+    @classmethod
+    def _get(cls, url, headers):
+        return (cls.transport or get_default_transport()).get(url, headers=headers)
 
     @staticmethod
     def get_nfl_player_props(week, prop_type):
@@ -22,7 +28,7 @@ class DraftKingsAPI:
         }
 
         try:
-            response = requests.get(url, headers=headers)
+            response = DraftKingsAPI._get(url, headers)
             response.raise_for_status()
             data = response.json()
             
@@ -49,7 +55,7 @@ class DraftKingsAPI:
         }
 
         try:
-            response = requests.get(url, headers=headers)
+            response = cls._get(url, headers)
             response.raise_for_status()
             data = response.json()
             
@@ -105,7 +111,7 @@ class DraftKingsAPI:
         }
 
         try:
-            response = requests.get(url, headers=headers)
+            response = DraftKingsAPI._get(url, headers)
             response.raise_for_status()
             data = response.json()
             
@@ -159,7 +165,7 @@ class DraftKingsAPI:
         }
 
         try:
-            response = requests.get(url, headers=headers)
+            response = cls._get(url, headers)
             response.raise_for_status()
             data = response.json()
             
@@ -0,0 +1,57 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+PickKey = Tuple[str, int, int]
+
+
+class DraftPickIndex:
+    """
+    Ownership of traded draft picks across a league's previous_league_id chain.
+
+    Built from the traded_picks responses, newest season first, as returned by
+    SleeperAPI.get_all_traded_picks. Every season of the chain lists the future picks
+    traded so far, so the same pick can appear more than once; the newest listing wins.
+    Picks are keyed by (season, round, original roster_id) and by (season, round,
+    current owner_id). Each pick dict has the fields Sleeper returns: season, round,
+    roster_id (original owner), previous_owner_id and owner_id (current owner).
+
+    Only traded picks are indexed. A pick that was never traded belongs to its original
+    roster, and the lookups below return that roster.
+    """
+
+    def __init__(self, traded_picks: Iterable[Dict[str, Any]]):
+        self.by_original: Dict[PickKey, Dict[str, Any]] = {}
+        self.by_owner: Dict[PickKey, List[Dict[str, Any]]] = {}
+        self._owned: Dict[int, List[Dict[str, Any]]] = {}
+        for pick in traded_picks:
+            key = (str(pick['season']), pick['round'], pick['roster_id'])
+            if key in self.by_original:
+                continue
+            self.by_original[key] = pick
+            self.by_owner.setdefault((key[0], key[1], pick['owner_id']), []).append(pick)
+            self._owned.setdefault(pick['owner_id'], []).append(pick)
+
+    def __len__(self) -> int:
+        return len(self.by_original)
+
+    def original_owner(self, season: str, round: int, owner_id: int) -> int:
+        """Original roster of a pick owner_id holds in that season and round, or owner_id if it holds its own."""
+        picks = self.by_owner.get((str(season), round, owner_id))
+        return picks[0]['roster_id'] if picks else owner_id
+
+    def current_owner(self, season: str, round: int, roster_id: int) -> int:
+        """Roster that now holds roster_id's pick for that season and round."""
+        pick = self.by_original.get((str(season), round, roster_id))
+        return pick['owner_id'] if pick else roster_id
+
+    def picks_owned_by(self, owner_id: int, season: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Traded picks owner_id currently holds, including any of its own that came back to it."""
+        picks = self._owned.get(owner_id, [])
+        if season is not None:
+            picks = [pick for pick in picks if pick['season'] == str(season)]
+        return picks
+
+    def picks_traded_away(self, roster_id: int, season: Optional[str] = None) -> List[Dict[str, Any]]:
+        """roster_id's own picks that another roster now holds."""
+        return [pick for (pick_season, _, original), pick in self.by_original.items()
+                if original == roster_id and pick['owner_id'] != roster_id
+                and (season is None or pick_season == str(season))]
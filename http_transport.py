@@ -0,0 +1,156 @@
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from exceptions import SleeperAPIException
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+def _counting_pool_class(base, on_new_connection):
+    class CountingConnectionPool(base):
+        def _new_conn(self):
+            on_new_connection(self.host)
+            return super()._new_conn()
+
+    return CountingConnectionPool
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools report every new connection they open."""
+
+    def __init__(self, on_new_connection, **kwargs):
+        self._on_new_connection = on_new_connection
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _counting_pool_class(HTTPConnectionPool, self._on_new_connection),
+            'https': _counting_pool_class(HTTPSConnectionPool, self._on_new_connection),
+        }
+
+
+class HttpTransport:
+    """
+    Pooled keep-alive HTTP transport shared by SleeperAPI, SleeperProjections and DraftKingsAPI.
+
+    Every request goes through one requests.Session, so connections to the same host are
+    kept alive and reused instead of paying a fresh TCP+TLS handshake per call.
+    Any object with a compatible get() method can be injected in its place.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 20,
+                 timeout: Optional[Timeout] = (5.0, 30.0), max_retries: int = 0,
+                 headers: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            pool_connections (int): Number of per-host connection pools to keep
+            pool_maxsize (int): Maximum number of connections kept alive per host
+            timeout (float | tuple): Default (connect, read) timeout in seconds
+            max_retries (int): Retries for failed connections
+            headers (Dict[str, str]): Headers sent with every request
+        """
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.session = requests.Session()
+        self._adapter = _CountingAdapter(self._record_connection,
+                                         pool_connections=pool_connections,
+                                         pool_maxsize=pool_maxsize,
+                                         max_retries=max_retries)
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+        self._lock = threading.Lock()
+        self._requests: Dict[str, int] = {}
+        self._connections: Dict[str, int] = {}
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            params: Optional[Dict[str, Any]] = None,
+            timeout: Optional[Timeout] = None) -> requests.Response:
+        response = self.session.get(url, headers=headers, params=params,
+                                    timeout=timeout if timeout is not None else self.timeout)
+        self._record_request(url)
+        return response
+
+    def _record_request(self, url: str):
+        host = urlsplit(url).hostname
+        with self._lock:
+            self._requests[host] = self._requests.get(host, 0) + 1
+
+    def _record_connection(self, host: str):
+        with self._lock:
+            self._connections[host] = self._connections.get(host, 0) + 1
+
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Per-host connection reuse statistics.
+
+        Returns:
+            Dict[str, Dict[str, int]]: For each host, the number of requests made, connections
+            opened (handshakes paid) and requests served over an already-open connection
+        """
+        with self._lock:
+            return {
+                host: {
+                    'requests': count,
+                    'connections': self._connections.get(host, 0),
+                    'reused': count - self._connections.get(host, 0),
+                }
+                for host, count in self._requests.items()
+            }
+
+    def print_connection_stats(self):
+        print("Host|Requests|Connections|Reused")
+        for host, stats in sorted(self.connection_stats().items()):
+            print(f"{host}|{stats['requests']}|{stats['connections']}|{stats['reused']}")
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class OfflineTransport:
+    """Transport for cache-only runs: every request fails instead of reaching the network."""
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            params: Optional[Dict[str, Any]] = None,
+            timeout: Optional[Timeout] = None) -> requests.Response:
+        raise SleeperAPIException(f"Offline: {url} is not cached")
+
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        return {}
+
+    def close(self):
+        pass
+
+
+_default_transport: Optional[HttpTransport] = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> HttpTransport:
+    """Return the process-wide transport used by clients that were not given one."""
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport()
+        return _default_transport
+
+
+def set_default_transport(transport: HttpTransport):
+    """Replace the process-wide transport, e.g. with one using a larger pool."""
+    global _default_transport
+    with _default_transport_lock:
+        _default_transport = transport
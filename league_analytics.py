@@ -1,34 +1,94 @@
-from typing import List, Dict, Tuple, Any
+from typing import TYPE_CHECKING, List, Dict, Iterable, Tuple, Any, Optional
 from exceptions import SleeperAPIException
 from models import League, Team, Matchup, PlayerStats
+from best_ball import LineupOptimizer, decode_week_results, matchups_digest, optimize_season
+from cache_policy import week_is_scored
+from cache_store import CacheTable
+from draft_picks import DraftPickIndex
+from rescoring import rescore_matchups, scoring_delta, standings_diff
+from standings import OFFENSIVE_SLOTS, STANDINGS_FIELDS, StandingsAccumulator, opponents, standings_key, week_standings
 from client import SleeperAPI
+from tracing import DEBUG
+from customer_json_encoder import CustomJSONEncoder
 from datetime import datetime, time
+from concurrent.futures import ThreadPoolExecutor
 import csv
 import json
 import os
 
+if TYPE_CHECKING:
+    from matchup_frame import MatchupFrame
+
 class LeagueAnalytics:
     def __init__(self, client: SleeperAPI):
         self.client = client
         self.valid_positions = ["QB", "RB", "WR", "TE","K","DB","LB","DE","DL","DT","CB","S"]
         self.defensive_positions = ["DB", "LB", "DE", "DL", "DT", "CB", "S"]
         self.stats_cache = {}
-        self.current_year = self.client.get_current_season_year()
-        self.current_week = self.client.get_current_week()
+        # Resolved from the schedule CSV on first use
+        self._current_year = None
+        self._current_week = None
         self.league_id = None  # Initialize league_id as None
-        self.traded_picks = {}
+        # league_id -> traded-pick ownership across the league's seasons, see get_draft_pick_index
+        self.draft_pick_indexes: Dict[str, DraftPickIndex] = {}
+        # Compiled best-ball layouts keyed by roster_positions
+        self._lineup_optimizers: Dict[Tuple[str, ...], LineupOptimizer] = {}
+        # Best-ball results per (league_id, week), see _best_ball_season. Finished weeks are also
+        # written to the client's cache store so later runs skip them
+        self._best_ball_weeks: Dict[Tuple[str, int], Tuple[Any, Dict[str, Any]]] = {}
+        self.best_ball_cache = CacheTable(client.cache_store, 'best_ball', decode=decode_week_results)
+        # league_id -> standings folded so far, persisted in the 'standings' cache table
+        self._standings: Dict[str, StandingsAccumulator] = {}
+        self.standings_cache = CacheTable(client.cache_store, 'standings')
+
+    @property
+    def current_year(self) -> int:
+        if self._current_year is None:
+            self._current_year = self.client.get_current_season_year()
+        return self._current_year
+
+    @current_year.setter
+    def current_year(self, year: int):
+        self._current_year = year
+
+    @property
+    def current_week(self) -> int:
+        if self._current_week is None:
+            self._current_week = self.client.get_current_week()
+        return self._current_week
+
+    @current_week.setter
+    def current_week(self, week: int):
+        self._current_week = week
+
+    def get_matchup_frame(self, league_id: str, weeks: Optional[Iterable[int]] = None) -> 'MatchupFrame':
+        """
+        Load a season of matchups into a columnar MatchupFrame (requires numpy).
+
+        Args:
+            league_id (str): The league ID
+            weeks (Iterable[int]): Weeks to include; defaults to the league's start week through last week
+
+        Returns:
+            MatchupFrame: One row per (week, roster, player) with positions joined from the players table
+        """
+        # numpy is only needed for the columnar helpers, so it is imported on use
+        from matchup_frame import MatchupFrame
+
+        if weeks is None:
+            league = self.client.get_league(league_id)
+            weeks = range(league.settings.start_week, self.current_week)
+        matchups_by_week = {week: self.client.get_matchups(league_id, week) for week in weeks}
+        return MatchupFrame.from_matchups(matchups_by_week, self.client.get_player_position)
 
     def get_top_half_scorers(self, league_id: str, week: int) -> List[Dict[str, any]]:
-        league = self.client.get_league(league_id, fetch_all=True)
+        directory = self.client.get_league_directory(league_id)
         matchups = self.client.get_matchups(league_id, week)
         
-        # Create a dictionary of team names keyed by roster_id
-        team_dict = {team.roster.roster_id: team.display_name for team in league.teams if team.roster}
-        
         # Collect all scores for the week
         scores = []
         for matchup in matchups:
-            team_name = team_dict.get(matchup.roster_id, f"Team {matchup.roster_id}")
+            team_name = directory.display_name(matchup.roster_id, f"Team {matchup.roster_id}")
             scores.append({
                 "team_name": team_name,
                 "points": matchup.points,
@@ -54,121 +114,129 @@ class LeagueAnalytics:
                 print(f"{week}|{scorer['team_name']}|{scorer['points']:.2f}")
 
     def _calculate_best_ball_points(self, players_points: Dict[str, float], roster_positions: List[str]) -> Tuple[float, List[Dict[str, any]]]:
-        print("Debug: Entering _calculate_best_ball_points method")
-        for player_id, points in players_points.items():
-            player_name = self.client.get_player_name(player_id)
-            player_position = self.client.get_player_position(player_id)
-            print(f"Player: {player_name} ({player_position}) - ID: {player_id}, Points: {points}")
-        print("---")
-
-        position_players = {pos: [] for pos in self.valid_positions + ["FLEX", "SUPER_FLEX", "IDP_FLEX"]}
-        
-        for player_id, points in players_points.items():
-            position = self.client.get_player_position(player_id)
-            if position in self.valid_positions:
-                position_players[position].append({"id": player_id, "points": points, "position": position})
-        
-        for pos in position_players:
-            position_players[pos].sort(key=lambda x: x["points"], reverse=True)
-            # print(f"Debug: Sorted {pos} players: {position_players[pos]}")
-        
-        best_lineup = []
-        total_points = 0
-        
-        def add_to_lineup(pos):
-            nonlocal total_points
-            if position_players[pos]:
-                player = position_players[pos].pop(0)
-                best_lineup.append({"position": pos, "player": player})
-                total_points += player["points"]
-                player_name = self.client.get_player_name(player['id'])
-                print(f"Debug: Added {pos}: {player_name} (ID: {player['id']}) with {player['points']} points")
-                return True
-            return False
-        
-        # Fill standard positions first
-        for pos in roster_positions:
-            if pos in self.valid_positions:
-                add_to_lineup(pos)
-        
-        # Handle FLEX spots
-        flex_positions = ["RB", "WR", "TE"]
-        for pos in roster_positions:
-            if pos == "FLEX":
-                flex_options = [player for pos in flex_positions for player in position_players[pos]]
-                if flex_options:
-                    best_flex = max(flex_options, key=lambda x: x["points"])
-                    best_lineup.append({"position": "FLEX", "player": best_flex})
-                    total_points += best_flex["points"]
-                    position_players[best_flex["position"]].remove(best_flex)
-                    player_name = self.client.get_player_name(best_flex['id'])
-                    print(f"Debug: Added FLEX: {player_name} (ID: {best_flex['id']}) with {best_flex['points']} points")
-        
-        # Handle SUPER_FLEX spots
-        superflex_positions = ["QB", "RB", "WR", "TE"]
-        for pos in roster_positions:
-            if pos == "SUPER_FLEX":
-                superflex_options = [player for pos in superflex_positions for player in position_players[pos]]
-                if superflex_options:
-                    best_superflex = max(superflex_options, key=lambda x: x["points"])
-                    best_lineup.append({"position": "SUPER_FLEX", "player": best_superflex})
-                    total_points += best_superflex["points"]
-                    position_players[best_superflex["position"]].remove(best_superflex)
-                    player_name = self.client.get_player_name(best_superflex['id'])
-                    print(f"Debug: Added SUPER_FLEX: {player_name} (ID: {best_superflex['id']}) with {best_superflex['points']} points")
-
-        # Handle IDP_FLEX spots
-        for pos in roster_positions:
-            if pos == "IDP_FLEX":
-                idp_options = [player for pos in self.defensive_positions for player in position_players[pos]]
-                if idp_options:
-                    best_idp = max(idp_options, key=lambda x: x["points"])
-                    best_lineup.append({"position": "IDP_FLEX", "player": best_idp})
-                    total_points += best_idp["points"]
-                    position_players[best_idp["position"]].remove(best_idp)
-                    player_name = self.client.get_player_name(best_idp['id'])
-                    print(f"Debug: Added IDP_FLEX: {player_name} (ID: {best_idp['id']}) with {best_idp['points']} points")
-        
-        print(f"Debug: Total Best Ball Points: {total_points}")
-        print("Debug: Best Lineup:")
-        for slot in best_lineup:
-            player = slot['player']
-            player_name = self.client.get_player_name(player['id'])
-            print(f"{slot['position']}: {player_name} - {player['points']:.2f}")
-        print("---")
+        return self._lineup_optimizer(roster_positions).optimize(players_points, self.client.get_player_position)
+
+    def _lineup_optimizer(self, roster_positions: List[str]) -> LineupOptimizer:
+        key = tuple(roster_positions)
+        optimizer = self._lineup_optimizers.get(key)
+        if optimizer is None:
+            optimizer = self._lineup_optimizers[key] = LineupOptimizer(roster_positions, self.valid_positions)
+        return optimizer
+
+    def _best_ball_week(self, league_id: str, week: int, roster_positions: List[str],
+                        matchups: List[Matchup]) -> Dict[int, Tuple[float, List[Dict[str, Any]]]]:
+        """Best-ball (points, lineup) per roster_id for one week; see _best_ball_season."""
+        return self._best_ball_season(league_id, roster_positions, {week: matchups})[week]
+
+    def _best_ball_season(self, league_id: str, roster_positions: List[str],
+                          matchups_by_week: Dict[int, List[Matchup]]) -> Dict[int, Dict[int, Tuple[float, List[Dict[str, Any]]]]]:
+        """
+        Best-ball (points, lineup) keyed by week, then roster_id, each week computed at most
+        once per roster_positions layout and matchup data.
 
-        return total_points, best_lineup
+        Results are checked against a digest of the matchups' players_points, so a stat
+        correction triggers a recompute. The weeks that need computing are optimized together
+        by best_ball.optimize_season. Weeks whose scoring is final are persisted in the
+        'best_ball' cache table.
+        """
+        tracer = self.client.tracer
+        results = {}
+        # week -> digest of the matchups to optimize
+        stale: Dict[int, str] = {}
+        for week, matchups in matchups_by_week.items():
+            memo_key = (league_id, week)
+            memo = self._best_ball_weeks.get(memo_key)
+            # The client hands back the same list until the week is refetched
+            if memo is not None and memo[0] is matchups and memo[1]['roster_positions'] == roster_positions:
+                results[week] = memo[1]['lineups']
+                continue
 
-    def get_best_ball_scores(self, league_id: str, week: int) -> List[Dict[str, any]]:
-        league = self.client.get_league(league_id, fetch_all=True)
-        matchups = self.client.get_matchups(league_id, week)
+            digest = matchups_digest(matchups)
+            entry = memo[1] if memo is not None else self.best_ball_cache.get(f"{league_id}_{week}")
+            if entry is None or entry['digest'] != digest or entry['roster_positions'] != roster_positions:
+                stale[week] = digest
+                continue
+            tracer.debug("best_ball_cache_hit", league_id=league_id, week=week)
+            self._best_ball_weeks[memo_key] = (matchups, entry)
+            results[week] = entry['lineups']
+
+        if stale:
+            computed = optimize_season({week: matchups_by_week[week] for week in stale},
+                                       self._lineup_optimizer(roster_positions), self.client.get_player_position)
+            current_week = self.client.get_current_week()
+            season = self.client.get_league(league_id).season
+            current_year = self.client.get_current_season_year()
+            for week, lineups in computed.items():
+                tracer.debug("best_ball_computed", league_id=league_id, week=week)
+                matchups = matchups_by_week[week]
+                entry = {'roster_positions': list(roster_positions), 'digest': stale[week], 'lineups': lineups}
+                if week_is_scored(matchups, week=week, current_week=current_week,
+                                  season=season, current_year=current_year):
+                    self.best_ball_cache[f"{league_id}_{week}"] = entry
+                self._best_ball_weeks[(league_id, week)] = (matchups, entry)
+                results[week] = lineups
+        return {week: results[week] for week in matchups_by_week}
+
+    def get_best_ball_lineups(self, league_id: str, weeks: Optional[Iterable[int]] = None) -> Dict[int, Dict[int, Tuple[float, List[Dict[str, Any]]]]]:
+        """
+        Best-ball lineups for every roster in every week in one pass.
+
+        Args:
+            league_id (str): The league ID
+            weeks (Iterable[int]): Weeks to score; defaults to the league's start week through last week
+
+        Returns:
+            Dict[int, Dict[int, Tuple[float, List[Dict[str, Any]]]]]: (points, lineup) keyed by week, then roster_id
+        """
+        tracer = self.client.tracer
+        with tracer.span("fetch", call="get_best_ball_lineups", league_id=league_id):
+            league = self.client.get_league(league_id)
+            if weeks is None:
+                weeks = range(league.settings.start_week, self.current_week)
+            matchups_by_week = {week: self.client.get_matchups(league_id, week) for week in weeks}
+        with tracer.span("optimize", call="get_best_ball_lineups", league_id=league_id):
+            return self._best_ball_season(league_id, league.roster_positions, matchups_by_week)
+
+    def get_best_ball_scores(self, league_id: str, week: int, league: Optional[League] = None) -> List[Dict[str, any]]:
+        """
+        Args:
+            league_id (str): The league ID
+            week (int): The week to score
+            league (League): The league fetched with fetch_all=True, when the caller already has it
+        """
+        tracer = self.client.tracer
+        with tracer.span("fetch", call="get_best_ball_scores", league_id=league_id, week=week):
+            if league is None:
+                league = self.client.get_league(league_id, fetch_all=True)
+            matchups = self.client.get_matchups(league_id, week)
         
         self.current_year = int(league.season)
         self.current_week = week
         self.league_id = league_id
         
-        team_dict = {team.roster.roster_id: team for team in league.teams if team.roster}
+        directory = self.client.get_league_directory(league_id)
         
         best_ball_scores = []
-        for matchup in matchups:
-            team = team_dict.get(matchup.roster_id)
-            team_name = team.display_name if team else f"Team {matchup.roster_id}"
-            
-            # Calculate actual points
-            actual_points = sum(matchup.starters_points)
-            
-            # Calculate best ball points
-            best_ball_points, best_lineup = self._calculate_best_ball_points(matchup.players_points, league.roster_positions)
-            
-            best_ball_scores.append({
-                "week": week,
-                "team_name": team_name,
-                "actual_points": actual_points,
-                "best_ball_points": best_ball_points,
-                "roster_id": matchup.roster_id,
-                "best_lineup": best_lineup
-            })
-        
+        with tracer.span("optimize", call="get_best_ball_scores", league_id=league_id, week=week):
+            lineups = self._best_ball_week(league_id, week, league.roster_positions, matchups)
+            for matchup in matchups:
+                team_name = directory.display_name(matchup.roster_id, f"Team {matchup.roster_id}")
+
+                # Calculate actual points
+                actual_points = sum(matchup.starters_points)
+
+                # Calculate best ball points
+                best_ball_points, best_lineup = lineups[matchup.roster_id]
+
+                best_ball_scores.append({
+                    "week": week,
+                    "team_name": team_name,
+                    "actual_points": actual_points,
+                    "best_ball_points": best_ball_points,
+                    "roster_id": matchup.roster_id,
+                    "best_lineup": best_lineup
+                })
+
         return best_ball_scores
 
     def get_team_best_ball(self, league_id: str, team_name: str, week: int) -> Dict[str, any]:
@@ -200,8 +268,16 @@ class LeagueAnalytics:
             print(f"{team['team_name']}|{team['total_best_ball_points']:.2f}|{team['total_actual_points']:.2f}|{team['total_offensive_best_ball_points']:.2f}|{team['wins']}|{team['half_wins']:.1f}|{original_draft_team}|{current_owner}")
 
     def get_season_best_ball_total(self, league_id: str) -> Dict[str, List[Dict[str, any]]]:
+        tracer = self.client.tracer
         self.league_id = league_id  # Set the league_id
-        league = self.client.get_league(league_id, fetch_all=True)
+        with tracer.span("fetch", call="get_season_best_ball_total", league_id=league_id):
+            league = self.client.get_league(league_id, fetch_all=True)
+            current_week = self.client.get_current_week()
+            start_week = league.settings.start_week
+            matchups_by_week = {week: self.client.get_matchups(league_id, week) for week in range(start_week, current_week)}
+            draft_picks = self.get_draft_pick_index(league_id)
+        current_year = str(self.client.get_current_season_year())
+        directory = self.client.get_league_directory(league_id)
         team_totals = {team.roster.roster_id: {
             'team_name': team.display_name,
             'total_best_ball_points': 0,
@@ -212,72 +288,65 @@ class LeagueAnalytics:
             'weekly_scores': []
         } for team in league.teams if team.roster}
 
-        current_week = self.client.get_current_week()
-        start_week = league.settings.start_week
+        with tracer.span("optimize", call="get_season_best_ball_total", league_id=league_id):
+            lineups = self._best_ball_season(league_id, league.roster_positions, matchups_by_week)
 
-        for week in range(start_week, current_week):
-            print(f"\nWeek {week}")
-            matchups = self.client.get_matchups(league_id, week)
-            
-            # Calculate half wins for the week
-            week_scores = [(matchup.roster_id, sum(matchup.starters_points)) for matchup in matchups]
-            week_scores.sort(key=lambda x: x[1], reverse=True)
-            half_win_threshold = len(week_scores) // 2
-            
-            for idx, (roster_id, score) in enumerate(week_scores):
-                if idx < half_win_threshold:
-                    team_totals[roster_id]['half_wins'] += 0.5
+        with tracer.span("aggregate", call="get_season_best_ball_total", league_id=league_id):
+            for week, matchups in matchups_by_week.items():
+                # Calculate half wins for the week
+                week_scores = [(matchup.roster_id, sum(matchup.starters_points)) for matchup in matchups]
+                week_scores.sort(key=lambda x: x[1], reverse=True)
+                half_win_threshold = len(week_scores) // 2
 
-            for matchup in matchups:
-                print(f"\nTeam: {team_totals[matchup.roster_id]['team_name']}")
-                for player_id, points in matchup.players_points.items():
-                    player_name = self.client.get_player_name(player_id)
-                    player_position = self.client.get_player_position(player_id)
-                    print(f"Player: {player_name} ({player_position}) - ID: {player_id}, Points: {points}")
-                print("---")
-                
-                best_ball_points, best_lineup = self._calculate_best_ball_points(matchup.players_points, league.roster_positions)
-                actual_points = self._calculate_actual_points(matchup.players_points, matchup.starters)
-                offensive_best_ball_points = self._calculate_offensive_best_ball_points(best_lineup)
-                team_data = team_totals[matchup.roster_id]
-                team_data['total_best_ball_points'] += best_ball_points
-                team_data['total_actual_points'] += actual_points
-                team_data['total_offensive_best_ball_points'] += offensive_best_ball_points
-                
-                # Add draft pick information
-                current_year = self.client.get_current_season_year()
-                original_owner_id = self.get_original_draft_team(league_id, matchup.roster_id, 1, str(current_year))
-                original_owner = next((team for team in league.teams if team.roster and team.roster.roster_id == original_owner_id), None)
-                original_owner_name = original_owner.display_name if original_owner else f"Unknown (ID: {original_owner_id})"
-                current_owner = next((team for team in league.teams if team.roster and team.roster.roster_id == matchup.roster_id), None)
-                current_owner_name = current_owner.display_name if current_owner else f"Unknown (ID: {matchup.roster_id})"
+                for idx, (roster_id, score) in enumerate(week_scores):
+                    if idx < half_win_threshold:
+                        team_totals[roster_id]['half_wins'] += 0.5
 
-                team_data['weekly_scores'].append({
-                    'week': week,
-                    'best_ball_points': best_ball_points,
-                    'actual_points': actual_points,     
-                    'offensive_best_ball_points': offensive_best_ball_points,
-                    'original_draft_team': original_owner_name,
-                    'current_owner': current_owner_name
-                })
-                
-                # Calculate head-to-head win
-                opponent = next((m for m in matchups if m.matchup_id == matchup.matchup_id and m.roster_id != matchup.roster_id), None)
-                if opponent and actual_points > sum(opponent.starters_points):
-                    team_data['wins'] += 1
-                
-                print(f"Weekly Best Ball Points: {best_ball_points:.2f}")
-                print(f"Weekly Actual Points: {actual_points:.2f}")
-                print(f"Weekly Offensive Best Ball Points: {offensive_best_ball_points:.2f}")
-                print(f"Cumulative Best Ball Points: {team_data['total_best_ball_points']:.2f}")
-                print(f"Cumulative Actual Points: {team_data['total_actual_points']:.2f}")
-                print(f"Cumulative Offensive Best Ball Points: {team_data['total_offensive_best_ball_points']:.2f}")
-                print(f"Wins: {team_data['wins']}, Half Wins: {team_data['half_wins']:.1f}")
-                print("Best Ball Lineup:")
-                for slot in best_lineup:
-                    player = slot['player']
-                    player_name = self.client.get_player_name(player['id'])
-                    print(f"{slot['position']}: {player_name} - {player['points']:.2f}")
+                paired = opponents(matchups)
+                for matchup in matchups:
+                    if tracer.enabled(DEBUG):
+                        for player_id, points in matchup.players_points.items():
+                            tracer.debug("player_points", week=week, team=team_totals[matchup.roster_id]['team_name'],
+                                         player=self.client.get_player_name(player_id),
+                                         position=self.client.get_player_position(player_id),
+                                         player_id=player_id, points=points)
+
+                    best_ball_points, best_lineup = lineups[week][matchup.roster_id]
+                    actual_points = self._calculate_actual_points(matchup.players_points, matchup.starters)
+                    offensive_best_ball_points = self._calculate_offensive_best_ball_points(best_lineup)
+                    team_data = team_totals[matchup.roster_id]
+                    team_data['total_best_ball_points'] += best_ball_points
+                    team_data['total_actual_points'] += actual_points
+                    team_data['total_offensive_best_ball_points'] += offensive_best_ball_points
+
+                    # Add draft pick information
+                    original_owner_id = draft_picks.original_owner(current_year, 1, matchup.roster_id)
+                    original_owner_name = directory.display_name(original_owner_id, f"Unknown (ID: {original_owner_id})")
+                    current_owner_name = directory.display_name(matchup.roster_id, f"Unknown (ID: {matchup.roster_id})")
+
+                    team_data['weekly_scores'].append({
+                        'week': week,
+                        'best_ball_points': best_ball_points,
+                        'actual_points': actual_points,
+                        'offensive_best_ball_points': offensive_best_ball_points,
+                        'original_draft_team': original_owner_name,
+                        'current_owner': current_owner_name
+                    })
+
+                    # Calculate head-to-head win
+                    opponent = paired[matchup.roster_id]
+                    if opponent and actual_points > sum(opponent.starters_points):
+                        team_data['wins'] += 1
+
+                    if tracer.enabled(DEBUG):
+                        tracer.debug("weekly_best_ball", week=week, team=team_data['team_name'],
+                                     best_ball_points=round(best_ball_points, 2), actual_points=round(actual_points, 2),
+                                     offensive_best_ball_points=round(offensive_best_ball_points, 2),
+                                     total_best_ball_points=round(team_data['total_best_ball_points'], 2),
+                                     total_actual_points=round(team_data['total_actual_points'], 2),
+                                     wins=team_data['wins'], half_wins=team_data['half_wins'],
+                                     lineup=", ".join(f"{slot['position']} {self.client.get_player_name(slot['player']['id'])} "
+                                                      f"{slot['player']['points']:.2f}" for slot in best_lineup))
 
         return {'teams': sorted(team_totals.values(), key=lambda x: x['total_best_ball_points'], reverse=True)}
 
@@ -285,8 +354,7 @@ class LeagueAnalytics:
         return sum(players_points[player] for player in starters if self.client.get_player_position(player) in self.valid_positions)
 
     def _calculate_offensive_best_ball_points(self, best_lineup: List[Dict[str, Any]]) -> float:
-        offensive_positions = ["QB", "RB", "WR", "TE", "FLEX", "SUPER_FLEX"]
-        return sum(slot['player']['points'] for slot in best_lineup if slot['position'] in offensive_positions)
+        return sum(slot['player']['points'] for slot in best_lineup if slot['position'] in OFFENSIVE_SLOTS)
 
     def get_weekly_best_ball_scores(self, league_id: str) -> Dict[str, List[Dict[str, any]]]:
         league = self.client.get_league(league_id, fetch_all=True)
@@ -298,10 +366,11 @@ class LeagueAnalytics:
         start_week = league.settings.start_week
         end_week = league.settings.playoff_week_start
 
-        for week in range(start_week, end_week):
-            matchups = self.client.get_matchups(league_id, week)
+        matchups_by_week = {week: self.client.get_matchups(league_id, week) for week in range(start_week, end_week)}
+        lineups_by_week = self._best_ball_season(league_id, league.roster_positions, matchups_by_week)
+        for week, matchups in matchups_by_week.items():
             for matchup in matchups:
-                best_ball_points, _ = self._calculate_best_ball_points(matchup.players_points, league.roster_positions)
+                best_ball_points, _ = lineups_by_week[week][matchup.roster_id]
                 actual_points = self._calculate_actual_points(matchup.players_points, matchup.starters)
                 team_data = team_scores[matchup.roster_id]
                 team_data['weekly_scores'].append({
@@ -324,7 +393,7 @@ class LeagueAnalytics:
         all_scores = []
 
         for week in range(start_week, end_week):
-            week_scores = self.get_best_ball_scores(league_id, week)
+            week_scores = self.get_best_ball_scores(league_id, week, league)
             
             # Calculate wins and half-wins
             sorted_scores = sorted(week_scores, key=lambda x: x['actual_points'], reverse=True)
@@ -360,79 +429,55 @@ class LeagueAnalytics:
         return position in offensive_positions
 
     def get_league_standings(self, league_id: str) -> List[Dict[str, Any]]:
+        """
+        Season standings, folding in only the weeks that are new or whose matchups changed
+        since the last call (or the last run, as the accumulator is persisted).
+        """
+        tracer = self.client.tracer
         league = self.client.get_league(league_id, fetch_all=True)
         current_week = self.client.get_current_week()
-<<<<<<< HEAD
-=======
-        offensive_positions = ["QB", "RB", "WR", "TE", "FLEX", "SUPER_FLEX"]
->>>>>>> Mostly_Working_Standings
-        
-        standings = {team.roster.roster_id: {
-            'team_name': team.display_name,
-            'wins': 0,
-            'losses': 0,
-            'ties': 0,
-            'half_wins': 0,
-            'points_for': 0,
-            'points_against': 0,
-            'best_ball_points': 0,
-            'offensive_best_ball_points': 0
-        } for team in league.teams if team.roster}
 
-        for week in range(1, current_week):
-            try:
-                matchups = self.client.get_matchups(league_id, week)
+        accumulator = self._standings.get(league_id)
+        if accumulator is None:
+            stored = self.standings_cache.get(league_id)
+            accumulator = StandingsAccumulator.from_dict(stored) if stored else StandingsAccumulator()
+        if accumulator.roster_positions != league.roster_positions:
+            accumulator = StandingsAccumulator(league.roster_positions)
+        self._standings[league_id] = accumulator
+
+        # week -> (matchups, digest) of the weeks to fold
+        changed: Dict[int, Tuple[List[Matchup], str]] = {}
+        with tracer.span("aggregate", call="get_league_standings", league_id=league_id):
+            for week in range(1, current_week):
+                try:
+                    matchups = self.client.get_matchups(league_id, week)
+                except SleeperAPIException as e:
+                    tracer.warning("week_skipped", call="get_league_standings", league_id=league_id, week=week,
+                                   error=str(e))
+                    continue
                 if not matchups:
-                    print(f"Warning: No matchups found for week {week}")
+                    tracer.warning("no_matchups", call="get_league_standings", league_id=league_id, week=week)
                     continue
 
-                best_ball_scores = self.get_best_ball_scores(league_id, week)
-                
-                # Sort teams by best ball points for this week
-                sorted_scores = sorted(best_ball_scores, key=lambda x: x['best_ball_points'], reverse=True)
-                half_win_threshold = len(sorted_scores) // 2
+                digest = matchups_digest(matchups)
+                if not accumulator.is_current(week, digest):
+                    changed[week] = (matchups, digest)
 
-                for idx, score in enumerate(sorted_scores):
-                    team = standings[score['roster_id']]
-                    team['best_ball_points'] += score['best_ball_points']
-                    
-                    # Calculate offensive best ball points using only offensive positions
-                    offensive_lineup = [
-                        slot for slot in score['best_lineup'] 
-                        if slot['position'] in offensive_positions
-                    ]
-                    offensive_points = sum(slot['player']['points'] for slot in offensive_lineup)
-                    team['offensive_best_ball_points'] += offensive_points
-                    
-                    # Assign half win to top half of teams
-                    if idx < half_win_threshold:
-                        team['half_wins'] += 0.5
+            lineups = self._best_ball_season(league_id, league.roster_positions,
+                                             {week: matchups for week, (matchups, _) in changed.items()})
+            for week, (matchups, digest) in changed.items():
+                tracer.debug("standings_fold", league_id=league_id, week=week, refold=week in accumulator.weeks)
+                accumulator.fold(week, digest, week_standings(matchups, lineups[week]))
+        if changed:
+            self.standings_cache[league_id] = accumulator.to_dict()
 
-                for matchup in matchups:
-                    team = standings[matchup.roster_id]
-                    team['points_for'] += matchup.points
-                    
-                    # Find the opponent
-                    opponent = next((m for m in matchups if m.matchup_id == matchup.matchup_id and m.roster_id != matchup.roster_id), None)
-                    if opponent:
-                        team['points_against'] += opponent.points
-                        
-                        if matchup.points > opponent.points:
-                            team['wins'] += 1
-                        elif matchup.points < opponent.points:
-                            team['losses'] += 1
-                        else:
-                            team['ties'] += 1
-
-            except SleeperAPIException as e:
-                print(f"Error fetching data for week {week}: {str(e)}. Skipping...")
-                continue
+        standings = []
+        for team in league.teams:
+            if team.roster:
+                totals = accumulator.totals.get(team.roster.roster_id, dict.fromkeys(STANDINGS_FIELDS, 0))
+                standings.append(dict(team_name=team.display_name, **totals))
 
-        sorted_standings = sorted(
-            standings.values(),
-            key=lambda x: (x['wins'] + x['half_wins'], x['points_for']),
-            reverse=True
-        )
+        sorted_standings = sorted(standings, key=standings_key, reverse=True)
 
         return sorted_standings
 
@@ -442,42 +487,145 @@ class LeagueAnalytics:
         for rank, team in enumerate(standings, 1):
             print(f"{rank}|{team['team_name']}|{team['wins']}-{team['losses']}-{team['ties']}|{team['half_wins']:.1f}|{team['points_for']:.2f}|{team['points_against']:.2f}|{team['best_ball_points']:.2f}|{team['offensive_best_ball_points']:.2f}")
 
+    def rescore_season(self, league_id: str, scoring_settings: Dict[str, float],
+                       weeks: Optional[Iterable[int]] = None) -> Dict[str, Any]:
+        """
+        Season standings as they would have been under alternate scoring settings, built
+        from cached data only (requires numpy).
+
+        Each rostered player's cached stat lines for every week are scored in one StatMatrix
+        pass, using the difference between the alternate settings and the league's own.
+        Every player's points move by that amount, so points Sleeper awarded that are not
+        in the stat lines are kept. Team points, best-ball lineups and standings are then
+        recomputed and compared with the real ones.
+
+        Nothing is fetched (see SleeperAPI.offline). Weeks without cached matchups are
+        skipped. If the stat lines of a week and position are not cached, those players'
+        points stay as they were, and the key is listed under 'missing_stats'.
+
+        Args:
+            league_id (str): The league ID
+            scoring_settings (Dict[str, float]): The full alternate settings, e.g. dict(league.scoring_settings, rec=0.5)
+            weeks (Iterable[int]): Weeks to rescore; defaults to the league's start week through last week
+
+        Returns:
+            Dict[str, Any]: 'weeks' rescored, 'missing_stats' as "{year}_{week}_{position}" keys,
+            and 'teams' as returned by rescoring.standings_diff, each with a 'weekly' list of
+            points and best-ball points under both settings
+        """
+        # numpy is only needed for what-if scoring, so it is imported on use
+        from scoring_engine import ScoringProfile, score_weeks
+
+        tracer = self.client.tracer
+        position_of = self.client.get_player_position
+        with self.client.offline():
+            with tracer.span("fetch", call="rescore_season", league_id=league_id):
+                league = self.client.get_league(league_id, fetch_all=True)
+                year = int(league.season)
+                if weeks is None:
+                    weeks = range(league.settings.start_week, self.current_week)
+                matchups_by_week = {}
+                for week in weeks:
+                    try:
+                        matchups = self.client.get_matchups(league_id, week)
+                    except SleeperAPIException as e:
+                        tracer.warning("week_skipped", call="rescore_season", league_id=league_id, week=week,
+                                       error=str(e))
+                        continue
+                    if matchups:
+                        matchups_by_week[week] = matchups
+
+                raw_by_week = {}
+                missing_stats = []
+                for week, matchups in matchups_by_week.items():
+                    rostered = {player_id for matchup in matchups for player_id in matchup.players_points}
+                    positions = {position_of(player_id) for player_id in rostered} - {"UNKNOWN"}
+                    lines = raw_by_week[week] = {}
+                    for position in sorted(positions):
+                        try:
+                            raw_stats = self.client.get_raw_stats(year, week, position)
+                        except SleeperAPIException:
+                            missing_stats.append(f"{year}_{week}_{position}")
+                            continue
+                        lines.update((player_id, line) for player_id, line in raw_stats.items() if player_id in rostered)
+                directory = self.client.get_league_directory(league_id)
+
+            with tracer.span("score", call="rescore_season", league_id=league_id):
+                delta = scoring_delta(league.scoring_settings, scoring_settings)
+                point_changes = score_weeks(raw_by_week, {'delta': ScoringProfile(delta)})['delta']
+                rescored_by_week = {week: rescore_matchups(matchups, point_changes.get(week, {}))
+                                    for week, matchups in matchups_by_week.items()}
+
+            with tracer.span("optimize", call="rescore_season", league_id=league_id):
+                optimizer = self._lineup_optimizer(league.roster_positions)
+                lineups = self._best_ball_season(league_id, league.roster_positions, matchups_by_week)
+                rescored_lineups = optimize_season(rescored_by_week, optimizer, position_of)
+
+        with tracer.span("aggregate", call="rescore_season", league_id=league_id):
+            actual = StandingsAccumulator(league.roster_positions)
+            whatif = StandingsAccumulator(league.roster_positions)
+            weekly: Dict[int, List[Dict[str, Any]]] = {}
+            for week, matchups in matchups_by_week.items():
+                rescored = rescored_by_week[week]
+                actual.fold(week, matchups_digest(matchups), week_standings(matchups, lineups[week]))
+                whatif.fold(week, matchups_digest(rescored), week_standings(rescored, rescored_lineups[week]))
+                for matchup, rescored_matchup in zip(matchups, rescored):
+                    weekly.setdefault(matchup.roster_id, []).append({
+                        'week': week,
+                        'points': matchup.points,
+                        'whatif_points': rescored_matchup.points,
+                        'best_ball_points': lineups[week][matchup.roster_id][0],
+                        'whatif_best_ball_points': rescored_lineups[week][matchup.roster_id][0],
+                    })
+
+            teams = standings_diff(actual.totals, whatif.totals, directory.team_names())
+            for team in teams:
+                team['weekly'] = weekly.get(team['roster_id'], [])
+
+        return {'weeks': list(matchups_by_week), 'missing_stats': missing_stats, 'teams': teams}
+
+    def print_rescored_standings(self, league_id: str, scoring_settings: Dict[str, float]):
+        rescored = self.rescore_season(league_id, scoring_settings)
+        if rescored['missing_stats']:
+            print(f"No cached stats for {', '.join(rescored['missing_stats'])}; those players keep their points")
+        print("Rank|Was|Team|W-L-T|Half Wins|PF|PF Change|BB Points|BB Change")
+        for team in rescored['teams']:
+            whatif, change = team['whatif'], team['change']
+            print(f"{team['whatif_rank']}|{team['rank']}|{team['team_name']}|{whatif['wins']}-{whatif['losses']}-{whatif['ties']}|{whatif['half_wins']:.1f}|{whatif['points_for']:.2f}|{change['points_for']:+.2f}|{whatif['best_ball_points']:.2f}|{change['best_ball_points']:+.2f}")
+
     def get_player_stats(self, year: int, week: int, position: str, league_id: str) -> Dict[str, PlayerStats]:
         return self.client.get_stats(year, week, position, league_id)
 
-<<<<<<< HEAD
-    def get_original_draft_team(self, league_id: str, current_owner_id: int, round: int, season: str) -> int:
-        if not self.traded_picks:
-            self.traded_picks = self.client.get_all_traded_picks(league_id)
+    def get_draft_pick_index(self, league_id: str) -> DraftPickIndex:
+        """Traded-pick ownership for the league and its previous seasons, built on first use."""
+        index = self.draft_pick_indexes.get(league_id)
+        if index is None:
+            index = self.draft_pick_indexes[league_id] = DraftPickIndex(self.client.get_all_traded_picks(league_id))
+        return index
 
-        for pick in self.traded_picks:
-            if (pick['owner_id'] == current_owner_id and
-                pick['round'] == round and
-                pick['season'] == season):
-                return pick['roster_id']  # This is the original owner
+    def get_original_draft_team(self, league_id: str, current_owner_id: int, round: int, season: str) -> int:
+        # If the pick was never traded, the current owner is the original owner
+        return self.get_draft_pick_index(league_id).original_owner(season, round, current_owner_id)
 
-        return current_owner_id  # If no trade found, assume it's the original owner
-=======
     def write_offensive_best_ball_to_csv(self, league_id: str, filename: str = "offensive_best_ball.csv"):
         """Write each team's offensive best ball lineup to a CSV file."""
         league = self.client.get_league(league_id, fetch_all=True)
         current_week = self.client.get_current_week()
-        offensive_positions = ["QB", "RB", "WR", "TE", "FLEX", "SUPER_FLEX"]
         
         with open(filename, 'w', newline='') as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(['Week', 'TeamName', 'PlayerName', 'LineupPosition', 'Points'])
             
             for week in range(league.settings.start_week, current_week):
-                print(f"Processing week {week}...")
-                best_ball_scores = self.get_best_ball_scores(league_id, week)
+                self.client.tracer.info("processing_week", call="write_offensive_best_ball_to_csv", week=week)
+                best_ball_scores = self.get_best_ball_scores(league_id, week, league)
                 
                 for score in best_ball_scores:
                     team_name = score['team_name']
                     # Filter for offensive positions only
                     offensive_lineup = [
                         slot for slot in score['best_lineup'] 
-                        if slot['position'] in offensive_positions
+                        if slot['position'] in OFFENSIVE_SLOTS
                     ]
                     
                     for slot in offensive_lineup:
@@ -518,8 +666,7 @@ class LeagueAnalytics:
             return False
 
         # Get league data to map roster_ids to team names
-        league = self.client.get_league(league_id, fetch_all=True)
-        team_names = {team.roster.roster_id: team.display_name for team in league.teams if team.roster}
+        team_names = self.client.get_league_directory(league_id).team_names()
         
         transactions = self.client.get_league_transactions(league_id, week)
         dropped_players = []
@@ -552,8 +699,7 @@ class LeagueAnalytics:
             List[Dict[str, str]]: List of dictionaries containing player_name, team_name, and dropped_at
         """
         # Get league data to map roster_ids to team names
-        league = self.client.get_league(league_id, fetch_all=True)
-        team_names = {team.roster.roster_id: team.display_name for team in league.teams if team.roster}
+        team_names = self.client.get_league_directory(league_id).team_names()
         
         transactions = self.client.get_league_transactions(league_id, week)
         drops = []
@@ -573,12 +719,14 @@ class LeagueAnalytics:
         drops.sort(key=lambda x: x['dropped_at'])
         return drops
 
-    def get_all_league_transactions(self, league_id: str) -> List[Dict[str, Any]]:
+    def get_all_league_transactions(self, league_id: str, max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get all transactions for a league, starting from week 1 until no more transactions are found.
         
         Args:
             league_id (str): The league ID
+            max_workers (int): If greater than 1, fetch windows of this many weeks in parallel
+                on a thread pool, stopping at the first week without transactions
             
         Returns:
             List[Dict[str, Any]]: List of all transactions with week number and datetime fields added
@@ -586,27 +734,31 @@ class LeagueAnalytics:
         all_transactions = []
         week = 1
         
-        while True:
-            transactions = self.client.get_league_transactions(league_id, week)
-            if not transactions:  # If no transactions are found for this week
-                break
-            
-            # Add week number and datetime fields to each transaction
-            for transaction in transactions:
-                transaction['week'] = week
-                
-                # Add status updated datetime
-                if transaction.get('status_updated'):
-                    dt = datetime.fromtimestamp(transaction['status_updated'] / 1000)
-                    transaction['datetime'] = dt.strftime('%Y-%m-%d %I:%M %p')
+        if max_workers and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                while True:
+                    # Speculatively fetch the next window of weeks; anything past the first empty week is discarded
+                    window = range(week, week + max_workers)
+                    results = executor.map(lambda w: self.client.get_league_transactions(league_id, w), window)
+                    found_empty_week = False
+                    for window_week, transactions in zip(window, results):
+                        if not transactions:
+                            found_empty_week = True
+                            break
+                        self._annotate_transactions(transactions, window_week)
+                        all_transactions.extend(transactions)
+                    if found_empty_week:
+                        break
+                    week += max_workers
+        else:
+            while True:
+                transactions = self.client.get_league_transactions(league_id, week)
+                if not transactions:  # If no transactions are found for this week
+                    break
                 
-                # Add created datetime
-                if transaction.get('created'):
-                    dt = datetime.fromtimestamp(transaction['created'] / 1000)
-                    transaction['created_datetime'] = dt.strftime('%Y-%m-%d %I:%M %p')
-            
-            all_transactions.extend(transactions)
-            week += 1
+                self._annotate_transactions(transactions, week)
+                all_transactions.extend(transactions)
+                week += 1
         
         # Sort transactions by status_updated time
         all_transactions.sort(key=lambda x: x.get('status_updated', 0))
@@ -614,10 +766,25 @@ class LeagueAnalytics:
         # Save to JSON file
         filename = f"league_{league_id}_transactions.json"
         with open(filename, 'w') as f:
-            json.dump(all_transactions, f, indent=2)
+            json.dump(all_transactions, f, indent=2, cls=CustomJSONEncoder)
         
         return all_transactions
 
+    def _annotate_transactions(self, transactions: List[Dict[str, Any]], week: int):
+        # Add week number and datetime fields to each transaction
+        for transaction in transactions:
+            transaction['week'] = week
+            
+            # Add status updated datetime
+            if transaction.get('status_updated'):
+                dt = datetime.fromtimestamp(transaction['status_updated'] / 1000)
+                transaction['datetime'] = dt.strftime('%Y-%m-%d %I:%M %p')
+            
+            # Add created datetime
+            if transaction.get('created'):
+                dt = datetime.fromtimestamp(transaction['created'] / 1000)
+                transaction['created_datetime'] = dt.strftime('%Y-%m-%d %I:%M %p')
+
     def load_league_transactions(self, league_id: str) -> List[Dict[str, Any]]:
         """
         Load transactions from the JSON file for a given league.
@@ -646,4 +813,3 @@ class LeagueAnalytics:
             
         except json.JSONDecodeError as e:
             raise SleeperAPIException(f"Error reading transactions file: {str(e)}")
->>>>>>> Mostly_Working_Standings
@@ -0,0 +1,56 @@
+from typing import Dict, List, Optional
+
+from models import Roster, Team
+
+
+class LeagueDirectory:
+    """
+    Lookups between a league's rosters, users and display names.
+
+    Built from one snapshot of the league's users and rosters, with each team's roster
+    attached. SleeperAPI.get_league_directory rebuilds it only after either response is
+    refetched. A roster with no owner is still listed under its roster_id, but it has
+    no team.
+
+    The directory is shared by every caller until that rebuild, so its teams and rosters
+    are read-only; SleeperAPI.get_league(fetch_all=True) hands out copies of the teams.
+    """
+
+    def __init__(self, teams: List[Team], rosters: List[Roster]):
+        self.teams = teams
+        self.rosters: Dict[int, Roster] = {roster.roster_id: roster for roster in rosters}
+        self.teams_by_user: Dict[str, Team] = {team.user_id: team for team in teams}
+        self.teams_by_roster: Dict[int, Team] = {team.roster.roster_id: team for team in teams if team.roster}
+        self.teams_by_name: Dict[str, Team] = {team.display_name.lower(): team for team in teams if team.display_name}
+
+    def __len__(self) -> int:
+        return len(self.rosters)
+
+    def team(self, roster_id: int) -> Optional[Team]:
+        return self.teams_by_roster.get(roster_id)
+
+    def team_for_user(self, user_id: str) -> Optional[Team]:
+        return self.teams_by_user.get(user_id)
+
+    def team_named(self, display_name: str) -> Optional[Team]:
+        """Case-insensitive lookup by display name."""
+        return self.teams_by_name.get(display_name.lower())
+
+    def roster(self, roster_id: int) -> Optional[Roster]:
+        return self.rosters.get(roster_id)
+
+    def roster_id(self, user_id: str) -> Optional[int]:
+        team = self.teams_by_user.get(user_id)
+        return team.roster.roster_id if team and team.roster else None
+
+    def user_id(self, roster_id: int) -> Optional[str]:
+        roster = self.rosters.get(roster_id)
+        return roster.owner_id if roster else None
+
+    def display_name(self, roster_id: int, default: Optional[str] = None) -> Optional[str]:
+        team = self.teams_by_roster.get(roster_id)
+        return team.display_name if team else default
+
+    def team_names(self) -> Dict[int, str]:
+        """display_name per roster_id, for every roster that has an owner."""
+        return {roster_id: team.display_name for roster_id, team in self.teams_by_roster.items()}
@@ -0,0 +1,118 @@
+from typing import Callable, Dict, List, Mapping, Sequence
+
+import numpy as np
+
+from models import Matchup
+
+
+class MatchupFrame:
+    """
+    A season of matchups as parallel NumPy arrays, one row per (week, roster, player).
+
+    Players and positions are integer-coded: player[i] indexes player_ids and
+    position[i] indexes positions. Each player's position is resolved once when the
+    frame is built. Season aggregates are then array reductions instead of loops over
+    matchup.players_points.
+
+    Arrays:
+        week (int16), roster (int32), player (int32), position (int16),
+        points (float64), starter (bool)
+    """
+
+    def __init__(self, week: np.ndarray, roster: np.ndarray, player: np.ndarray, position: np.ndarray,
+                 points: np.ndarray, starter: np.ndarray, player_ids: List[str], positions: List[str]):
+        self.week = week
+        self.roster = roster
+        self.player = player
+        self.position = position
+        self.points = points
+        self.starter = starter
+        self.player_ids = player_ids
+        self.positions = positions
+
+    @classmethod
+    def from_matchups(cls, matchups_by_week: Mapping[int, Sequence[Matchup]],
+                      position_of: Callable[[str], str]) -> 'MatchupFrame':
+        """
+        Args:
+            matchups_by_week (Mapping[int, Sequence[Matchup]]): Matchups keyed by week, e.g. from SleeperAPI.get_all_matchups
+            position_of (Callable[[str], str]): Position lookup such as SleeperAPI.get_player_position,
+                called once per distinct player
+        """
+        player_codes: Dict[str, int] = {}
+        position_codes: Dict[str, int] = {}
+        player_ids: List[str] = []
+        player_position: List[int] = []
+        weeks, rosters, players, points, starters = [], [], [], [], []
+
+        for week, matchups in matchups_by_week.items():
+            for matchup in matchups:
+                starter_ids = set(matchup.starters)
+                for player_id, player_points in matchup.players_points.items():
+                    code = player_codes.get(player_id)
+                    if code is None:
+                        code = player_codes[player_id] = len(player_ids)
+                        player_ids.append(player_id)
+                        position = position_of(player_id)
+                        player_position.append(position_codes.setdefault(position, len(position_codes)))
+                    weeks.append(week)
+                    rosters.append(matchup.roster_id)
+                    players.append(code)
+                    points.append(player_points)
+                    starters.append(player_id in starter_ids)
+
+        player = np.array(players, dtype=np.int32)
+        return cls(
+            week=np.array(weeks, dtype=np.int16),
+            roster=np.array(rosters, dtype=np.int32),
+            player=player,
+            position=np.array(player_position, dtype=np.int16)[player] if players else np.zeros(0, dtype=np.int16),
+            points=np.array(points, dtype=np.float64),
+            starter=np.array(starters, dtype=bool),
+            player_ids=player_ids,
+            positions=list(position_codes),
+        )
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    @property
+    def weeks(self) -> List[int]:
+        return np.unique(self.week).tolist()
+
+    def roster_totals(self, starters_only: bool = False) -> Dict[int, float]:
+        """Season points per roster_id, counting every rostered player or only the starters."""
+        weights = np.where(self.starter, self.points, 0.0) if starters_only else self.points
+        totals = np.bincount(self.roster, weights=weights)
+        return {roster_id: float(totals[roster_id]) for roster_id in np.unique(self.roster).tolist()}
+
+    def roster_weekly_totals(self, starters_only: bool = False) -> Dict[int, Dict[int, float]]:
+        """Points per roster_id per week."""
+        if not len(self):
+            return {}
+        weights = np.where(self.starter, self.points, 0.0) if starters_only else self.points
+        shape = (int(self.roster.max()) + 1, int(self.week.max()) + 1)
+        totals = np.zeros(shape)
+        np.add.at(totals, (self.roster, self.week), weights)
+        seen = np.zeros(shape, dtype=bool)
+        seen[self.roster, self.week] = True
+        return {
+            roster_id: {week: float(totals[roster_id, week]) for week in np.flatnonzero(seen[roster_id]).tolist()}
+            for roster_id in np.unique(self.roster).tolist()
+        }
+
+    def player_totals(self) -> Dict[str, float]:
+        """Season points per player ID, summed over every roster the player was on."""
+        totals = np.bincount(self.player, weights=self.points, minlength=len(self.player_ids))
+        return dict(zip(self.player_ids, totals.tolist()))
+
+    def position_weekly_max(self) -> Dict[str, Dict[int, float]]:
+        """The best single score at each position in each week, across all rosters."""
+        if not len(self):
+            return {}
+        best = np.full((len(self.positions), int(self.week.max()) + 1), -np.inf)
+        np.maximum.at(best, (self.position, self.week), self.points)
+        return {
+            position: {week: float(best[code, week]) for week in self.weeks if np.isfinite(best[code, week])}
+            for code, position in enumerate(self.positions)
+        }
@@ -0,0 +1,167 @@
+from typing import Any, Callable, Dict, List
+
+from models import DraftPick
+
+
+def _float_or_none(value):
+    return float(value) if value is not None else None
+
+
+def _matchup_players_points(data: Dict[str, Any]) -> Dict[str, float]:
+    return {k: float(v) if v is not None else 0.0 for k, v in (data.get('players_points') or {}).items()}
+
+
+def _matchup_starters_points(data: Dict[str, Any]) -> List[float]:
+    # Same order as SleeperAPI._parse_matchups: starters as they appear in players_points
+    starters = set(data.get('starters') or [])
+    return [float(v) if v is not None else 0.0
+            for k, v in (data.get('players_points') or {}).items() if k in starters]
+
+
+class ModelView:
+    """
+    Model over a dict straight from an API response.
+
+    Nothing is copied up front. An attribute is converted from the dict the first time it
+    is read and then stored on the view, so later reads are plain attribute lookups.
+    Attributes listed in FIELDS are computed by their function; any other key of the dict
+    is returned as-is. Views also support view['key'], view.get('key') and item assignment
+    on the underlying dict, so code written against the raw dicts keeps working.
+    """
+
+    # Attribute name -> function of the raw dict that computes it
+    FIELDS: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+
+    # __dict__ holds converted attributes and is only allocated once one is read
+    __slots__ = ('_data', '__dict__')
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when the attribute has not been converted yet
+        compute = self.FIELDS.get(name)
+        if compute is not None:
+            value = compute(self._data)
+        elif not name.startswith('_') and name in self._data:
+            value = self._data[name]
+        else:
+            raise AttributeError(f"{type(self).__name__} has no attribute {name!r}")
+        self.__dict__[name] = value
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any):
+        self._data[key] = value
+        self.__dict__.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The wrapped response dict."""
+        return self._data
+
+
+class MatchupView(ModelView):
+    """Lazy counterpart of Matchup."""
+    __slots__ = ()
+    FIELDS = {
+        'roster_id': lambda d: d.get('roster_id'),
+        'matchup_id': lambda d: d.get('matchup_id'),
+        'points': lambda d: _float_or_none(d.get('points')),
+        'custom_points': lambda d: _float_or_none(d.get('custom_points')),
+        'players': lambda d: d.get('players') or [],
+        'starters': lambda d: d.get('starters') or [],
+        'players_points': _matchup_players_points,
+        'starters_points': _matchup_starters_points,
+    }
+
+    def __repr__(self):
+        return f"MatchupView(roster_id={self.roster_id}, matchup_id={self.matchup_id}, points={self.points})"
+
+
+class RosterView(ModelView):
+    """Lazy counterpart of Roster."""
+    __slots__ = ()
+    FIELDS = {
+        'roster_id': lambda d: d.get('roster_id'),
+        'owner_id': lambda d: d.get('owner_id'),
+        'league_id': lambda d: d.get('league_id'),
+        'players': lambda d: d.get('players', []),
+        'starters': lambda d: d.get('starters', []),
+        'reserve': lambda d: d.get('reserve'),
+        'taxi': lambda d: d.get('taxi'),
+        'metadata': lambda d: d.get('metadata', {}),
+        'settings': lambda d: d.get('settings', {}),
+        'wins': lambda d: d.get('settings', {}).get('wins', 0),
+        'losses': lambda d: d.get('settings', {}).get('losses', 0),
+        'ties': lambda d: d.get('settings', {}).get('ties', 0),
+        'fpts': lambda d: d.get('settings', {}).get('fpts', 0),
+        'waiver_position': lambda d: d.get('settings', {}).get('waiver_position', 0),
+        'waiver_budget_used': lambda d: d.get('settings', {}).get('waiver_budget_used', 0),
+    }
+
+    def __str__(self):
+        return f"Roster ID: {self.roster_id}, Owner ID: {self.owner_id}"
+
+    def __repr__(self):
+        return f"RosterView(roster_id={self.roster_id}, owner_id='{self.owner_id}', players_count={len(self.players)})"
+
+
+class TeamView(ModelView):
+    """Lazy counterpart of Team. roster is None until SleeperAPI attaches one."""
+    __slots__ = ()
+    FIELDS = {
+        'user_id': lambda d: d.get('user_id'),
+        'league_id': lambda d: d.get('league_id'),
+        'display_name': lambda d: d.get('display_name'),
+        'avatar': lambda d: d.get('avatar'),
+        'is_bot': lambda d: d.get('is_bot'),
+        'is_owner': lambda d: d.get('is_owner'),
+        'metadata': lambda d: d.get('metadata', {}),
+        'settings': lambda d: d.get('settings'),
+        'team_name': lambda d: d.get('metadata', {}).get('team_name'),
+        'avatar_url': lambda d: d.get('metadata', {}).get('avatar'),
+        'allow_pn': lambda d: d.get('metadata', {}).get('allow_pn'),
+        'allow_sms': lambda d: d.get('metadata', {}).get('allow_sms'),
+        'archived': lambda d: d.get('metadata', {}).get('archived'),
+        'show_mascots': lambda d: d.get('metadata', {}).get('show_mascots'),
+        'roster': lambda d: None,
+    }
+
+    def __str__(self):
+        return f"{self.display_name} ({self.team_name or 'No team name'})"
+
+    def __repr__(self):
+        return f"TeamView(user_id={self.user_id}, display_name='{self.display_name}', team_name='{self.team_name}')"
+
+
+class TransactionView(ModelView):
+    """Lazy counterpart of Transaction."""
+    __slots__ = ()
+    FIELDS = {
+        'status': lambda d: d.get('status'),
+        'type': lambda d: d.get('type'),
+        'transaction_id': lambda d: d.get('transaction_id'),
+        'status_updated': lambda d: d.get('status_updated'),
+        'roster_ids': lambda d: d.get('roster_ids'),
+        'adds': lambda d: d.get('adds'),
+        'drops': lambda d: d.get('drops'),
+        'draft_picks': lambda d: [DraftPick.from_dict(pick) for pick in d.get('draft_picks') or []],
+        'waiver_budget': lambda d: d.get('waiver_budget', []),
+        'creator': lambda d: d.get('creator'),
+        'created': lambda d: d.get('created'),
+        'consenter_ids': lambda d: d.get('consenter_ids', []),
+        'metadata': lambda d: d.get('metadata'),
+        'settings': lambda d: d.get('settings'),
+        'leg': lambda d: d.get('leg'),
+    }
+
+    def __repr__(self):
+        return f"TransactionView(transaction_id='{self.transaction_id}', type='{self.type}', status='{self.status}')"
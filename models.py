@@ -1,8 +1,47 @@
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
-import re
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, Callable, Dict, List, Optional
+import sys
+
+from http_transport import get_default_transport
+from name_normalizer import PLAYER_NAMES
+
+
+def _generate_decoder(cls, converters: Optional[Dict[str, Callable[[Any], Any]]] = None) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Generate a from_dict function for a dataclass parsed from API payloads.
+
+    The function is compiled once and builds the instance __dict__ from a single dict
+    display with one entry per field, instead of going through __init__. Keys the dataclass does not declare go
+    to extra_fields when the class has one and are dropped otherwise. converters maps a
+    field name to a function applied to its value when the value is a dict or list.
+    """
+    converters = converters or {}
+    declared = [f for f in fields(cls) if f.name != 'extra_fields']
+    namespace = {'CLS': cls, 'NEW': object.__new__, 'KNOWN': frozenset(f.name for f in declared)}
+    lines = ["def from_dict(data):"]
+    entries = []
+    for f in declared:
+        if f.default is not MISSING:
+            namespace[f"DEFAULT_{f.name}"] = f.default
+            value = f"data.get({f.name!r}, DEFAULT_{f.name})"
+        elif f.default_factory is not MISSING:
+            namespace[f"FACTORY_{f.name}"] = f.default_factory
+            value = f"data[{f.name!r}] if {f.name!r} in data else FACTORY_{f.name}()"
+        else:
+            value = f"data[{f.name!r}]"
+        if f.name in converters:
+            namespace[f"CONVERT_{f.name}"] = converters[f.name]
+            lines.append(f"    {f.name} = {value}")
+            value = f"CONVERT_{f.name}({f.name}) if isinstance({f.name}, (dict, list)) else {f.name}"
+        entries.append(f"        {f.name!r}: {value},")
+    if any(f.name == 'extra_fields' for f in fields(cls)):
+        entries.append("        'extra_fields': {} if KNOWN.issuperset(data) else {k: v for k, v in data.items() if k not in KNOWN},")
+    lines += ["    obj = NEW(CLS)", "    obj.__dict__ = {", *entries, "    }", "    return obj"]
+    exec("\n".join(lines), namespace)
+    from_dict = namespace['from_dict']
+    from_dict.__qualname__ = f"{cls.__name__}.from_dict"
+    return from_dict
 
-import requests
 
 @dataclass
 class LeagueMetadata:
@@ -16,12 +55,9 @@ class LeagueMetadata:
     continued: Optional[str] = None
     extra_fields: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        # Capture any unexpected fields
-        known_fields = set(self.__annotations__.keys()) - {'extra_fields'}
-        self.extra_fields = {k: v for k, v in self.__dict__.items() if k not in known_fields}
-        for k in self.extra_fields:
-            delattr(self, k)
+
+LeagueMetadata.from_dict = staticmethod(_generate_decoder(LeagueMetadata))
+
 
 @dataclass
 class LeagueSettings:
@@ -76,20 +112,14 @@ class LeagueSettings:
     last_scored_leg: Optional[int] = None
     sub_start_time_eligibility: Optional[int] = None
     max_subs: Optional[int] = None
-<<<<<<< HEAD
     was_auto_archived: Optional[bool] = None
     divisions: Optional[int] = None
-=======
     sub_lock_if_starter_active: Optional[int] = None
->>>>>>> Mostly_Working_Standings
     extra_fields: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        # Capture any unexpected fields
-        known_fields = set(self.__annotations__.keys()) - {'extra_fields'}
-        self.extra_fields = {k: v for k, v in self.__dict__.items() if k not in known_fields}
-        for k in self.extra_fields:
-            delattr(self, k)
+
+LeagueSettings.from_dict = staticmethod(_generate_decoder(LeagueSettings))
+
 
 @dataclass
 class League:
@@ -131,15 +161,9 @@ class League:
     def __post_init__(self):
         # Convert metadata dict to LeagueMetadata object if it's not already
         if isinstance(self.metadata, dict):
-            self.metadata = LeagueMetadata(**self.metadata)
+            self.metadata = LeagueMetadata.from_dict(self.metadata)
         if isinstance(self.settings, dict):
-            self.settings = LeagueSettings(**self.settings)
-        
-        # Capture any unexpected fields
-        known_fields = set(self.__annotations__.keys()) - {'extra_fields'}
-        self.extra_fields = {k: v for k, v in self.__dict__.items() if k not in known_fields}
-        for k in self.extra_fields:
-            delattr(self, k)
+            self.settings = LeagueSettings.from_dict(self.settings)
 
     def __str__(self):
         return f"{self.name} (ID: {self.league_id})"
@@ -148,6 +172,12 @@ class League:
         return f"League(league_id='{self.league_id}', name='{self.name}', total_rosters={self.total_rosters})"
 
 
+League.from_dict = staticmethod(_generate_decoder(League, {
+    'metadata': LeagueMetadata.from_dict,
+    'settings': LeagueSettings.from_dict,
+}))
+
+
 @dataclass
 class Team:
     user_id: str
@@ -166,65 +196,71 @@ class Team:
         return f"Team(user_id='{self.user_id}', display_name='{self.display_name}', team_name='{self.team_name}')"
 
 
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# Shared tuples for fantasy_positions; there are only a few dozen distinct combinations
+_POSITION_TUPLES: Dict[tuple, tuple] = {}
+
+
+def _intern_positions(positions):
+    if positions is None:
+        return None
+    key = tuple(_intern(p) for p in positions)
+    return _POSITION_TUPLES.setdefault(key, key)
+
+
 class Player:
+    # Attributes kept from the /players/nfl payload, in the order they are stored
+    FIELDS = ('player_id', 'first_name', 'last_name', 'full_name', 'position', 'team', 'age',
+              'status', 'height', 'weight', 'years_exp', 'college', 'fantasy_positions',
+              'active', 'number', 'birth_date', 'injury_status')
+    # Strings shared between players instead of stored once per player. The rarely used
+    # college, height and birth_date are interned rather than decoded lazily: players.json
+    # has already been parsed when a Player is built, and keeping the raw payload around to
+    # decode them later would cost more than one slot pointing at a shared string
+    INTERNED_FIELDS = ('position', 'team', 'status', 'height', 'weight', 'college', 'birth_date', 'injury_status')
+
+    # About 11k players stay resident for the life of a client, so no per-instance __dict__
+    __slots__ = FIELDS + ('_name',)
+
     def __init__(self, **kwargs):
         self.player_id = kwargs.get('player_id')
         self.first_name = kwargs.get('first_name')
         self.last_name = kwargs.get('last_name')
         self.full_name = kwargs.get('full_name')
-        self.position = kwargs.get('position')
-        self.team = kwargs.get('team')
+        self.position = _intern(kwargs.get('position'))
+        self.team = _intern(kwargs.get('team'))
         self.age = kwargs.get('age')
-        self.status = kwargs.get('status')
-        self.height = kwargs.get('height')
-        self.weight = kwargs.get('weight')
+        self.status = _intern(kwargs.get('status'))
+        self.height = _intern(kwargs.get('height'))
+        self.weight = _intern(kwargs.get('weight'))
         self.years_exp = kwargs.get('years_exp')
-        self.college = kwargs.get('college')
-        self.fantasy_positions = kwargs.get('fantasy_positions')
+        self.college = _intern(kwargs.get('college'))
+        self.fantasy_positions = _intern_positions(kwargs.get('fantasy_positions'))
         self.active = kwargs.get('active')
         self.number = kwargs.get('number')
-        self.birth_date = kwargs.get('birth_date')
-        self.injury_status = kwargs.get('injury_status')
-        
-        # Create a formatted name property
-        self.name = self.format_name(f"{self.first_name} {self.last_name}")
+        self.birth_date = _intern(kwargs.get('birth_date'))
+        self.injury_status = _intern(kwargs.get('injury_status'))
+        self._name = None
+
+    @property
+    def name(self) -> str:
+        # Formatted on first use; most players are never displayed or matched by name
+        if self._name is None:
+            self._name = self.format_name(f"{self.first_name} {self.last_name}")
+        return self._name
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        if data['fantasy_positions'] is not None:
+            data['fantasy_positions'] = list(data['fantasy_positions'])
+        data['name'] = self.name
+        return data
 
     def format_name(self, s):
-        # If there is a (, dump everything from there on
-        s = s.split('(')[0]
-
-        # Initial replacements and formatting
-        s = s.strip().upper()
-        s = re.sub(r'[,+.*]', '', s)
-        s = re.sub(r'\s+(JR|SR|III|II|IV|V)$', '', s)
-        s = s.replace("'", "").replace("-", " ")
-
-        # Additional specific replacements
-        replacements = {
-            "MITCHELL T": "MITCH T",
-            "ROBBY ANDERSON": "ROBBIE ANDERSON",
-            "WILLIAM ": "WILL ",
-            "OLABISI": "BISI",
-            "ELI MITCHELL": "ELIJAH MITCHELL",
-            "CADILLAC WILLIAMS": "CARNELL WILLIAMS",
-            "GABE DAVIS": "GABRIEL DAVIS",
-            "JEFFERY ": "JEFF ",
-            "JOSHUA ": "JOSH ",
-            "CHAUNCEY GARDNER": "CJ GARDNER",
-            "BENNETT SKOWRONEK": "BEN SKOWRONEK",
-            "NATHANIEL DELL": "TANK DELL",
-        }
-
-        for old, new in replacements.items():
-            s = s.replace(old, new)
-
-        # Handle specific starting names
-        if s.startswith("MICHAEL "):
-            s = s.replace("MICHAEL ", "MIKE ", 1)
-        if s.startswith("KENNETH "):
-            s = s.replace("KENNETH ", "KEN ", 1)
-
-        return s
+        return PLAYER_NAMES.normalize(s)
 
     def __str__(self):
         return self.name
@@ -264,7 +300,7 @@ class Team:
         return f"Team(user_id={self.user_id}, display_name='{self.display_name}', team_name='{self.team_name}')"
 
 
-@dataclass
+@dataclass(slots=True)
 class Matchup:
     roster_id: int
     points: float
@@ -324,7 +360,7 @@ class Roster:
 from dataclasses import dataclass
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class PlayerInfo:
     player_id: str
     first_name: str
@@ -333,7 +369,7 @@ class PlayerInfo:
     team: str
     injury_status: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ProjectedStats:
     rush_att: float
     rush_yd: float
@@ -345,7 +381,7 @@ class ProjectedStats:
     pts_half_ppr: float
     pts_std: float
 
-@dataclass
+@dataclass(slots=True)
 class PlayerProjection:
     player: PlayerInfo
     stats: ProjectedStats
@@ -367,12 +403,19 @@ class SleeperProjections:
     BASE_URL = "https://api.sleeper.com/projections/nfl"
 
     @staticmethod
-    def get_projections(year: int, week: int, position: str) -> List[PlayerProjection]:
-        url = f"{SleeperProjections.BASE_URL}/{year}/{week}?season_type=regular&position={position}"
-        response = requests.get(url)
+    def get_projections(year: int, week: int, position: str, transport=None) -> List[PlayerProjection]:
+        url = SleeperProjections.projections_url(year, week, position)
+        response = (transport or get_default_transport()).get(url)
         response.raise_for_status()
         data = response.json()
+        return SleeperProjections.parse_projections(data)
+
+    @staticmethod
+    def projections_url(year: int, week: int, position: str) -> str:
+        return f"{SleeperProjections.BASE_URL}/{year}/{week}?season_type=regular&position={position}"
 
+    @staticmethod
+    def parse_projections(data: List[Dict[str, Any]]) -> List[PlayerProjection]:
         projections = []
         for item in data:
             player_data = item.get('player', {})
@@ -411,7 +454,7 @@ class SleeperProjections:
 
         return projections
     
-@dataclass
+@dataclass(slots=True)
 class PlayerStats:
     player_id: str
     fantasy_points: float
@@ -428,8 +471,11 @@ class PlayerStats:
     pass_int: float = 0
     fum_lost: float = 0
 
+
+# Stat keys PlayerStats keeps from a raw stat line; the rest only count towards fantasy_points
+PLAYER_STAT_FIELDS = frozenset(f.name for f in fields(PlayerStats)) - {'player_id', 'fantasy_points'}
+
 @dataclass
-<<<<<<< HEAD
 class DraftPick:
     round: int
     season: str
@@ -439,16 +485,11 @@ class DraftPick:
     league_id: Optional[str] = None  # Add this line
     extra_fields: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        # Capture any unexpected fields
-        known_fields = set(self.__annotations__.keys()) - {'extra_fields'}
-        self.extra_fields = {k: v for k, v in self.__dict__.items() if k not in known_fields}
-        for k in self.extra_fields:
-            delattr(self, k)
+
+DraftPick.from_dict = staticmethod(_generate_decoder(DraftPick))
+
 
 @dataclass
-=======
->>>>>>> Mostly_Working_Standings
 class Transaction:
     status: str
     type: str
@@ -457,13 +498,8 @@ class Transaction:
     roster_ids: List[int]
     adds: Optional[Dict[str, int]] = None
     drops: Optional[Dict[str, int]] = None
-<<<<<<< HEAD
     draft_picks: List[DraftPick] = field(default_factory=list)
     waiver_budget: List[Dict[str, Any]] = field(default_factory=list)
-=======
-    waiver_budget: List[Dict[str, Any]] = field(default_factory=list)
-    draft_picks: List[Dict[str, Any]] = field(default_factory=list)
->>>>>>> Mostly_Working_Standings
     creator: Optional[str] = None
     created: Optional[int] = None
     consenter_ids: List[int] = field(default_factory=list)
@@ -471,29 +507,7 @@ class Transaction:
     settings: Optional[Dict[str, Any]] = None
     leg: Optional[int] = None
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Transaction':
-<<<<<<< HEAD
-        draft_picks = [DraftPick(**pick) for pick in data.get('draft_picks', [])]
-        return cls(
-            status=data['status'],
-            type=data['type'],
-            transaction_id=data['transaction_id'],
-            status_updated=data['status_updated'],
-            roster_ids=data['roster_ids'],
-            adds=data.get('adds'),
-            drops=data.get('drops'),
-            draft_picks=draft_picks,
-            waiver_budget=data.get('waiver_budget', []),
-            creator=data.get('creator'),
-            created=data.get('created'),
-            consenter_ids=data.get('consenter_ids', []),
-            metadata=data.get('metadata'),
-            settings=data.get('settings'),
-            leg=data.get('leg')
-        )
-=======
-        # Remove any fields that aren't in the dataclass
-        valid_fields = {k: v for k, v in data.items() if k in cls.__annotations__}
-        return cls(**valid_fields)
->>>>>>> Mostly_Working_Standings
+
+Transaction.from_dict = staticmethod(_generate_decoder(Transaction, {
+    'draft_picks': lambda picks: [DraftPick.from_dict(pick) for pick in picks],
+}))
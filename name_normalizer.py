@@ -0,0 +1,96 @@
+import re
+from functools import lru_cache
+from typing import Dict, Optional
+
+_PARENTHESIZED = re.compile(r'\(.*', re.DOTALL)
+_PUNCTUATION = re.compile(r'[,+.*]')
+_SUFFIX = re.compile(r'\s+(JR|SR|III|II|IV|V)$')
+_STRIP = str.maketrans({"'": None, "-": " "})
+
+
+class NameNormalizer:
+    """
+    Turns a player name into the upper-case form used to match names across sources.
+
+    Every name goes through the same cleanup: everything from the first "(" is dropped,
+    the name is upper-cased, punctuation and generational suffixes (JR, SR, II...) are
+    removed, apostrophes are dropped and hyphens become spaces. Then one rule table is
+    applied. All of its keys are compiled into one alternation, so the name is scanned
+    once instead of once per rule. prefixes holds the rules that apply only at the start
+    of the name. The most recent memo_size results are memoized, so names seen again
+    cost one lookup.
+    """
+
+    def __init__(self, replacements: Dict[str, str], prefixes: Optional[Dict[str, str]] = None,
+                 memo_size: int = 4096):
+        self.replacements = dict(replacements)
+        self.prefixes = dict(prefixes or {})
+        alternatives = [re.escape(old) for old in sorted(self.replacements, key=len, reverse=True)]
+        if self.prefixes:
+            alternatives.insert(0, '^(?:' + '|'.join(re.escape(old) for old in sorted(self.prefixes, key=len, reverse=True)) + ')')
+        self._pattern = re.compile('|'.join(alternatives)) if alternatives else None
+        # Bounded, so a long-running process does not keep every name it ever formatted
+        self._memo = lru_cache(maxsize=memo_size)(self.normalize_uncached)
+
+    def _replace(self, match) -> str:
+        old = match.group()
+        if match.start() == 0 and old in self.prefixes:
+            return self.prefixes[old]
+        return self.replacements[old]
+
+    def normalize(self, name: str) -> str:
+        return self._memo(name)
+
+    def normalize_uncached(self, name: str) -> str:
+        s = _PARENTHESIZED.sub('', name).strip().upper()
+        s = _PUNCTUATION.sub('', s)
+        s = _SUFFIX.sub('', s)
+        s = s.translate(_STRIP)
+        if self._pattern is not None:
+            s = self._pattern.sub(self._replace, s)
+        return s
+
+    def clear_memo(self):
+        self._memo.cache_clear()
+
+    __call__ = normalize
+
+
+# Canonical names: Player.name and the name index in SleeperAPI
+PLAYER_NAMES = NameNormalizer(
+    replacements={
+        "MITCHELL T": "MITCH T",
+        "ROBBY ANDERSON": "ROBBIE ANDERSON",
+        "WILLIAM ": "WILL ",
+        "OLABISI": "BISI",
+        "ELI MITCHELL": "ELIJAH MITCHELL",
+        "CADILLAC WILLIAMS": "CARNELL WILLIAMS",
+        "GABE DAVIS": "GABRIEL DAVIS",
+        "JEFFERY ": "JEFF ",
+        "JOSHUA ": "JOSH ",
+        "CHAUNCEY GARDNER": "CJ GARDNER",
+        "BENNETT SKOWRONEK": "BEN SKOWRONEK",
+        "NATHANIEL DELL": "TANK DELL",
+    },
+    prefixes={
+        "MICHAEL ": "MIKE ",
+        "KENNETH ": "KEN ",
+    },
+)
+
+# Short first names used by SleeperAPI.format_player_name when printing rosters
+SHORT_NAMES = NameNormalizer(
+    replacements={f"{old} ": f"{new} " for old, new in {
+        "MITCHELL": "MITCH",
+        "WILLIAM": "WILL",
+        "BENJAMIN": "BEN",
+        "MICHAEL": "MIKE",
+        "JOSHUA": "JOSH",
+        "ROBERT": "ROB",
+        "CHRISTOPHER": "CHRIS",
+        "KENNETH": "KEN",
+        "JEFFREY": "JEFF",
+        "GABRIEL": "GABE",
+        "NATHANIEL": "NATE",
+    }.items()},
+)
@@ -0,0 +1,165 @@
+import mmap
+import os
+import struct
+import tempfile
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from models import Player
+
+MAGIC = b"SLPRDB01"
+# magic, record count, offset of the symbol table, offset of the name strings
+HEADER = struct.Struct("<8sIII")
+KEY_WIDTH = 8
+# player_id (NUL padded), name offset, name length, position symbol, team symbol
+RECORD = struct.Struct(f"<{KEY_WIDTH}sIHHH")
+
+
+class PlayerRecord(NamedTuple):
+    name: str
+    position: Optional[str]
+    team: Optional[str]
+
+
+def build_player_db(players: Dict[str, "Player"], path: str = "players.bin"):
+    """
+    Write the names, positions and teams of a players table to a compact binary file.
+
+    Layout: a header, one fixed-width record per player sorted by player_id (the sorted
+    keys are the index, searched with bisection), a symbol table of the distinct
+    positions and teams, and the UTF-8 names packed back to back. The file is written
+    next to path and renamed into place, so processes that have the old file mapped
+    keep reading a consistent copy.
+
+    Args:
+        players (Dict[str, Player]): Players keyed by player ID
+        path (str): Output file
+    """
+    symbols: List[Optional[str]] = [None]
+    symbol_ids: Dict[Optional[str], int] = {None: 0}
+    names = bytearray()
+    rows: List[Tuple[bytes, int, int, int, int]] = []
+
+    for player_id, player in players.items():
+        key = player_id.encode()
+        if len(key) > KEY_WIDTH:
+            raise ValueError(f"Player ID {player_id!r} is longer than {KEY_WIDTH} bytes")
+        name = (player.name or "").encode()
+        symbol_refs = []
+        for value in (player.position, player.team):
+            if value not in symbol_ids:
+                symbol_ids[value] = len(symbols)
+                symbols.append(value)
+            symbol_refs.append(symbol_ids[value])
+        rows.append((key, len(names), len(name), *symbol_refs))
+        names += name
+    rows.sort()
+
+    symbol_table = bytearray(struct.pack("<H", len(symbols) - 1))
+    for symbol in symbols[1:]:
+        encoded = symbol.encode()
+        symbol_table += struct.pack("<B", len(encoded)) + encoded
+
+    symbols_offset = HEADER.size + RECORD.size * len(rows)
+    strings_offset = symbols_offset + len(symbol_table)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, len(rows), symbols_offset, strings_offset))
+            for row in rows:
+                f.write(RECORD.pack(*row))
+            f.write(symbol_table)
+            f.write(names)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class PlayerDB:
+    """
+    Read-only, memory-mapped view of a file written by build_player_db.
+
+    Opening the file only reads the header and the symbol table; a lookup bisects the
+    sorted records and decodes the one record it lands on, which is then memoized for
+    repeat lookups from analytics loops. The pages are shared through the OS page cache,
+    so every process that opens the same file reuses one copy.
+    """
+
+    def __init__(self, path: str = "players.bin"):
+        self.path = path
+        self._records: Dict[str, Optional[PlayerRecord]] = {}
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, symbols_offset, self._strings_offset = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a player database")
+
+        symbol_count, = struct.unpack_from("<H", self._mm, symbols_offset)
+        self._symbols: List[Optional[str]] = [None]
+        offset = symbols_offset + 2
+        for _ in range(symbol_count):
+            length = self._mm[offset]
+            self._symbols.append(self._mm[offset + 1:offset + 1 + length].decode())
+            offset += 1 + length
+
+    @staticmethod
+    def is_current(path: str = "players.bin", source: str = "players.json") -> bool:
+        """True if path exists and was written no earlier than the players file it was built from."""
+        if not os.path.exists(path):
+            return False
+        return not os.path.exists(source) or os.path.getmtime(path) >= os.path.getmtime(source)
+
+    def _find(self, player_id: str) -> Optional[int]:
+        key = player_id.encode().ljust(KEY_WIDTH, b"\0")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = HEADER.size + mid * RECORD.size
+            probe = self._mm[offset:offset + KEY_WIDTH]
+            if probe < key:
+                lo = mid + 1
+            elif probe > key:
+                hi = mid
+            else:
+                return offset
+        return None
+
+    def get(self, player_id: str) -> Optional[PlayerRecord]:
+        """Return the name, position and team of a player, or None if the ID is unknown."""
+        try:
+            return self._records[player_id]
+        except KeyError:
+            pass
+        record = None
+        offset = self._find(player_id)
+        if offset is not None:
+            _, name_offset, name_length, position, team = RECORD.unpack_from(self._mm, offset)
+            start = self._strings_offset + name_offset
+            record = PlayerRecord(self._mm[start:start + name_length].decode(),
+                                  self._symbols[position], self._symbols[team])
+        self._records[player_id] = record
+        return record
+
+    def __contains__(self, player_id: object) -> bool:
+        return isinstance(player_id, str) and self._find(player_id) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self):
+        self._mm.close()
+
+
+if __name__ == "__main__":
+    import sys
+    from client import SleeperAPI
+
+    source = sys.argv[1] if len(sys.argv) > 1 else "players.json"
+    target = sys.argv[2] if len(sys.argv) > 2 else "players.bin"
+    players = SleeperAPI().load_players_from_file(source)
+    build_player_db(players, target)
+    print(f"Wrote {len(players)} players to {target}")
@@ -0,0 +1,82 @@
+from typing import Any, Dict, List, Mapping, Sequence
+
+from models import Matchup
+from standings import STANDINGS_FIELDS, standings_key
+
+
+def scoring_delta(scoring_settings: Mapping[str, float], alternate: Mapping[str, float]) -> Dict[str, float]:
+    """
+    Points per unit of each stat that alternate settings add to (or take from) scoring_settings.
+
+    Scoring is linear in the settings, so a player's points under alternate are their
+    points under scoring_settings plus their stat line scored with this delta.
+    """
+    delta = {}
+    for stat in set(scoring_settings) | set(alternate):
+        change = alternate.get(stat, 0) - scoring_settings.get(stat, 0)
+        if change:
+            delta[stat] = change
+    return delta
+
+
+def rescore_matchups(matchups: Sequence[Any], point_changes: Mapping[str, float]) -> List[Matchup]:
+    """
+    Copies of a week's matchups with each player's points moved by point_changes.
+
+    Team points move by the changes of the starters, so anything else in the original
+    total (such as custom points) is kept.
+
+    Args:
+        matchups (Sequence[Matchup]): The week's matchups
+        point_changes (Mapping[str, float]): Points to add per player ID; other players are unchanged
+    """
+    rescored = []
+    for matchup in matchups:
+        players_points = {player_id: points + point_changes.get(player_id, 0.0)
+                          for player_id, points in matchup.players_points.items()}
+        # Empty starting slots are listed as "0"
+        starters = {player_id for player_id in matchup.starters if player_id != "0"}
+        rescored.append(Matchup(
+            roster_id=matchup.roster_id,
+            points=(matchup.points or 0.0) + sum(point_changes.get(player_id, 0.0) for player_id in starters),
+            matchup_id=matchup.matchup_id,
+            players=list(matchup.players or []),
+            starters=list(matchup.starters),
+            # Same order as SleeperAPI._parse_matchups: starters as they appear in players_points
+            starters_points=[points for player_id, points in players_points.items() if player_id in starters],
+            players_points=players_points,
+            custom_points=matchup.custom_points,
+        ))
+    return rescored
+
+
+def standings_diff(actual: Mapping[int, Dict[str, float]], whatif: Mapping[int, Dict[str, float]],
+                   team_names: Mapping[int, str]) -> List[Dict[str, Any]]:
+    """
+    Compare two sets of season totals (StandingsAccumulator.totals) roster by roster.
+
+    Returns:
+        List[Dict[str, Any]]: One entry per roster in what-if standings order, with its
+        'rank' and 'whatif_rank', the 'actual' and 'whatif' STANDINGS_FIELDS totals and
+        the 'change' of each field
+    """
+    empty = dict.fromkeys(STANDINGS_FIELDS, 0)
+    roster_ids = set(actual) | set(whatif)
+    actual_order = sorted(roster_ids, key=lambda roster_id: standings_key(actual.get(roster_id, empty)), reverse=True)
+    whatif_order = sorted(roster_ids, key=lambda roster_id: standings_key(whatif.get(roster_id, empty)), reverse=True)
+    actual_ranks = {roster_id: rank for rank, roster_id in enumerate(actual_order, 1)}
+
+    teams = []
+    for rank, roster_id in enumerate(whatif_order, 1):
+        before = actual.get(roster_id, empty)
+        after = whatif.get(roster_id, empty)
+        teams.append({
+            'team_name': team_names.get(roster_id, f"Team {roster_id}"),
+            'roster_id': roster_id,
+            'rank': actual_ranks[roster_id],
+            'whatif_rank': rank,
+            'actual': dict(before),
+            'whatif': dict(after),
+            'change': {field: after[field] - before[field] for field in STANDINGS_FIELDS},
+        })
+    return teams
@@ -0,0 +1,109 @@
+import csv
+import glob
+import json
+import os
+from bisect import bisect_left
+from datetime import date, datetime
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from cache_store import atomic_write_json
+
+SCHEDULE_GLOB = "* Game Dates.csv"
+CALENDAR_PATH = "schedule_calendar.json"
+
+
+class ScheduleWeek(NamedTuple):
+    season: int
+    week: int
+    is_playoff: bool
+    start: date
+    end: date
+
+
+class ScheduleCalendar:
+    """
+    NFL weeks of one or more seasons, with date lookups by bisection.
+
+    The weeks are sorted by their last game day. A week runs from the day after the
+    previous week's last game to its own last game. The first week of each season starts
+    on its first game day. A date between seasons belongs to the next season's first
+    week, and a date after the last known game belongs to the last week.
+
+    load() reads the '<season> Game Dates.csv' schedules (Year, WeekNum, IsPlayoff,
+    ScheduleDate) once. It saves the week boundaries to schedule_calendar.json as day
+    ordinals, so later runs skip the CSV parsing until a schedule file changes.
+    """
+
+    def __init__(self, weeks: Sequence[ScheduleWeek]):
+        self.weeks: List[ScheduleWeek] = sorted(weeks, key=lambda w: w.end)
+        self._ends = [week.end.toordinal() for week in self.weeks]
+
+    @classmethod
+    def from_csv(cls, paths: Sequence[str]) -> 'ScheduleCalendar':
+        # (season, week) -> [is_playoff, first game day, last game day]
+        games: Dict[tuple, list] = {}
+        for path in paths:
+            with open(path, 'r') as csvfile:
+                for row in csv.DictReader(csvfile):
+                    key = (int(row['Year']), int(row['WeekNum']))
+                    day = datetime.strptime(row['ScheduleDate'], '%Y-%m-%d %H:%M:%S').date()
+                    bounds = games.get(key)
+                    if bounds is None:
+                        games[key] = [row.get('IsPlayoff') == '1', day, day]
+                    else:
+                        bounds[1] = min(bounds[1], day)
+                        bounds[2] = max(bounds[2], day)
+
+        weeks = []
+        previous = None
+        for (season, week), (is_playoff, first_game, last_game) in sorted(games.items()):
+            start = first_game
+            if previous is not None and previous[0] == season:
+                start = date.fromordinal(previous[1].toordinal() + 1)
+            weeks.append(ScheduleWeek(season, week, is_playoff, start, last_game))
+            previous = (season, last_game)
+        return cls(weeks)
+
+    @classmethod
+    def load(cls, paths: Optional[Sequence[str]] = None, calendar_path: str = CALENDAR_PATH) -> 'ScheduleCalendar':
+        """
+        Args:
+            paths (Sequence[str]): Schedule CSVs; defaults to every '* Game Dates.csv' in the working directory
+            calendar_path (str): Where the precomputed weeks are kept
+        """
+        paths = sorted(paths if paths is not None else glob.glob(SCHEDULE_GLOB))
+        sources = {path: os.path.getmtime(path) for path in paths}
+        if os.path.exists(calendar_path):
+            with open(calendar_path, 'r') as f:
+                stored = json.load(f)
+            if stored.get('sources') == sources:
+                return cls([ScheduleWeek(season, week, bool(is_playoff), date.fromordinal(start), date.fromordinal(end))
+                            for season, week, is_playoff, start, end in stored['weeks']])
+
+        calendar = cls.from_csv(paths)
+        atomic_write_json(calendar_path, {
+            'sources': sources,
+            'weeks': [[w.season, w.week, int(w.is_playoff), w.start.toordinal(), w.end.toordinal()]
+                      for w in calendar.weeks],
+        })
+        return calendar
+
+    def __len__(self) -> int:
+        return len(self.weeks)
+
+    def lookup(self, day: date) -> ScheduleWeek:
+        """The week day falls in; see the class docstring for dates outside the schedule."""
+        if not self.weeks:
+            raise ValueError("The schedule calendar has no weeks")
+        index = bisect_left(self._ends, day.toordinal())
+        return self.weeks[min(index, len(self.weeks) - 1)]
+
+    def today(self) -> ScheduleWeek:
+        return self.lookup(datetime.now().date())
+
+    def is_past_end(self, day: date) -> bool:
+        return bool(self.weeks) and day.toordinal() > self._ends[-1]
+
+    def week_ranges(self, season: int) -> Dict[int, List[date]]:
+        """[start, end] per week of one season."""
+        return {w.week: [w.start, w.end] for w in self.weeks if w.season == season}
@@ -0,0 +1,225 @@
+import re
+from typing import Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Sleeper's yardage/volume bonus keys, e.g. bonus_rec_yd_100 or bonus_pass_cmp_25
+_THRESHOLD_KEY = re.compile(r"^bonus_(?P<stat>[a-z_]+?)_(?P<threshold>\d+)$")
+# Per-position premiums on a stat, e.g. bonus_rec_te
+_POSITION_KEY = re.compile(r"^bonus_(?P<stat>[a-z_]+?)_(?P<position>qb|rb|wr|te|k)$")
+
+
+class ThresholdBonus(NamedTuple):
+    stat: str
+    threshold: float
+    points: float
+
+
+class StatMatrix:
+    """
+    Raw stat lines as a players x stat keys float matrix.
+
+    Rows are stat lines (one player in one week), labelled by player_ids, weeks and, when
+    a position lookup was given, positions. Columns are stat_keys. Stats a line lacks are 0.
+    """
+
+    def __init__(self, values: np.ndarray, stat_keys: List[str], player_ids: List[str],
+                 weeks: np.ndarray, positions: Optional[List[Optional[str]]] = None):
+        self.values = values
+        self.stat_keys = stat_keys
+        self.columns = {stat: column for column, stat in enumerate(stat_keys)}
+        self.player_ids = player_ids
+        self.weeks = weeks
+        self.positions = positions
+
+    @classmethod
+    def from_weeks(cls, raw_by_week: Mapping[int, Mapping[str, Mapping[str, float]]],
+                   stat_keys: Optional[Iterable[str]] = None,
+                   position_of: Optional[Callable[[str], str]] = None) -> 'StatMatrix':
+        """
+        Args:
+            raw_by_week (Mapping[int, Mapping[str, Mapping[str, float]]]): Stat lines keyed by week, then
+                player ID, as returned by SleeperAPI.get_raw_stats
+            stat_keys (Iterable[str]): Columns to keep; defaults to every stat that appears. Passing the
+                keys a set of profiles scores skips the rest
+            position_of (Callable[[str], str]): Position lookup, needed for per-position overrides
+        """
+        lines: List[Mapping[str, float]] = []
+        player_ids: List[str] = []
+        weeks: List[int] = []
+        for week, raw_stats in raw_by_week.items():
+            for player_id, line in raw_stats.items():
+                lines.append(line)
+                player_ids.append(player_id)
+                weeks.append(week)
+
+        # One pass over the lines collecting (row, column, value) triples, then a single scatter;
+        # without stat_keys, columns are added in order of first appearance
+        fixed = stat_keys is not None
+        columns: Dict[str, int] = {stat: column for column, stat in enumerate(stat_keys)} if fixed else {}
+        rows: List[int] = []
+        cols: List[int] = []
+        cells: List[float] = []
+        for row, line in enumerate(lines):
+            for stat, value in line.items():
+                if value:
+                    column = columns.get(stat)
+                    if column is None:
+                        if fixed:
+                            continue
+                        column = columns[stat] = len(columns)
+                    rows.append(row)
+                    cols.append(column)
+                    cells.append(value)
+        values = np.zeros((len(lines), len(columns)))
+        values[rows, cols] = cells
+        stat_keys = list(columns)
+
+        positions = None
+        if position_of is not None:
+            known: Dict[str, Optional[str]] = {}
+            positions = [known[player_id] if player_id in known else known.setdefault(player_id, position_of(player_id))
+                         for player_id in player_ids]
+        return cls(values, stat_keys, player_ids, np.array(weeks, dtype=np.int16), positions)
+
+    @classmethod
+    def from_raw(cls, raw_stats: Mapping[str, Mapping[str, float]], stat_keys: Optional[Iterable[str]] = None,
+                 position_of: Optional[Callable[[str], str]] = None, week: int = 0) -> 'StatMatrix':
+        """One week of stat lines; see from_weeks."""
+        return cls.from_weeks({week: raw_stats}, stat_keys, position_of)
+
+    def __len__(self) -> int:
+        return len(self.player_ids)
+
+    def column(self, stat: str) -> np.ndarray:
+        index = self.columns.get(stat)
+        return self.values[:, index] if index is not None else np.zeros(len(self))
+
+
+class ScoringProfile:
+    """
+    A scoring_settings dict compiled for StatMatrix scoring.
+
+    The linear part, points per unit of each stat, becomes a weight vector aligned with a
+    matrix's columns. On top of that a profile can carry:
+
+      position_overrides: extra points per unit of a stat for one position only, such as a
+        tight end premium {'TE': {'rec': 0.5}}
+      bonuses: ThresholdBonus rules, a flat award once a stat reaches a threshold in a week
+
+    By default the settings are applied linearly, exactly like summing stat x weight per
+    stat line, which is how get_stats has always scored. With derive_bonuses=True,
+    settings keys such as bonus_rec_yd_100 or bonus_rec_te become threshold bonuses and
+    position overrides when the stat lines do not already carry those keys.
+    """
+
+    def __init__(self, scoring_settings: Mapping[str, float],
+                 position_overrides: Optional[Mapping[str, Mapping[str, float]]] = None,
+                 bonuses: Sequence[ThresholdBonus] = (), derive_bonuses: bool = False):
+        self.scoring_settings = dict(scoring_settings)
+        self.position_overrides = {position: dict(weights) for position, weights in (position_overrides or {}).items()}
+        self.bonuses = list(bonuses)
+        self.derive_bonuses = derive_bonuses
+
+    @property
+    def stat_keys(self) -> List[str]:
+        """Every stat this profile can score, including the base stats of derived bonuses."""
+        keys = set(self.scoring_settings)
+        for weights in self.position_overrides.values():
+            keys.update(weights)
+        keys.update(bonus.stat for bonus in self.bonuses)
+        if self.derive_bonuses:
+            for key in self.scoring_settings:
+                match = _THRESHOLD_KEY.match(key) or _POSITION_KEY.match(key)
+                if match:
+                    keys.add(match.group('stat'))
+        return sorted(keys)
+
+    def compile(self, matrix: StatMatrix) -> Tuple[np.ndarray, Dict[str, np.ndarray], List[ThresholdBonus]]:
+        """Weight vector, per-position extra weight vectors and threshold bonuses for matrix's columns."""
+        columns = matrix.columns
+        weights = np.zeros(len(columns))
+        overrides = {position: dict(extra) for position, extra in self.position_overrides.items()}
+        bonuses = list(self.bonuses)
+        for key, points in self.scoring_settings.items():
+            column = columns.get(key)
+            # Derive a bonus only when no stat line reports the bonus key itself
+            if self.derive_bonuses and (column is None or not matrix.values[:, column].any()):
+                threshold = _THRESHOLD_KEY.match(key)
+                if threshold:
+                    bonuses.append(ThresholdBonus(threshold.group('stat'), float(threshold.group('threshold')), points))
+                    continue
+                position = _POSITION_KEY.match(key)
+                if position:
+                    extra = overrides.setdefault(position.group('position').upper(), {})
+                    extra[position.group('stat')] = extra.get(position.group('stat'), 0.0) + points
+                    continue
+            if column is not None:
+                weights[column] = points
+
+        position_weights = {}
+        for position, extra in overrides.items():
+            vector = np.zeros(len(columns))
+            for stat, points in extra.items():
+                if stat in columns:
+                    vector[columns[stat]] = points
+            position_weights[position] = vector
+        return weights, position_weights, bonuses
+
+
+def score_matrix(matrix: StatMatrix, profiles: Sequence[ScoringProfile]) -> np.ndarray:
+    """
+    Fantasy points of every row of matrix under every profile.
+
+    The linear part of all profiles is one matrix product, values (rows x stats) times the
+    stacked weight vectors (stats x profiles). Position overrides and threshold bonuses
+    are added as masked corrections.
+
+    Returns:
+        np.ndarray: rows x profiles
+    """
+    compiled = [profile.compile(matrix) for profile in profiles]
+    if not compiled:
+        return np.zeros((len(matrix), 0))
+    points = matrix.values @ np.column_stack([weights for weights, _, _ in compiled])
+
+    position_rows: Dict[str, np.ndarray] = {}
+    for index, (_, position_weights, bonuses) in enumerate(compiled):
+        for position, extra in position_weights.items():
+            if matrix.positions is None:
+                raise ValueError("Per-position overrides need a StatMatrix built with position_of")
+            rows = position_rows.get(position)
+            if rows is None:
+                rows = position_rows[position] = np.array([p == position for p in matrix.positions], dtype=bool)
+            points[rows, index] += matrix.values[rows] @ extra
+        for bonus in bonuses:
+            points[:, index] += np.where(matrix.column(bonus.stat) >= bonus.threshold, bonus.points, 0.0)
+    return points
+
+
+def score_weeks(raw_by_week: Mapping[int, Mapping[str, Mapping[str, float]]],
+                profiles: Mapping[str, ScoringProfile],
+                position_of: Optional[Callable[[str], str]] = None) -> Dict[str, Dict[int, Dict[str, float]]]:
+    """
+    Score many weeks under many profiles in one pass.
+
+    Args:
+        raw_by_week (Mapping[int, Mapping[str, Mapping[str, float]]]): Stat lines keyed by week, then player ID
+        profiles (Mapping[str, ScoringProfile]): Profiles by name, e.g. league ID or 'half_ppr'
+        position_of (Callable[[str], str]): Position lookup, required if any profile has position overrides
+
+    Returns:
+        Dict[str, Dict[int, Dict[str, float]]]: Points keyed by profile name, then week, then player ID
+    """
+    names = list(profiles)
+    stat_keys = sorted({stat for profile in profiles.values() for stat in profile.stat_keys})
+    matrix = StatMatrix.from_weeks(raw_by_week, stat_keys, position_of)
+    points = score_matrix(matrix, [profiles[name] for name in names])
+
+    results: Dict[str, Dict[int, Dict[str, float]]] = {name: {} for name in names}
+    weeks = matrix.weeks.tolist()
+    for index, name in enumerate(names):
+        by_week = results[name]
+        for week, player_id, value in zip(weeks, matrix.player_ids, points[:, index].tolist()):
+            by_week.setdefault(week, {})[player_id] = value
+    return results
@@ -0,0 +1,115 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Per-roster counters that a week adds to the season standings
+STANDINGS_FIELDS = ('wins', 'losses', 'ties', 'half_wins', 'points_for', 'points_against',
+                    'best_ball_points', 'offensive_best_ball_points')
+
+OFFENSIVE_SLOTS = frozenset(["QB", "RB", "WR", "TE", "FLEX", "SUPER_FLEX", "REC_FLEX", "WRRB_FLEX"])
+
+
+def standings_key(totals: Dict[str, float]) -> Tuple[float, float]:
+    """Sort key for a roster's totals, highest first: wins plus half wins, then points for."""
+    return totals['wins'] + totals['half_wins'], totals['points_for']
+
+
+def opponents(matchups: Sequence[Any]) -> Dict[int, Any]:
+    """Each roster_id's opponent in a week, paired by matchup_id; None for a roster without one."""
+    pairings: Dict[Any, List[Any]] = {}
+    for matchup in matchups:
+        pairings.setdefault(matchup.matchup_id, []).append(matchup)
+    return {matchup.roster_id: next((m for m in pairings[matchup.matchup_id] if m.roster_id != matchup.roster_id), None)
+            for matchup in matchups}
+
+
+def week_standings(matchups: Sequence[Any],
+                   lineups: Dict[int, Tuple[float, List[Dict[str, Any]]]]) -> Dict[int, Dict[str, float]]:
+    """
+    What one week adds to each roster's standings.
+
+    Args:
+        matchups (Sequence[Matchup]): The week's matchups
+        lineups (Dict[int, Tuple[float, List[Dict[str, Any]]]]): Best-ball (points, lineup) per roster_id
+
+    Returns:
+        Dict[int, Dict[str, float]]: STANDINGS_FIELDS per roster_id
+    """
+    teams = {matchup.roster_id: dict.fromkeys(STANDINGS_FIELDS, 0) for matchup in matchups}
+
+    # Top half of the week by best-ball points earns half a win
+    ranked = sorted(matchups, key=lambda m: lineups[m.roster_id][0], reverse=True)
+    for matchup in ranked[:len(ranked) // 2]:
+        teams[matchup.roster_id]['half_wins'] += 0.5
+
+    for matchup in matchups:
+        best_ball_points, lineup = lineups[matchup.roster_id]
+        team = teams[matchup.roster_id]
+        team['best_ball_points'] += best_ball_points
+        team['offensive_best_ball_points'] += sum(slot['player']['points'] for slot in lineup
+                                                  if slot['position'] in OFFENSIVE_SLOTS)
+        team['points_for'] += matchup.points
+
+    paired = opponents(matchups)
+    for matchup in matchups:
+        opponent = paired[matchup.roster_id]
+        if opponent:
+            team = teams[matchup.roster_id]
+            team['points_against'] += opponent.points
+            if matchup.points > opponent.points:
+                team['wins'] += 1
+            elif matchup.points < opponent.points:
+                team['losses'] += 1
+            else:
+                team['ties'] += 1
+    return teams
+
+
+class StandingsAccumulator:
+    """
+    Season standings of one league, built up one week at a time.
+
+    Each folded week keeps the digest of the matchups it was computed from and its
+    per-roster contribution. When a week's matchups change, for example after a stat
+    correction, fold() subtracts the old contribution and adds the new one. The other
+    weeks are left as they are.
+    """
+
+    def __init__(self, roster_positions: Optional[List[str]] = None):
+        self.roster_positions = roster_positions
+        # week -> {'digest': str, 'teams': {roster_id: {field: value}}}
+        self.weeks: Dict[int, Dict[str, Any]] = {}
+        self.totals: Dict[int, Dict[str, float]] = {}
+
+    @property
+    def last_week(self) -> int:
+        """The highest folded week, or 0."""
+        return max(self.weeks, default=0)
+
+    def is_current(self, week: int, digest: str) -> bool:
+        folded = self.weeks.get(week)
+        return folded is not None and folded['digest'] == digest
+
+    def _apply(self, teams: Dict[int, Dict[str, float]], sign: int):
+        for roster_id, contribution in teams.items():
+            total = self.totals.setdefault(roster_id, dict.fromkeys(STANDINGS_FIELDS, 0))
+            for name, value in contribution.items():
+                total[name] += sign * value
+
+    def fold(self, week: int, digest: str, teams: Dict[int, Dict[str, float]]):
+        """Add a week's contribution, replacing the one already folded for that week."""
+        previous = self.weeks.get(week)
+        if previous is not None:
+            self._apply(previous['teams'], -1)
+        self._apply(teams, 1)
+        self.weeks[week] = {'digest': digest, 'teams': teams}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'roster_positions': self.roster_positions, 'weeks': self.weeks}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StandingsAccumulator':
+        # JSON turns the week and roster_id keys into strings
+        accumulator = cls(data.get('roster_positions'))
+        for week, folded in sorted(data.get('weeks', {}).items(), key=lambda item: int(item[0])):
+            teams = {int(roster_id): contribution for roster_id, contribution in folded['teams'].items()}
+            accumulator.fold(int(week), folded['digest'], teams)
+        return accumulator
@@ -0,0 +1,22 @@
+import asyncio
+
+from async_client import AsyncSleeperAPI
+from cache_store import JsonFileCacheStore
+from client import SleeperAPI
+
+
+def test_async_with_shuts_down_the_worker_threads(tmp_path):
+    client = SleeperAPI(cache_store=JsonFileCacheStore(str(tmp_path)))
+    client.get_current_season_year = lambda: 2024
+    client.matchups_cache["1_1"] = SleeperAPI._parse_matchups([{'roster_id': 1, 'matchup_id': 1, 'points': 90.0}])
+
+    async def main():
+        async with AsyncSleeperAPI(client) as api:
+            # Served from the cache; week 1 is final in week 2
+            return api, await api.get_matchups("1", 1, current_week=2)
+
+    api, matchups = asyncio.run(main())
+
+    assert [matchup.points for matchup in matchups] == [90.0]
+    assert api._executor._shutdown
+    client.close()
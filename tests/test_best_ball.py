@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from best_ball import FLEX_SLOTS, LineupOptimizer
+
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DL", "LB", "DB"]
+SLOTS = POSITIONS + list(FLEX_SLOTS)
+
+
+def accepts(slot, position):
+    return position in FLEX_SLOTS.get(slot, (slot,))
+
+
+def brute_force(roster_positions, players_points, position_of):
+    """Best (starters, points) over every way of seating players in the slots."""
+    best = (0, 0.0)
+
+    def fill(slot_index, remaining, starters, points):
+        nonlocal best
+        if slot_index == len(roster_positions):
+            best = max(best, (starters, round(points, 6)))
+            return
+        slot = roster_positions[slot_index]
+        fill(slot_index + 1, remaining, starters, points)
+        for player_id in remaining:
+            if accepts(slot, position_of(player_id)):
+                fill(slot_index + 1, remaining - {player_id}, starters + 1, points + players_points[player_id])
+
+    fill(0, frozenset(players_points), 0, 0.0)
+    return best
+
+
+def check_lineup(roster_positions, players_points, position_of, lineup):
+    starters = [slot['player']['id'] for slot in lineup]
+    assert len(starters) == len(set(starters))
+    for slot in lineup:
+        assert accepts(slot['position'], position_of(slot['player']['id']))
+        assert slot['player']['points'] == players_points[slot['player']['id']]
+    # Slots are listed in roster_positions order
+    slots = iter(roster_positions)
+    assert all(slot['position'] in slots for slot in lineup)
+
+
+def test_matches_brute_force_on_random_layouts():
+    rng = random.Random(20240917)
+    for _ in range(400):
+        roster_positions = [rng.choice(SLOTS) for _ in range(rng.randint(1, 5))] + ["BN"]
+        positions = {f"p{i}": rng.choice(POSITIONS) for i in range(rng.randint(0, 7))}
+        players_points = {player_id: round(rng.uniform(-5, 30), 1) for player_id in positions}
+
+        total, lineup = LineupOptimizer(roster_positions, POSITIONS).optimize(players_points, positions.get)
+
+        check_lineup(roster_positions, players_points, positions.get, lineup)
+        assert (len(lineup), round(total, 6)) == brute_force(roster_positions, players_points, positions.get)
+
+
+def test_fills_every_slot_even_with_negative_points():
+    roster_positions = ["QB", "RB", "FLEX", "K"]
+    positions = {"qb": "QB", "rb1": "RB", "rb2": "RB", "k": "K"}
+    players_points = {"qb": 20.0, "rb1": 8.0, "rb2": -2.0, "k": -1.0}
+
+    total, lineup = LineupOptimizer(roster_positions, POSITIONS).optimize(players_points, positions.get)
+
+    assert [(slot['position'], slot['player']['id']) for slot in lineup] == [
+        ("QB", "qb"), ("RB", "rb1"), ("FLEX", "rb2"), ("K", "k")]
+    assert total == pytest.approx(25.0)
+
+
+def test_overlapping_flex_slots_move_players_to_make_room():
+    roster_positions = ["WRRB_FLEX", "REC_FLEX", "FLEX"]
+    positions = {"wr": "WR", "te": "TE", "rb": "RB"}
+    players_points = {"wr": 30.0, "te": 5.0, "rb": 4.0}
+
+    total, lineup = LineupOptimizer(roster_positions, POSITIONS).optimize(players_points, positions.get)
+
+    assert sorted(slot['player']['id'] for slot in lineup) == ["rb", "te", "wr"]
+    assert total == pytest.approx(39.0)
+    check_lineup(roster_positions, players_points, positions.get, lineup)
@@ -0,0 +1,32 @@
+from cache_policy import FreshnessPolicy, week_is_scored
+from cache_store import JsonFileCacheStore
+from client import SleeperAPI
+
+
+def _week(*points):
+    return SleeperAPI._parse_matchups([{'roster_id': roster_id, 'matchup_id': 1, 'points': value}
+                                       for roster_id, value in enumerate(points, 1)])
+
+
+def test_week_is_scored_in_the_current_season():
+    assert week_is_scored(_week(100.0, 90.0), week=3, current_week=4, season="2024", current_year=2024)
+    assert not week_is_scored(_week(100.0, 0.0), week=3, current_week=4, season="2024", current_year=2024)
+    assert not week_is_scored(_week(100.0, 90.0), week=4, current_week=4)
+
+
+def test_every_week_of_an_earlier_season_is_final():
+    # Week 17 of last season, looked at in week 2 of this one; an unplayed week has zeros
+    assert week_is_scored(_week(100.0, 90.0), week=17, current_week=2, season="2023", current_year=2024)
+    assert week_is_scored(_week(0.0, 0.0), week=18, current_week=2, season="2023", current_year=2024)
+
+
+def test_cached_matchups_of_a_past_season_league_are_served(tmp_path):
+    # A ttl of 0 leaves the final predicate as the only way to be fresh
+    client = SleeperAPI(cache_store=JsonFileCacheStore(str(tmp_path)),
+                        cache_policies={'matchups': FreshnessPolicy(ttl=0, final=week_is_scored)})
+    client.get_current_season_year = lambda: 2024
+    client.matchups_cache["1_17"] = _week(100.0, 90.0)
+
+    assert client._get_cached_matchups("1", 17, current_week=2) is None
+    client.cache["league_1"] = {'league_id': "1", 'season': "2023"}
+    assert client._get_cached_matchups("1", 17, current_week=2) == _week(100.0, 90.0)
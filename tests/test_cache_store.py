@@ -0,0 +1,74 @@
+from cache_store import JsonFileCacheStore, SQLiteCacheStore, migrate_json_to_sqlite
+
+
+def test_migration_copies_tables_outside_the_standard_files(tmp_path):
+    json_store = JsonFileCacheStore(str(tmp_path))
+    json_store.set('api', 'league_1', {'name': 'League'})
+    json_store.set('best_ball', '1_1', {'digest': 'abc'})
+    json_store.set('lineups', '1_1', [1, 2, 3])
+    json_store.close()
+
+    sqlite_store = SQLiteCacheStore(str(tmp_path / "cache.db"))
+    try:
+        copied = migrate_json_to_sqlite(sqlite_store, JsonFileCacheStore(str(tmp_path)))
+        assert copied == {'api': 1, 'best_ball': 1, 'lineups': 1}
+        assert sqlite_store.get('best_ball', '1_1') == {'digest': 'abc'}
+        assert sqlite_store.get('lineups', '1_1') == [1, 2, 3]
+    finally:
+        sqlite_store.close()
+
+
+def test_json_store_returns_plain_data_to_a_second_client(tmp_path):
+    from client import SleeperAPI
+
+    store = JsonFileCacheStore(str(tmp_path))
+    first = SleeperAPI(cache_store=store)
+    matchups = SleeperAPI._parse_matchups([{'roster_id': 1, 'matchup_id': 1, 'points': 10.0, 'starters': ['a'],
+                                            'players_points': {'a': 10.0}}])
+    first.matchups_cache["league_1"] = matchups
+    assert first.matchups_cache["league_1"] is matchups
+
+    assert store.get('matchups', "league_1") == [{'roster_id': 1, 'points': 10.0, 'matchup_id': 1, 'players': [],
+                                                 'starters': ['a'], 'starters_points': [10.0],
+                                                 'players_points': {'a': 10.0}, 'custom_points': None}]
+    second = SleeperAPI(cache_store=store)
+    assert second.matchups_cache["league_1"] == matchups
+    store.close()
+
+
+def test_closed_json_stores_are_not_kept_alive(tmp_path):
+    import gc
+    import weakref
+
+    from cache_store import _open_json_stores
+
+    store = JsonFileCacheStore(str(tmp_path))
+    store.set('api', 'key', {'value': 1})
+    assert store in _open_json_stores
+    store.close()
+    assert store not in _open_json_stores
+    reference = weakref.ref(store)
+    del store
+    gc.collect()
+    assert reference() is None
+
+
+def test_batch_writes_each_dirty_file_once(tmp_path, monkeypatch):
+    import time
+
+    import cache_store
+
+    writes = []
+    write = cache_store.atomic_write_json
+    monkeypatch.setattr(cache_store, 'atomic_write_json', lambda path, data: (writes.append(path), write(path, data)))
+
+    store = JsonFileCacheStore(str(tmp_path), flush_after_writes=5, flush_interval=0.01)
+    with store.batch():
+        with store.batch():
+            for week in range(1, 18):
+                store.set('matchups', f"league_{week}", [week])
+                time.sleep(0.005)
+        assert writes == []
+    assert writes.count(store.path('matchups')) == 1
+    assert JsonFileCacheStore(str(tmp_path)).keys('matchups') == [f"league_{week}" for week in range(1, 18)]
+    store.close()
@@ -0,0 +1,34 @@
+from draft_picks import DraftPickIndex
+
+
+def _pick(season, round, roster_id, previous_owner_id, owner_id):
+    return {'season': season, 'round': round, 'roster_id': roster_id,
+            'previous_owner_id': previous_owner_id, 'owner_id': owner_id}
+
+
+def test_newest_listing_of_a_pick_traded_along_a_chain_wins():
+    # Newest season first, as get_all_traded_picks returns them. Roster 3's 2026 first went
+    # 3 -> 4 last season and 4 -> 5 this season; roster 2's second went to 6 and came back.
+    index = DraftPickIndex([
+        _pick("2026", 1, 3, 4, 5),
+        _pick("2026", 2, 2, 6, 2),
+        _pick("2026", 1, 3, 3, 4),
+        _pick("2026", 2, 2, 2, 6),
+    ])
+
+    assert len(index) == 2
+    assert index.current_owner("2026", 1, 3) == 5
+    assert index.original_owner("2026", 1, 5) == 3
+    # Roster 4 passed the pick on, so its 2026 first is its own again
+    assert index.original_owner("2026", 1, 4) == 4
+    assert index.current_owner(2026, 2, 2) == 2
+    assert [pick['roster_id'] for pick in index.picks_owned_by(2, 2026)] == [2]
+    assert index.picks_owned_by(6) == []
+    assert index.picks_traded_away(3) == [_pick("2026", 1, 3, 4, 5)]
+    assert index.picks_traded_away(2) == []
+
+
+def test_untraded_picks_stay_with_their_roster():
+    index = DraftPickIndex([_pick("2025", 1, 1, 1, 2)])
+    assert index.current_owner("2025", 2, 1) == 1
+    assert index.original_owner("2025", 3, 7) == 7
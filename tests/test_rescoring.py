@@ -0,0 +1,29 @@
+from client import SleeperAPI
+from rescoring import rescore_matchups, scoring_delta
+
+
+def _matchups():
+    # Starters are listed in slot order, players_points in roster order, with an empty slot mid-lineup
+    return SleeperAPI._parse_matchups([
+        {'roster_id': 1, 'matchup_id': 1, 'points': 30.0, 'players': ['a', 'b', 'c', 'd'],
+         'starters': ['c', '0', 'a'], 'players_points': {'a': 10.0, 'b': 5.0, 'c': 20.0, 'd': 1.0}},
+        {'roster_id': 2, 'matchup_id': 1, 'points': 12.0, 'players': ['e', 'f'],
+         'starters': ['f', 'e'], 'players_points': {'e': 4.0, 'f': 8.0}},
+    ])
+
+
+def test_rescored_starter_totals_match_a_direct_recompute():
+    point_changes = {'a': 1.5, 'b': 100.0, 'c': -3.0, 'e': 2.0}
+    for original, rescored in zip(_matchups(), rescore_matchups(_matchups(), point_changes)):
+        expected = {player_id: points + point_changes.get(player_id, 0.0)
+                    for player_id, points in original.players_points.items()}
+        starters = [player_id for player_id in original.starters if player_id != '0']
+        assert rescored.players_points == expected
+        assert sorted(rescored.starters_points) == sorted(expected[player_id] for player_id in starters)
+        assert rescored.points == original.points + sum(point_changes.get(player_id, 0.0) for player_id in starters)
+        assert sum(rescored.starters_points) == sum(expected[player_id] for player_id in starters)
+
+
+def test_scoring_delta_keeps_only_changed_weights():
+    assert scoring_delta({'rec': 1.0, 'pass_td': 4.0}, {'rec': 0.5, 'pass_td': 4.0, 'bonus_rec_te': 0.5}) == \
+        {'rec': -0.5, 'bonus_rec_te': 0.5}
@@ -0,0 +1,51 @@
+from datetime import date
+
+from schedule_calendar import ScheduleCalendar
+
+ROWS = [
+    (2023, 18, 0, "2024-01-07"),
+    (2024, 1, 0, "2024-09-05"), (2024, 1, 0, "2024-09-09"),
+    (2024, 2, 0, "2024-09-12"), (2024, 2, 0, "2024-09-16"),
+    (2024, 3, 1, "2024-09-19"), (2024, 3, 1, "2024-09-23"),
+]
+
+
+def _write_schedule(path):
+    with open(path, 'w') as f:
+        f.write("Year,WeekNum,IsPlayoff,ScheduleDate\n")
+        for year, week, is_playoff, day in ROWS:
+            f.write(f"{year},{week},{is_playoff},{day} 0:00:00\n")
+    return str(path)
+
+
+def test_first_and_last_day_of_each_week(tmp_path):
+    calendar = ScheduleCalendar.from_csv([_write_schedule(tmp_path / "2024 Game Dates.csv")])
+
+    # Week 1 starts on its first game; later weeks start the day after the previous week's last game
+    assert calendar.lookup(date(2024, 9, 5))[:2] == (2024, 1)
+    assert calendar.lookup(date(2024, 9, 9))[:2] == (2024, 1)
+    assert calendar.lookup(date(2024, 9, 10))[:2] == (2024, 2)
+    assert calendar.lookup(date(2024, 9, 16))[:2] == (2024, 2)
+    assert calendar.lookup(date(2024, 9, 17)) == (2024, 3, True, date(2024, 9, 17), date(2024, 9, 23))
+    assert calendar.lookup(date(2024, 9, 23))[:2] == (2024, 3)
+
+
+def test_dates_outside_the_schedule_clamp(tmp_path):
+    calendar = ScheduleCalendar.from_csv([_write_schedule(tmp_path / "2024 Game Dates.csv")])
+
+    assert calendar.lookup(date(2024, 1, 8))[:2] == (2024, 1)
+    assert calendar.lookup(date(2023, 12, 1))[:2] == (2023, 18)
+    assert calendar.lookup(date(2025, 2, 1))[:2] == (2024, 3)
+    assert calendar.is_past_end(date(2024, 9, 24))
+    assert not calendar.is_past_end(date(2024, 9, 23))
+
+
+def test_saved_calendar_round_trips(tmp_path):
+    paths = [_write_schedule(tmp_path / "2024 Game Dates.csv")]
+    calendar_path = str(tmp_path / "schedule_calendar.json")
+
+    built = ScheduleCalendar.load(paths, calendar_path)
+    loaded = ScheduleCalendar.load(paths, calendar_path)
+
+    assert loaded.weeks == built.weeks
+    assert loaded.week_ranges(2024)[2] == [date(2024, 9, 10), date(2024, 9, 16)]
@@ -0,0 +1,45 @@
+import pytest
+
+from cache_store import JsonFileCacheStore
+from client import SleeperAPI
+
+np = pytest.importorskip("numpy")
+from scoring_engine import ScoringProfile, StatMatrix, score_matrix  # noqa: E402
+
+# A running back's week as the stats endpoint reports it, including the bonus keys Sleeper sets
+STAT_LINE = {
+    'gp': 1.0, 'gs': 1.0, 'off_snp': 52.0, 'rush_att': 21.0, 'rush_yd': 118.0, 'rush_td': 1.0, 'rush_fd': 7.0,
+    'rush_40p': 1.0, 'rec_tgt': 5.0, 'rec': 4.0, 'rec_yd': 37.0, 'rec_fd': 2.0, 'fum': 1.0, 'fum_lost': 1.0,
+    'bonus_rush_yd_100': 1.0, 'bonus_rush_rec_yd_100': 1.0, 'pts_std': 17.5, 'pts_half_ppr': 19.5, 'pts_ppr': 21.5,
+}
+# Part of a real league's scoring_settings
+SCORING_SETTINGS = {
+    'rush_yd': 0.2, 'rush_td': 6.0, 'rush_att': 0.0, 'rush_fd': 0.0, 'rush_40p': 0.0, 'rec': 1.0, 'rec_yd': 0.2,
+    'rec_td': 6.0, 'rec_fd': 0.0, 'fum': 0.0, 'fum_lost': -4.0, 'bonus_rush_yd_100': 0.0,
+    'bonus_rush_rec_yd_100': 3.0, 'bonus_rush_rec_yd_200': 6.0, 'pass_yd': 0.1, 'pass_td': 6.0, 'pass_int': -4.0,
+}
+
+
+def _per_stat_points(tmp_path):
+    return SleeperAPI(cache_store=JsonFileCacheStore(str(tmp_path)))._calculate_fantasy_points(STAT_LINE,
+                                                                                              SCORING_SETTINGS)
+
+
+def test_matrix_scores_match_the_per_stat_scorer(tmp_path):
+    expected = _per_stat_points(tmp_path)
+
+    matrix = StatMatrix.from_raw({'4866': STAT_LINE, '0000': {}})
+    points = score_matrix(matrix, [ScoringProfile(SCORING_SETTINGS), ScoringProfile({'pts_ppr': 1.0})])
+
+    assert points.shape == (2, 2)
+    assert points[0, 0] == pytest.approx(expected)
+    assert points[0, 1] == pytest.approx(21.5)
+    assert points[1].tolist() == [0.0, 0.0]
+
+
+def test_profile_columns_only_keep_scored_stats(tmp_path):
+    profile = ScoringProfile(SCORING_SETTINGS)
+    matrix = StatMatrix.from_raw({'4866': STAT_LINE}, profile.stat_keys)
+
+    assert 'off_snp' not in matrix.columns
+    assert score_matrix(matrix, [profile])[0, 0] == pytest.approx(_per_stat_points(tmp_path))
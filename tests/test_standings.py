@@ -0,0 +1,72 @@
+import json
+import random
+
+import pytest
+
+from client import SleeperAPI
+from standings import STANDINGS_FIELDS, StandingsAccumulator, week_standings
+
+
+def _lineup(*slots):
+    return [{'position': slot, 'player': {'id': player_id, 'points': points, 'position': None}}
+            for slot, player_id, points in slots]
+
+
+def test_offensive_best_ball_points_count_every_offensive_flex():
+    matchups = SleeperAPI._parse_matchups([{'roster_id': 1, 'matchup_id': None, 'points': 0.0}])
+    lineup = _lineup(("WR", "a", 10.0), ("REC_FLEX", "b", 6.0), ("WRRB_FLEX", "c", 4.0),
+                     ("K", "d", 9.0), ("IDP_FLEX", "e", 3.0))
+
+    teams = week_standings(matchups, {1: (32.0, lineup)})
+
+    assert teams[1]['offensive_best_ball_points'] == 20.0
+    assert teams[1]['best_ball_points'] == 32.0
+
+
+def _season(rng, weeks, rosters=4):
+    """Random matchups and best-ball lineups for each week of a season."""
+    season = {}
+    for week in range(1, weeks + 1):
+        roster_ids = rng.sample(range(1, rosters + 1), rosters)
+        matchups = SleeperAPI._parse_matchups([
+            {'roster_id': roster_id, 'matchup_id': index // 2 + 1, 'points': round(rng.uniform(60, 140), 1)}
+            for index, roster_id in enumerate(roster_ids)])
+        lineups = {}
+        for roster_id in roster_ids:
+            lineup = _lineup(("QB", f"qb{roster_id}", round(rng.uniform(0, 30), 1)),
+                             ("K", f"k{roster_id}", round(rng.uniform(-2, 15), 1)))
+            lineups[roster_id] = (sum(slot['player']['points'] for slot in lineup), lineup)
+        season[week] = (matchups, lineups)
+    return season
+
+
+def _fold_from_scratch(season):
+    accumulator = StandingsAccumulator()
+    for week, (matchups, lineups) in season.items():
+        accumulator.fold(week, str(week), week_standings(matchups, lineups))
+    return accumulator.totals
+
+
+def test_refolding_a_changed_week_matches_a_fold_from_scratch():
+    rng = random.Random(19)
+    season = _season(rng, weeks=6)
+    accumulator = StandingsAccumulator()
+    for week, (matchups, lineups) in season.items():
+        accumulator.fold(week, str(week), week_standings(matchups, lineups))
+
+    # A stat correction changes week 3 after the season was folded
+    changed = _season(rng, weeks=3)[3]
+    season[3] = changed
+    accumulator.fold(3, "corrected", week_standings(*changed))
+
+    expected = _fold_from_scratch(season)
+    assert accumulator.is_current(3, "corrected")
+    assert accumulator.last_week == 6
+    assert accumulator.totals.keys() == expected.keys()
+    for roster_id, totals in expected.items():
+        for field in STANDINGS_FIELDS:
+            assert accumulator.totals[roster_id][field] == pytest.approx(totals[field])
+
+    restored = StandingsAccumulator.from_dict(json.loads(json.dumps(accumulator.to_dict())))
+    for roster_id, totals in expected.items():
+        assert restored.totals[roster_id] == pytest.approx(totals)
@@ -0,0 +1,126 @@
+import sys
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+OFF = 100
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING"}
+
+
+def write_record(record: Dict[str, Any]):
+    """Default sink: one 'LEVEL event key=value ...' line per record on stderr."""
+    fields = " ".join(f"{key}={value}" for key, value in record.items() if key not in ('level', 'event'))
+    sys.stderr.write(f"{LEVEL_NAMES.get(record['level'], record['level'])} {record['event']} {fields}\n")
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, tracer: 'Tracer', phase: str, level: int, fields: Dict[str, Any]):
+        self.tracer = tracer
+        self.phase = phase
+        self.level = level
+        self.fields = fields
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        seconds = time.perf_counter() - self.started
+        self.tracer.record_span(self.phase, seconds)
+        self.tracer.emit(self.level, "span", phase=self.phase, ms=round(seconds * 1000, 3), **self.fields)
+        return False
+
+
+class Tracer:
+    """
+    Structured, levelled replacement for debug print() calls.
+
+    Records are dicts with 'level', 'event' and the keyword fields, handed to sink
+    (by default one line each on stderr). Anything below level is dropped before a record
+    is built. Call sites that need extra work just to describe an event, such as
+    resolving player names, check enabled() first. A disabled tracer therefore costs one
+    integer comparison per call site.
+
+    span() times a phase of an analytics call (fetch, parse, optimize, aggregate). The
+    duration is emitted as a record and added to the phase totals. The most recent
+    max_spans durations are also kept in spans. When the level is above the span's level,
+    span() returns a shared no-op context manager.
+
+    Usage:
+        client = SleeperAPI(tracer=Tracer(INFO))
+        with client.tracer.span("fetch", call="get_league_standings"):
+            ...
+    """
+
+    def __init__(self, level: int = OFF, sink: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 max_spans: int = 10000):
+        self.level = level
+        self.sink = sink or write_record
+        # (phase, seconds) of the latest finished spans, in completion order; older ones are dropped
+        self.spans: Deque[tuple] = deque(maxlen=max_spans)
+        self._phase_totals: Dict[str, float] = {}
+
+    def enabled(self, level: int) -> bool:
+        return level >= self.level
+
+    def emit(self, level: int, event: str, **fields: Any):
+        if level >= self.level:
+            self.sink(dict(level=level, event=event, **fields))
+
+    def debug(self, event: str, **fields: Any):
+        if DEBUG >= self.level:
+            self.sink(dict(level=DEBUG, event=event, **fields))
+
+    def info(self, event: str, **fields: Any):
+        if INFO >= self.level:
+            self.sink(dict(level=INFO, event=event, **fields))
+
+    def warning(self, event: str, **fields: Any):
+        if WARNING >= self.level:
+            self.sink(dict(level=WARNING, event=event, **fields))
+
+    def span(self, phase: str, level: int = INFO, **fields: Any):
+        if level < self.level:
+            return _NULL_SPAN
+        return _Span(self, phase, level, fields)
+
+    def record_span(self, phase: str, seconds: float):
+        self.spans.append((phase, seconds))
+        self._phase_totals[phase] = self._phase_totals.get(phase, 0.0) + seconds
+
+    def phase_totals(self) -> Dict[str, float]:
+        """Seconds spent in each phase across every span since the tracer was created or reset."""
+        return dict(self._phase_totals)
+
+    def reset(self):
+        self.spans.clear()
+        self._phase_totals.clear()
+
+
+_default_tracer = Tracer()
+
+
+def get_default_tracer() -> Tracer:
+    """Return the process-wide tracer used by clients that were not given one; it is disabled by default."""
+    return _default_tracer
+
+
+def set_default_tracer(tracer: Tracer):
+    """Replace the process-wide tracer, e.g. with Tracer(DEBUG) to see per-player detail."""
+    global _default_tracer
+    _default_tracer = tracer